@@ -0,0 +1,76 @@
+"""
+Measures the time it takes to import the package and create a client, each in a fresh interpreter.
+
+    python benchmarks/import_benchmark.py [number of runs] [budget in ms]
+
+Exits with status 1 if the median time of creating a client exceeds the budget or if pandas, numpy,
+requests, pyarrow, polars or aiohttp are imported before they are used, so it can guard against regressions.
+"""
+
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+_SRC = os.path.abspath(os.path.join(os.path.dirname(__file__), "../src"))
+_HEAVY = ("pandas", "numpy", "requests", "pyarrow", "polars", "aiohttp")
+
+_SCRIPT = """
+import sys, time, json
+start = time.perf_counter()
+import netztransparenz as nt
+imported = time.perf_counter()
+nt.NetztransparenzClient("BENCHMARK_ID", "BENCHMARK_SECRET")
+nt.endpoints
+created = time.perf_counter()
+loaded = [name for name in {heavy!r} if name in sys.modules]
+print(json.dumps([imported - start, created - start, loaded]))
+"""
+
+_EAGER = """
+import time, json
+start = time.perf_counter()
+import pandas, requests
+print(json.dumps(time.perf_counter() - start))
+"""
+
+
+def _run(script: str):
+    result = subprocess.run(
+        [sys.executable, "-c", script],
+        capture_output=True,
+        text=True,
+        check=True,
+        env={**os.environ, "PYTHONPATH": _SRC},
+    )
+    return json.loads(result.stdout)
+
+
+def main(runs: int = 10, budget_ms: float | None = None) -> int:
+    results = [_run(_SCRIPT.format(heavy=_HEAVY)) for _ in range(runs)]
+    import_time = statistics.median(result[0] for result in results) * 1000
+    client_time = statistics.median(result[1] for result in results) * 1000
+    loaded = sorted({name for result in results for name in result[2]})
+    eager_time = statistics.median(_run(_EAGER) for _ in range(runs)) * 1000
+
+    print(f"runs:                     {runs}")
+    print(f"import netztransparenz:   {import_time:.1f} ms")
+    print(f"import and create client: {client_time:.1f} ms")
+    print(f"import pandas, requests:  {eager_time:.1f} ms")
+    print(f"heavy modules imported:   {', '.join(loaded) or 'none'}")
+
+    failed = bool(loaded)
+    if budget_ms is not None and client_time > budget_ms:
+        print(f"creating a client took longer than the budget of {budget_ms:.1f} ms")
+        failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(
+        main(
+            int(sys.argv[1]) if len(sys.argv) > 1 else 10,
+            float(sys.argv[2]) if len(sys.argv) > 2 else None,
+        )
+    )
@@ -0,0 +1,70 @@
+"""
+Measures the time MemoryCache.get and MemoryCache.put take for a dataframe of measured values,
+compared with a deep copy of it.
+
+    python benchmarks/memory_cache_benchmark.py [number of rows] [number of runs]
+
+On pandas 2 it measures with and without copy-on-write, on pandas 3 copy-on-write is always enabled.
+Without copy-on-write get returns read-only results instead of copies, so it should take about as long
+as with copy-on-write and much less than the deep copy.
+"""
+
+import os
+import sys
+import timeit
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
+
+import netztransparenz as nt
+from netztransparenz import memory_cache
+
+
+def _frame(rows: int) -> pd.DataFrame:
+    # the shape of a transformed result: a datetime index and a few float columns
+    index = pd.date_range(
+        "2024-01-01", periods=rows, freq="15min", tz="UTC", name="von"
+    )
+    values = np.random.default_rng(0).random((rows, 4))
+    return pd.DataFrame(
+        values,
+        index=index,
+        columns=["50Hertz (MW)", "Amprion (MW)", "TenneT TSO (MW)", "TransnetBW (MW)"],
+    )
+
+
+def _measure(df: pd.DataFrame, runs: int) -> tuple[float, float, float]:
+    cache = nt.MemoryCache(max_bytes=2**40)
+    put = min(timeit.repeat(lambda: cache.put("key", df), number=1, repeat=runs))
+    get = min(timeit.repeat(lambda: cache.get("key"), number=1, repeat=runs))
+    copy = min(timeit.repeat(df.copy, number=1, repeat=runs))
+    return put * 1000, get * 1000, copy * 1000
+
+
+def main(rows: int = 1_000_000, runs: int = 20) -> int:
+    df = _frame(rows)
+    modes = [True] if int(pd.__version__.split(".")[0]) >= 3 else [True, False]
+    print(f"pandas:                   {pd.__version__}")
+    print(f"rows:                     {rows}")
+    print(f"runs:                     {runs}")
+    for copy_on_write in modes:
+        if int(pd.__version__.split(".")[0]) < 3:
+            pd.set_option("mode.copy_on_write", copy_on_write)
+        assert memory_cache._copy_on_write() == copy_on_write
+        put, get, copy = _measure(df, runs)
+        print(f"copy-on-write {'enabled' if copy_on_write else 'disabled'}:")
+        print(f"  put:                    {put:.3f} ms")
+        print(f"  get:                    {get:.3f} ms")
+        print(f"  deep copy:              {copy:.3f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(
+        main(
+            int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000,
+            int(sys.argv[2]) if len(sys.argv) > 2 else 20,
+        )
+    )
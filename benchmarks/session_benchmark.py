@@ -0,0 +1,91 @@
+"""
+Compares the per-request latency of one-off requests.get calls with the pooled session of the client.
+
+Runs against a local stub server, so no credentials are needed:
+
+    python benchmarks/session_benchmark.py [number of requests]
+
+The stub server speaks plain HTTP, so the measured difference only contains the TCP handshake.
+Against the real API every avoided connection additionally saves a TLS handshake.
+"""
+
+import os
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import requests
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
+
+import netztransparenz as nt
+from netztransparenz import base_client
+
+_BODY = (
+    b"Datum;von;Zeitzone von;bis;Zeitzone bis;50Hertz (MW);Amprion (MW);TenneT TSO (MW);TransnetBW (MW)\n"
+    b"2024-01-01;00:00;UTC;00:15;UTC;0,000;0,000;0,000;0,000\n"
+)
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def _respond(self, body: bytes, content_type: str):
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        self._respond(
+            b'{"access_token": "stub_token", "expires_in": 3600}', "application/json"
+        )
+
+    def do_GET(self):
+        self._respond(_BODY, "text/csv")
+
+    def log_message(self, *args):
+        pass
+
+
+def _measure(function, count: int) -> float:
+    start = time.perf_counter()
+    for _ in range(count):
+        function()
+    return (time.perf_counter() - start) / count
+
+
+def main(count: int = 500):
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StubHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+    url = f"{base_url}/data/hochrechnung/Solar/2024-01-01T00:00:00/2024-01-02T00:00:00"
+
+    base_client._ACCESS_TOKEN_URL = f"{base_url}/token"
+    client = nt.NetztransparenzClient("BENCHMARK_ID", "BENCHMARK_SECRET")
+    client._API_BASE_URL = base_url
+    # log in before measuring
+    client._get_token()
+
+    def one_off():
+        response = requests.get(url, headers={"Authorization": "Bearer stub_token"})
+        response.raise_for_status()
+
+    one_off_latency = _measure(one_off, count)
+    pooled_latency = _measure(lambda: client._get(url), count)
+
+    print(f"requests:          {count}")
+    print(f"requests.get:      {one_off_latency * 1000:.3f} ms/request")
+    print(f"pooled session:    {pooled_latency * 1000:.3f} ms/request")
+    print(f"speedup:           {one_off_latency / pooled_latency:.2f}x")
+
+    client.close()
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 500)
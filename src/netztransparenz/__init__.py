@@ -1,6 +1,66 @@
-from .client import NetztransparenzClient as NetztransparenzClient
-from .vermarktung_client import VermarktungClient as VermarktungClient
-from .hochrechnung_client import HochrechnungClient as HochrechnungClient
-from .dienstleistungen_client import DienstleistungenClient as DienstleistungenClient
-from .nrvsaldo_client import NrvSaldoClient as NrvSaldoClient
-from .constants import endpoints as endpoints
+"""
+Client for the API of the German Netztransparenz portal.
+The public names are imported with their first use, so importing the package does not import pandas or requests.
+"""
+
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .archive import ResponseArchive as ResponseArchive
+    from .async_client import AsyncNetztransparenzClient as AsyncNetztransparenzClient
+    from .chunk_cache import ChunkCache as ChunkCache
+    from .client import NetztransparenzClient as NetztransparenzClient
+    from .constants import endpoints as endpoints
+    from .coverage import CoverageIndex as CoverageIndex
+    from .dienstleistungen_client import (
+        DienstleistungenClient as DienstleistungenClient,
+    )
+    from .hochrechnung_client import HochrechnungClient as HochrechnungClient
+    from .memory_cache import MemoryCache as MemoryCache
+    from .mirror import Mirror as Mirror
+    from .nrvsaldo_client import NrvSaldoClient as NrvSaldoClient
+    from .rate_limit import FileRateLimiter as FileRateLimiter
+    from .rate_limit import RateLimiter as RateLimiter
+    from .retry import RetryPolicy as RetryPolicy
+    from .retry import RetryStatistics as RetryStatistics
+    from .store import ParquetStore as ParquetStore
+    from .token_cache import FileTokenCache as FileTokenCache
+    from .vermarktung_client import VermarktungClient as VermarktungClient
+
+# module each public name is imported from
+_modules = {
+    "NetztransparenzClient": "client",
+    "VermarktungClient": "vermarktung_client",
+    "HochrechnungClient": "hochrechnung_client",
+    "DienstleistungenClient": "dienstleistungen_client",
+    "NrvSaldoClient": "nrvsaldo_client",
+    "endpoints": "constants",
+    "AsyncNetztransparenzClient": "async_client",
+    "FileTokenCache": "token_cache",
+    "RetryPolicy": "retry",
+    "RetryStatistics": "retry",
+    "RateLimiter": "rate_limit",
+    "FileRateLimiter": "rate_limit",
+    "ChunkCache": "chunk_cache",
+    "MemoryCache": "memory_cache",
+    "ParquetStore": "store",
+    "Mirror": "mirror",
+    "ResponseArchive": "archive",
+    "CoverageIndex": "coverage",
+}
+
+__all__ = list(_modules)
+
+
+def __getattr__(name: str):
+    if name not in _modules:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{_modules[name]}", __name__), name)
+    # later accesses find the name directly
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,53 @@
+"""
+Deferred imports of the heavy dependencies, so importing the package does not import pandas, requests or pyarrow.
+"""
+
+import importlib
+import importlib.util
+import sys
+
+
+class _Module:
+    """
+    Stands in for a module that is imported with the first access to one of its attributes.
+    """
+
+    __slots__ = ("_module", "_name", "_submodules")
+
+    def __init__(self, name: str, submodules: tuple[str, ...]):
+        self._name = name
+        self._submodules = submodules
+        self._module = None
+
+    def __getattr__(self, attr: str):
+        # only called for attributes the stand-in does not have itself
+        module = self._module
+        if module is None:
+            module = importlib.import_module(self._name)
+            for submodule in self._submodules:
+                importlib.import_module(f"{self._name}.{submodule}")
+            self._module = module
+        return getattr(module, attr)
+
+    def __repr__(self) -> str:
+        state = "imported" if self._module is not None else "not imported yet"
+        return f"<lazy module {self._name!r} ({state})>"
+
+
+def load(name: str, *submodules: str, optional: bool = False):
+    """
+    Return the module name, which is imported together with submodules when it is first used.
+    Modules that were already imported are returned directly.
+
+        name -- name of a top level module
+        submodules -- names of submodules that are used as attributes, e.g. "csv" for pyarrow.csv
+        optional -- if True, None is returned if the module is not installed (default: False)
+    """
+    if all(
+        module in sys.modules
+        for module in [name] + [f"{name}.{submodule}" for submodule in submodules]
+    ):
+        return sys.modules[name]
+    if optional and importlib.util.find_spec(name) is None:
+        return None
+    return _Module(name, submodules)
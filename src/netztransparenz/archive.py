@@ -0,0 +1,160 @@
+"""
+Archive of the raw API responses, compressed and stored once per content.
+"""
+
+import contextlib
+import datetime as dt
+import gzip
+import hashlib
+import os
+import sqlite3
+import tempfile
+import time
+from pathlib import Path
+
+from netztransparenz.token_cache import _cache_home
+
+
+class ResponseArchive:
+    def __init__(
+        self, directory: str | os.PathLike | None = None, replay: bool = False
+    ):
+        """
+        Creates the archive. The body of every response is stored gzip compressed under its sha256 hash,
+        so identical responses are stored only once. An index (index.sqlite) maps every request to the
+        hash of its response.
+
+            directory -- where the archive is stored (default: ~/.cache/netztransparenz/archive)
+            replay -- if True, clients read archived responses instead of requesting them again,
+                      so data can be parsed again without access to the API. (default: False)
+        """
+        self.directory = (
+            Path(directory) if directory is not None else _cache_home() / "archive"
+        )
+        (self.directory / "blobs").mkdir(parents=True, exist_ok=True)
+        self.replay = replay
+        with self._connect() as connection:
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute(
+                """
+                CREATE TABLE IF NOT EXISTS responses (
+                    url TEXT PRIMARY KEY,
+                    endpoint TEXT NOT NULL,
+                    start TEXT,
+                    end TEXT,
+                    hash TEXT NOT NULL,
+                    fetched REAL NOT NULL
+                )
+                """
+            )
+            connection.execute(
+                "CREATE INDEX IF NOT EXISTS responses_endpoint ON responses (endpoint, start)"
+            )
+
+    @contextlib.contextmanager
+    def _connect(self):
+        # one connection per call, so the archive can be used from several threads
+        connection = sqlite3.connect(self.directory / "index.sqlite", timeout=30)
+        try:
+            with connection:
+                yield connection
+        finally:
+            connection.close()
+
+    def _blob_path(self, digest: str) -> Path:
+        return self.directory / "blobs" / digest[:2] / f"{digest[2:]}.gz"
+
+    def store(
+        self,
+        endpoint: str,
+        dt_begin: dt.datetime | None,
+        dt_end: dt.datetime | None,
+        url: str,
+        body: bytes,
+    ) -> str:
+        """
+        Archive the response body of the request url and return its hash.
+
+            endpoint -- url of the endpoint, e.g. "hochrechnung/Solar"
+            dt_begin, dt_end -- requested timeframe, None if the request had none
+        """
+        digest = hashlib.sha256(body).hexdigest()
+        path = self._blob_path(digest)
+        if not path.exists():
+            path.parent.mkdir(exist_ok=True)
+            fd, temporary_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as file:
+                    file.write(gzip.compress(body))
+                os.replace(temporary_path, path)
+            except BaseException:
+                with contextlib.suppress(OSError):
+                    os.remove(temporary_path)
+                raise
+        with self._connect() as connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    url,
+                    endpoint,
+                    _isoformat(dt_begin),
+                    _isoformat(dt_end),
+                    digest,
+                    time.time(),
+                ),
+            )
+        return digest
+
+    def load(self, url: str) -> bytes | None:
+        """
+        Return the archived response body of the request url, or None if it is not archived.
+        """
+        with self._connect() as connection:
+            row = connection.execute(
+                "SELECT hash FROM responses WHERE url = ?", (url,)
+            ).fetchone()
+        if row is None:
+            return None
+        try:
+            with open(self._blob_path(row[0]), "rb") as file:
+                return gzip.decompress(file.read())
+        except FileNotFoundError:
+            return None
+
+    def entries(
+        self,
+        endpoint: str,
+        dt_begin: dt.datetime | None = None,
+        dt_end: dt.datetime | None = None,
+    ) -> list[tuple[str, dt.datetime | None, dt.datetime | None, str]]:
+        """
+        Return url, start, end and hash of the archived requests of endpoint, ordered by start.
+        With dt_begin and dt_end only requests overlapping that timeframe are returned.
+        """
+        query = "SELECT url, start, end, hash FROM responses WHERE endpoint = ?"
+        parameters = [endpoint.strip("/")]
+        if dt_begin is not None:
+            query += " AND end > ?"
+            parameters.append(_isoformat(dt_begin))
+        if dt_end is not None:
+            query += " AND start < ?"
+            parameters.append(_isoformat(dt_end))
+        with self._connect() as connection:
+            rows = connection.execute(query + " ORDER BY start", parameters).fetchall()
+        return [
+            (url, _fromisoformat(start), _fromisoformat(end), digest)
+            for url, start, end, digest in rows
+        ]
+
+
+def _isoformat(moment: dt.datetime | None) -> str | None:
+    # timeframes are stored as UTC without timezone, so they sort and compare as text
+    if moment is None:
+        return None
+    return moment.replace(tzinfo=None).isoformat()
+
+
+def _fromisoformat(value: str | None) -> dt.datetime | None:
+    if value is None:
+        return None
+    return dt.datetime.fromisoformat(value).replace(tzinfo=dt.UTC)
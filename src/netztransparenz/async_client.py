@@ -0,0 +1,525 @@
+"""
+Asynchronous client for all endpoints of the Netztransparenz API.
+Requires the optional dependency aiohttp (pip install netztransparenz[async]).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import collections
+import contextlib
+import datetime as dt
+import functools
+import logging
+from collections.abc import AsyncIterator, Awaitable, Callable, MutableMapping
+
+from netztransparenz import _lazy, base_client
+from netztransparenz.archive import ResponseArchive
+from netztransparenz.chunk_cache import ChunkCache
+from netztransparenz.client import NetztransparenzClient
+from netztransparenz.memory_cache import MemoryCache
+from netztransparenz.mirror import Mirror
+from netztransparenz.rate_limit import RateLimiter
+from netztransparenz.retry import RetryPolicy
+from netztransparenz.token_cache import FileTokenCache
+
+pd = _lazy.load("pandas")
+aiohttp = _lazy.load("aiohttp", optional=True)
+
+log = logging.getLogger("AsyncNetztransparenzClient")
+
+
+class AsyncNetztransparenzClient(NetztransparenzClient):
+    """
+    Offers the same endpoints as NetztransparenzClient, but every reader is a coroutine:
+
+        async with AsyncNetztransparenzClient(client_id, client_pass) as client:
+            df = await client.hochrechnung_solar(start, end)
+
+    Long timeframes are split like in the synchronous client and all chunks are requested concurrently.
+    Parsing and disk I/O like the chunk cache, the token cache and a FileRateLimiter run in the default
+    executor of the event loop, so they do not block other tasks.
+    """
+
+    def __init__(
+        self,
+        client_id,
+        client_pass,
+        strict: bool = True,
+        max_query_distance: dt.timedelta = dt.timedelta(days=365),
+        pool_size: int = 100,
+        timeout: float | tuple[float, float] | None = (10, 300),
+        token_refresh_margin: dt.timedelta = dt.timedelta(seconds=60),
+        token_cache: FileTokenCache | None = None,
+        adaptive_split: bool = False,
+        min_query_distance: dt.timedelta = dt.timedelta(hours=1),
+        retry_policy: RetryPolicy | None = None,
+        rate_limiter: RateLimiter | None = None,
+        alignment: str | None = None,
+        chunk_cache: ChunkCache | None = None,
+        memory_cache: MemoryCache | None = None,
+        mirror: Mirror | None = None,
+        archive: ResponseArchive | None = None,
+        csv_engine: str = "c",
+        arrow_dtypes: bool = False,
+        float32: bool = False,
+        backend: str = "pandas",
+    ):
+        """
+        Creates the client. The token is retrieved from the identity service with the first request
+        and refreshed shortly before it expires.
+
+            client_id -- your netztransparenz.de client id, usually starts with "cm_app_ntp_id"
+            client_pass -- your netztransparenz.de client secret, usually starts with "ntp_"
+            strict -- if True, raises Errors on not matching date parameters.
+                      if False, returns empty dataframes in such cases.
+                      Default=True
+            max_query_distance -- The client will split queries for longer timeframes than given timedelta
+                                  into several smaller requests.
+            pool_size -- Maximum number of requests that are in flight at the same time. (default: 100)
+            timeout -- Timeout in seconds for every request, either a single value or a tuple of
+                       (connect timeout, read timeout). None waits forever. (default: (10, 300))
+            token_refresh_margin -- A new token is requested when the current one expires within
+                                    this timedelta. (default: 60 seconds)
+            token_cache -- FileTokenCache to share tokens with other processes using the same client id.
+            adaptive_split -- if True, a request that fails with a HTTP 5xx error or times out is split in half
+                              and retried, see BaseNtClient.
+            min_query_distance -- shortest timeframe adaptive splitting creates. (default: 1 hour)
+            retry_policy -- RetryPolicy for requests that fail for transient reasons like HTTP 429 or 503.
+            rate_limiter -- RateLimiter all requests to the API wait for.
+            alignment -- "day", "month" or "year" splits queries at UTC calendar boundaries, see BaseNtClient.
+            chunk_cache -- ChunkCache that stores every requested timeframe on disk, see BaseNtClient.
+            memory_cache -- MemoryCache that keeps the results of queries in memory.
+            mirror -- Mirror with local copies of endpoints that queries are read from first.
+            archive -- ResponseArchive that keeps the body of every response.
+            csv_engine -- "c" parses responses with pandas, "pyarrow" with the multithreaded CSV reader of pyarrow.
+            arrow_dtypes -- if True, dataframes use pyarrow backed dtypes instead of numpy dtypes.
+            float32 -- if True, measured values are stored as float32 instead of float64.
+            backend -- "pandas", "arrow" or "polars", the type the readers return, see BaseNtClient.
+        """
+        if aiohttp is None:
+            raise ImportError(
+                "AsyncNetztransparenzClient requires aiohttp, install it with 'pip install netztransparenz[async]'"
+            )
+        super().__init__(
+            client_id,
+            client_pass,
+            strict=strict,
+            max_query_distance=max_query_distance,
+            pool_size=pool_size,
+            timeout=timeout,
+            token_refresh_margin=token_refresh_margin,
+            token_cache=token_cache,
+            adaptive_split=adaptive_split,
+            min_query_distance=min_query_distance,
+            retry_policy=retry_policy,
+            rate_limiter=rate_limiter,
+            alignment=alignment,
+            chunk_cache=chunk_cache,
+            memory_cache=memory_cache,
+            mirror=mirror,
+            archive=archive,
+            csv_engine=csv_engine,
+            arrow_dtypes=arrow_dtypes,
+            float32=float32,
+            backend=backend,
+        )
+
+    def _create_session(self, pool_size: int) -> None:
+        # aiohttp sessions have to be created inside the running event loop, see _get_session
+        self._session = None
+        self._pool_size = pool_size
+
+    def _login(self, client_id, client_pass) -> None:
+        super()._login(client_id, client_pass)
+        self._token_lock = asyncio.Lock()
+
+    @property
+    def token(self) -> str | None:
+        """
+        The current access token, None before the first request.
+        """
+        return self._token
+
+    @property
+    def session(self) -> aiohttp.ClientSession | None:
+        """
+        The aiohttp session of the client, None before the first request and after close.
+        """
+        return self._session
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        if self._session is None:
+            if isinstance(self.timeout, tuple):
+                connect_timeout, read_timeout = self.timeout
+            else:
+                connect_timeout = read_timeout = self.timeout
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self._pool_size),
+                timeout=aiohttp.ClientTimeout(
+                    sock_connect=connect_timeout, sock_read=read_timeout
+                ),
+            )
+        return self._session
+
+    async def _get_token(self, rejected: str | None = None) -> str:
+        """
+        Return a valid token, retrieving a new one from the identity service if necessary.
+
+            rejected -- a token the API did not accept. If it is still the current token, a new one is retrieved.
+        """
+        if rejected is None and self._token_valid():
+            return self._token
+        async with self._token_lock:
+            # another task may have refreshed the token while we were waiting
+            if (
+                rejected is not None and rejected == self._token
+            ) or not self._token_valid():
+                if self.token_cache is None:
+                    await self._request_token()
+                else:
+                    # other processes wait for this login and reuse its token
+                    async with self._token_cache_lock():
+                        if not await self._run(self._load_cached_token, rejected):
+                            await self._request_token()
+            return self._token
+
+    async def _request_token(self) -> None:
+        async with self._get_session().post(
+            base_client._ACCESS_TOKEN_URL, data=self._credentials
+        ) as response:
+            if not response.ok:
+                raise self._login_failed(response.status, response.reason)
+            token = await response.json(content_type=None)
+        await self._run(self._store_token, token)
+
+    @contextlib.asynccontextmanager
+    async def _token_cache_lock(self) -> AsyncIterator[None]:
+        # the file lock of the token cache blocks, so it is taken and released in the executor
+        lock = self.token_cache.lock(self._credentials["client_id"])
+        await self._run(lock.__enter__)
+        try:
+            yield
+        finally:
+            await self._run(lock.__exit__, None, None, None)
+
+    async def _run(self, function: Callable, *args):
+        """
+        Call function in the default executor, so parsing and disk I/O do not block the event loop.
+        """
+        return await asyncio.get_running_loop().run_in_executor(
+            None, functools.partial(function, *args)
+        )
+
+    async def _send(self, url: str) -> tuple[aiohttp.ClientResponse, bytes]:
+        """
+        Send an authorized GET request and return the response together with its body.
+        The body is kept as bytes, the parsers read it without decoding it into a str first.
+        If the API rejects the token, the request is repeated once with a new token.
+        """
+        token = await self._get_token()
+        await self._wait_for_rate_limit()
+        async with self._get_session().get(
+            url, headers={"Authorization": f"Bearer {token}"}
+        ) as response:
+            body = await response.read()
+        if response.status == 401:
+            log.info("Token was rejected, retrieving a new one")
+            token = await self._get_token(rejected=token)
+            await self._wait_for_rate_limit()
+            async with self._get_session().get(
+                url, headers={"Authorization": f"Bearer {token}"}
+            ) as response:
+                body = await response.read()
+        return response, body
+
+    async def _wait_for_rate_limit(self) -> None:
+        if self.rate_limiter is None:
+            return
+        # a FileRateLimiter reads and writes its bucket under a file lock
+        delay = await self._run(self._rate_limit_delay)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    async def _get_body(self, url: str, bisect: bool = False) -> bytes:
+        """
+        Send an authorized GET request and return the body of the response.
+        Raises an aiohttp.ClientResponseError for unsuccessful responses.
+        Requests that fail for transient reasons are repeated according to the retry policy.
+
+            bisect -- see BaseNtClient._get
+        """
+        attempt = 0
+        while True:
+            try:
+                response, body = await self._send(url)
+            except self._retry_exceptions() as e:
+                delay = (
+                    None
+                    if bisect and self._bisect_on(e)
+                    else self.retry_policy.delay(attempt)
+                )
+                if delay is None:
+                    self.retry_statistics.record_request(failed=True)
+                    raise
+                reason = type(e).__name__
+            else:
+                delay = None
+                if response.status in self.retry_policy.retry_statuses and not (
+                    bisect and response.status >= 500
+                ):
+                    delay = self.retry_policy.delay(
+                        attempt, response.headers.get("Retry-After")
+                    )
+                if delay is None:
+                    self.retry_statistics.record_request(failed=not response.ok)
+                    response.raise_for_status()
+                    return body
+                reason = str(response.status)
+            log.info(f"Request failed ({reason}), retrying in {delay:.1f}s: {url}")
+            self.retry_statistics.record_retry(reason)
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    async def _fetch_body(
+        self,
+        resource_url: str,
+        dt_begin: dt.datetime | None,
+        dt_end: dt.datetime | None,
+        url: str,
+        bisect: bool = False,
+    ) -> bytes:
+        if self.archive is not None and self.archive.replay:
+            body = await self._run(self.archive.load, url)
+            if body is not None:
+                return body
+        body = await self._get_body(url, bisect)
+        if self.archive is not None:
+            await self._run(
+                self.archive.store, resource_url, dt_begin, dt_end, url, body
+            )
+        return body
+
+    def _retry_exceptions(self) -> tuple[type[BaseException], ...]:
+        if self.retry_policy.retry_exceptions is not None:
+            return self.retry_policy.retry_exceptions
+        return (
+            aiohttp.ClientConnectionError,
+            aiohttp.ClientPayloadError,
+            asyncio.TimeoutError,
+        )
+
+    async def check_health(self):
+        """
+        Return the text response of the API health endpoint.
+        Any Response but "OK" indicates a problem.
+        """
+        _, body = await self._send(f"{self._API_BASE_URL}/health")
+        return body.decode()
+
+    async def close(self) -> None:
+        """
+        Close all connections of the client.
+        """
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.close()
+
+    async def _read(
+        self,
+        resource_url: str,
+        dt_begin: dt.datetime | None,
+        dt_end: dt.datetime | None,
+        parse: Callable[[bytes], pd.DataFrame],
+        transform: Callable[[pd.DataFrame], pd.DataFrame] | None = None,
+        transform_dates: bool = False,
+        split: bool = True,
+        url: str | None = None,
+        columns: list[str] | None = None,
+        backend: str | None = None,
+    ) -> pd.DataFrame:
+        """
+        Read the endpoint like BaseNtClient._read, with all timeframes requested concurrently.
+        """
+        query = self._query(
+            resource_url,
+            dt_begin,
+            dt_end,
+            parse,
+            transform,
+            transform_dates,
+            split,
+            url,
+            columns,
+            backend,
+        )
+        if query.result is not None:
+            return query.result
+        dataframes = await asyncio.gather(
+            *(self._read_timeframe(query, *timeframe) for timeframe in query.timeframes)
+        )
+        df = await self._run(self._concat, list(dataframes))
+        return await self._run(self._finish, query, df)
+
+    async def _read_timeframe(
+        self,
+        query: base_client._Query,
+        dt_begin: dt.datetime | None,
+        dt_end: dt.datetime | None,
+    ) -> pd.DataFrame:
+        parts, missing = await self._run(self._lookup, query, dt_begin, dt_end)
+        dataframes = await asyncio.gather(
+            *(self._fetch_timeframe(query, *timeframe) for timeframe in missing)
+        )
+        parts += [(start, df) for (start, _), df in zip(missing, dataframes)]
+        return await self._run(self._combine, parts)
+
+    async def _fetch_timeframe(
+        self,
+        query: base_client._Query,
+        dt_begin: dt.datetime | None,
+        dt_end: dt.datetime | None,
+    ) -> pd.DataFrame:
+        read = functools.partial(self._request_timeframe, query)
+        if query.adaptive:
+            dataframes = await asyncio.gather(
+                *(
+                    self._read_adaptive(query.resource_url, read, start, end)
+                    for start, end in self._adaptive_timeframes(
+                        query.resource_url, dt_begin, dt_end
+                    )
+                )
+            )
+            df = await self._run(self._concat, list(dataframes))
+        else:
+            df = await read(dt_begin, dt_end)
+        if query.cached:
+            await self._run(
+                self._store_chunk,
+                query.resource_url,
+                dt_begin,
+                dt_end,
+                query.transform_dates,
+                df,
+            )
+        return df
+
+    async def _request_timeframe(
+        self,
+        query: base_client._Query,
+        dt_begin: dt.datetime | None,
+        dt_end: dt.datetime | None,
+    ) -> pd.DataFrame:
+        body = await self._fetch_body(
+            query.resource_url,
+            dt_begin,
+            dt_end,
+            self._query_url(query, dt_begin, dt_end),
+            self._bisects(query, dt_begin, dt_end),
+        )
+        return await self._run(self._parse, query, body)
+
+    async def update_mirror(
+        self,
+        mirror: Mirror | None = None,
+        endpoints: list[str] | None = None,
+        until: dt.datetime | None = None,
+    ) -> int:
+        """
+        Store every month of the endpoints in the mirror that it does not hold completely yet and return
+        the number of months that were requested, see NetztransparenzClient.update_mirror.
+        Up to pool_size months are requested concurrently.
+        """
+        mirror = self._mirror_for_update(mirror)
+        semaphore = asyncio.Semaphore(self._pool_size)
+
+        async def update(endpoint, month, month_end, complete):
+            async with semaphore:
+                df = await self._sync_reader(endpoint)(month, month_end)
+            await self._run(mirror.write, endpoint, month, df, complete)
+
+        months = list(self._mirror_months(mirror, endpoints, until))
+        await asyncio.gather(*(update(*month) for month in months))
+        return len(months)
+
+    async def sync(
+        self,
+        endpoint: str,
+        store: MutableMapping,
+        overlap: dt.timedelta = dt.timedelta(hours=6),
+        start: dt.datetime | None = None,
+    ) -> pd.DataFrame:
+        """
+        Bring the data of endpoint in store up to date and return the data that was requested,
+        see NetztransparenzClient.sync.
+        """
+        endpoint = endpoint.strip("/")
+        dt_begin, dt_end = self._sync_timeframe(endpoint, store, overlap, start)
+        df = await self._sync_reader(endpoint)(dt_begin, dt_end)
+        return await self._run(self._sync_merge, endpoint, store, dt_begin, df)
+
+    async def stream(
+        self,
+        endpoint: str,
+        dt_begin: dt.datetime | None = None,
+        dt_end: dt.datetime | None = None,
+        chunk: str | dt.timedelta = "month",
+        transform_dates: bool = True,
+        columns: list[str] | None = None,
+        read_ahead: int = 1,
+    ) -> AsyncIterator[pd.DataFrame]:
+        """
+        Yield the data of endpoint between dt_begin and dt_end as one dataframe per chunk, in time order,
+        see NetztransparenzClient.stream. The next read_ahead chunks are requested concurrently.
+        """
+        reader, timeframes = self._stream_timeframes(
+            endpoint, dt_begin, dt_end, chunk, transform_dates, columns
+        )
+        pending = collections.deque()
+        try:
+            for timeframe in timeframes:
+                pending.append(asyncio.ensure_future(reader(*timeframe)))
+                if len(pending) > read_ahead:
+                    yield await pending.popleft()
+            while pending:
+                yield await pending.popleft()
+        finally:
+            for task in pending:
+                task.cancel()
+
+    def _bisect_on(self, error: Exception) -> bool:
+        if isinstance(error, aiohttp.ClientResponseError):
+            return error.status >= 500
+        # the connection broke while the body of a large response was read
+        return isinstance(error, (asyncio.TimeoutError, aiohttp.ClientPayloadError))
+
+    async def _read_adaptive(
+        self,
+        resource_url: str,
+        read: Callable[[dt.datetime, dt.datetime], Awaitable[pd.DataFrame]],
+        dt_begin: dt.datetime,
+        dt_end: dt.datetime,
+    ) -> pd.DataFrame:
+        try:
+            df = await read(dt_begin, dt_end)
+        except Exception as e:
+            middle = (
+                self._bisect_timeframe(resource_url, dt_begin, dt_end)
+                if self._bisect_on(e)
+                else None
+            )
+            if middle is None:
+                raise
+            dataframes = await asyncio.gather(
+                self._read_adaptive(resource_url, read, dt_begin, middle),
+                self._read_adaptive(resource_url, read, middle, dt_end),
+            )
+            return await self._run(self._concat, list(dataframes))
+        self._timeframe_succeeded(resource_url, dt_begin, dt_end)
+        return df
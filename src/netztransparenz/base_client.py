@@ -2,16 +2,136 @@
 Base class for all other clients. Handles login and health check.
 """
 
-import requests
-import logging
-import io
+from __future__ import annotations
+
+import dataclasses
 import datetime as dt
-import pandas as pd
+import functools
+import io
+import logging
+import threading
+import time
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from typing import BinaryIO
 
-from netztransparenz.constants import endpoints
+from netztransparenz import _lazy, parsing, registry, schema
+from netztransparenz.archive import ResponseArchive
+from netztransparenz.chunk_cache import ChunkCache
+from netztransparenz.constants import endpoints, freshness
+from netztransparenz.memory_cache import MemoryCache
+from netztransparenz.mirror import Mirror
+from netztransparenz.rate_limit import RateLimiter
+from netztransparenz.retry import RetryPolicy, RetryStatistics
+from netztransparenz.token_cache import FileTokenCache
+
+requests = _lazy.load("requests")
+np = _lazy.load("numpy")
+pd = _lazy.load("pandas")
 
 log = logging.getLogger("BaseNtClient")
 _ACCESS_TOKEN_URL = "https://identity.netztransparenz.de/users/connect/token"
+# successful requests before adaptive splitting doubles the timeframe of an endpoint again
+_ADAPTIVE_GROWTH_AFTER = 4
+_ALIGNMENTS = ("day", "month", "year")
+# bytes read from the connection at once while a response is parsed
+_STREAM_CHUNK_SIZE = 2**16
+
+
+def _align(moment: dt.datetime, alignment: str) -> dt.datetime:
+    """
+    Return the start of the UTC day, month or year moment lies in.
+    """
+    moment = moment.replace(hour=0, minute=0, second=0, microsecond=0)
+    if alignment == "day":
+        return moment
+    if alignment == "month":
+        return moment.replace(day=1)
+    return moment.replace(month=1, day=1)
+
+
+def _row_starts(df: pd.DataFrame, resource_url: str) -> np.ndarray:
+    """
+    Return the start of every row of a dataframe with transformed dates as UTC timestamps without timezone.
+    The start is the first column of the transformed header, either the index or a column.
+    """
+    column = endpoints[f"/{resource_url}"]["transformed_header"].split(";")[0]
+    values = df.index if df.index.name == column else df[column]
+    return (
+        pd.DatetimeIndex(pd.to_datetime(values, utc=True)).tz_convert(None).to_numpy()
+    )
+
+
+def _next_boundary(moment: dt.datetime, alignment: str) -> dt.datetime:
+    """
+    Return the start of the UTC day, month or year after the one moment lies in.
+    """
+    start = _align(moment, alignment)
+    if alignment == "day":
+        return start + dt.timedelta(days=1)
+    if alignment == "month":
+        if start.month == 12:
+            return start.replace(year=start.year + 1, month=1)
+        return start.replace(month=start.month + 1)
+    return start.replace(year=start.year + 1)
+
+
+class _ChunkReader(io.RawIOBase):
+    """
+    Binary stream over the decompressed chunks of a streamed response, see requests.Response.iter_content.
+    """
+
+    def __init__(self, chunks: Iterator[bytes]):
+        self._chunks = chunks
+        self._chunk = memoryview(b"")
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        while not self._chunk:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                return 0
+            self._chunk = memoryview(chunk)
+        size = min(len(buffer), len(self._chunk))
+        buffer[:size] = self._chunk[:size]
+        self._chunk = self._chunk[size:]
+        return size
+
+
+@dataclasses.dataclass(frozen=True)
+class _Query:
+    """
+    A read of one endpoint as prepared by BaseNtClient._query. The synchronous and the asynchronous
+    client read its timeframes with the same steps and only differ in how the responses are requested.
+
+        resource_url, parse, transform, transform_dates, url, columns, backend -- see BaseNtClient._read
+        timeframes -- timeframes the query is split into
+        key -- key of the result in the memory cache, None if it is not kept
+        cached -- timeframes are read from the chunk cache first
+        mirrored -- timeframes are read from the mirror first
+        adaptive -- failed requests are split in half, see BaseNtClient._read_adaptive
+        usecols -- columns of the raw data that are parsed, None parses all columns
+        table -- responses are parsed into pyarrow Tables
+        result -- the result of the query if it is known without reading any timeframe
+    """
+
+    resource_url: str
+    parse: Callable[[BinaryIO], pd.DataFrame]
+    transform: Callable[[pd.DataFrame], pd.DataFrame] | None
+    transform_dates: bool
+    url: str | None
+    columns: list[str] | None
+    backend: str
+    timeframes: list[tuple[dt.datetime | None, dt.datetime | None]] = ()
+    key: tuple | None = None
+    cached: bool = False
+    mirrored: bool = False
+    adaptive: bool = False
+    usecols: set[str] | None = None
+    table: bool = False
+    result: object = None
 
 
 class BaseNtClient:
@@ -21,10 +141,29 @@ class BaseNtClient:
         client_pass,
         strict: bool = True,
         max_query_distance: dt.timedelta = dt.timedelta(days=365),
+        pool_size: int = 10,
+        timeout: float | tuple[float, float] | None = (10, 300),
+        max_workers: int = 1,
+        token_refresh_margin: dt.timedelta = dt.timedelta(seconds=60),
+        token_cache: FileTokenCache | None = None,
+        adaptive_split: bool = False,
+        min_query_distance: dt.timedelta = dt.timedelta(hours=1),
+        retry_policy: RetryPolicy | None = None,
+        rate_limiter: RateLimiter | None = None,
+        alignment: str | None = None,
+        chunk_cache: ChunkCache | None = None,
+        memory_cache: MemoryCache | None = None,
+        mirror: Mirror | None = None,
+        archive: ResponseArchive | None = None,
+        csv_engine: str = "c",
+        arrow_dtypes: bool = False,
+        float32: bool = False,
+        backend: str = "pandas",
     ):
         """
-        Creates the client and attempts to retrieve a token from the identity service.
-        If retrieving the token fails this will raise an Exception.
+        Creates the client. The token is retrieved from the identity service with the first request
+        and refreshed shortly before it expires.
+        If retrieving the token fails the request will raise an Exception.
 
             client_id -- your netztransparenz.de client id, usually starts with "cm_app_ntp_id"
             client_pass -- your netztransparenz.de client secret, usually starts with "ntp_"
@@ -34,30 +173,196 @@ class BaseNtClient:
             max_query_distance -- The Api may return a HTTP 500 error if an explicit timeframe is too large.
                                   The client will split queries for linger timeframes than given timedelta
                                   into several smaller requests.
+            pool_size -- Number of keep-alive connections the client keeps open to the API. (default: 10)
+            timeout -- Timeout in seconds for every request, either a single value or a tuple of
+                       (connect timeout, read timeout). None waits forever. (default: (10, 300))
+            max_workers -- Number of requests that are sent in parallel when a query is split
+                           into several smaller requests. (default: 1)
+            token_refresh_margin -- A new token is requested when the current one expires within
+                                    this timedelta. (default: 60 seconds)
+            token_cache -- FileTokenCache to share tokens with other processes using the same client id.
+                           (default: None, every client retrieves its own token)
+            adaptive_split -- if True, a request that fails with a HTTP 5xx error or times out is split in half
+                              and retried right away, without repeating the same timeframe first. The client remembers the largest timeframe that worked for each
+                              endpoint and doubles it again, up to max_query_distance, after several
+                              successful requests.
+                              (default: False)
+            min_query_distance -- shortest timeframe adaptive splitting creates. Split timeframes are
+                                  multiples of it. (default: 1 hour)
+            retry_policy -- RetryPolicy for requests that fail for transient reasons like HTTP 429 or 503.
+                            (default: RetryPolicy(), up to 5 attempts with exponential backoff)
+            rate_limiter -- RateLimiter all requests to the API wait for, use a FileRateLimiter to share
+                            the budget with other processes using the same client id. (default: None)
+            alignment -- "day", "month" or "year" splits queries at UTC calendar boundaries instead of
+                         every max_query_distance, so overlapping queries request the same timeframes.
+                         Only the first and last timeframe are clipped to the query. Units longer than
+                         max_query_distance are split further from their start. Can be set per
+                         endpoint with set_alignment. (default: None)
+            chunk_cache -- ChunkCache that stores every requested timeframe on disk, so later queries only
+                           request the timeframes that are not cached yet. Queries are split at the
+                           alignment of the cache if the client has none. (default: None)
+            memory_cache -- MemoryCache that keeps the results of queries in memory, so repeating a query
+                            does not send any request. (default: None)
+            mirror -- Mirror with local copies of endpoints. Months the mirror holds completely are read
+                      from disk instead of the API, if dates are transformed. (default: None)
+            archive -- ResponseArchive that keeps the body of every response, so data can be parsed again
+                       without requesting it. (default: None)
+            csv_engine -- "c" parses responses with pandas, "pyarrow" with the multithreaded CSV reader of
+                          pyarrow, which is several times faster for long timeframes. (default: "c")
+            arrow_dtypes -- if True, dataframes use pyarrow backed dtypes instead of numpy dtypes.
+                            (default: False)
+            float32 -- if True, measured values are stored as float32 instead of float64, which halves
+                       their memory use. (default: False)
+            backend -- "pandas" returns pandas Dataframes, "arrow" pyarrow Tables and "polars" Polars DataFrames.
+                       Tables are parsed and transformed without pandas. (default: "pandas")
         """
         self._API_BASE_URL = "https://ds.netztransparenz.de/api/v1"
         self._api_date_format = "%Y-%m-%dT%H:%M:%S"
         self._csv_date_format = "%Y-%m-%d %H:%M %Z"
         self.strict = strict
         self.max_query_distance = max_query_distance
+        self.timeout = timeout
+        self.max_workers = max_workers
+        self.token_refresh_margin = token_refresh_margin
+        self.token_cache = token_cache
+        self.adaptive_split = adaptive_split
+        self.min_query_distance = min_query_distance
+        self.retry_policy = retry_policy if retry_policy is not None else RetryPolicy()
+        self.retry_statistics = RetryStatistics()
+        self.rate_limiter = rate_limiter
+        self._check_alignment(alignment)
+        self.alignment = alignment
+        # alignments that differ from self.alignment, by endpoint
+        self._alignments: dict[str, str | None] = {}
+        self.set_chunk_cache(chunk_cache)
+        self.memory_cache = memory_cache
+        self.mirror = mirror
+        self.archive = archive
+        self.set_csv_engine(csv_engine)
+        self.arrow_dtypes = arrow_dtypes
+        self.float32 = float32
+        self.set_backend(backend)
+        # largest timeframe per endpoint that is requested at once when adaptive_split is active
+        self._query_distances: dict[str, dt.timedelta] = {}
+        self._query_successes: dict[str, int] = {}
+        # both are updated by the threads that read the timeframes of a query
+        self._query_lock = threading.Lock()
 
-        response = requests.post(
-            _ACCESS_TOKEN_URL,
-            data={
-                "grant_type": "client_credentials",
-                "client_id": client_id,
-                "client_secret": client_pass,
-            },
-        )
+        self._create_session(max(pool_size, max_workers))
+        self._login(client_id, client_pass)
 
-        if response.ok:
-            self.token = response.json()["access_token"]
-        else:
-            message = (
-                f"Error retrieving token\n{response.status_code}:{response.reason}"
+    def _create_session(self, pool_size: int) -> None:
+        # the session is created with the first request, so clients that only read cached data never import requests
+        self._session = None
+        self._session_lock = threading.Lock()
+        self._pool_size = pool_size
+
+    @property
+    def session(self) -> requests.Session:
+        """
+        The session all requests share, so connections are reused between chunks.
+        """
+        if self._session is None:
+            with self._session_lock:
+                if self._session is None:
+                    session = requests.Session()
+                    # responses are compressed for the transfer and decompressed while they are parsed
+                    session.headers["Accept-Encoding"] = "gzip, deflate"
+                    adapter = requests.adapters.HTTPAdapter(
+                        pool_connections=self._pool_size, pool_maxsize=self._pool_size
+                    )
+                    session.mount("https://", adapter)
+                    session.mount("http://", adapter)
+                    self._session = session
+        return self._session
+
+    def _login(self, client_id, client_pass) -> None:
+        # The token is retrieved lazily with the first request, see _get_token
+        self._credentials = {
+            "grant_type": "client_credentials",
+            "client_id": client_id,
+            "client_secret": client_pass,
+        }
+        self._token = None
+        self._token_expiry = None
+        self._token_lock = threading.Lock()
+
+    @property
+    def token(self) -> str:
+        """
+        The current access token. Retrieves a new token if there is no valid one.
+        """
+        return self._get_token()
+
+    def _expiry_valid(self, expiry: float | None) -> bool:
+        if expiry is None:
+            return True
+        return time.time() < expiry - self.token_refresh_margin.total_seconds()
+
+    def _token_valid(self) -> bool:
+        return self._token is not None and self._expiry_valid(self._token_expiry)
+
+    def _store_token(self, response_json: dict) -> None:
+        self._token = response_json["access_token"]
+        expires_in = response_json.get("expires_in")
+        self._token_expiry = (
+            time.time() + float(expires_in) if expires_in is not None else None
+        )
+        if self.token_cache is not None:
+            self.token_cache.store(
+                self._credentials["client_id"], self._token, self._token_expiry
             )
-            log.error(message)
-            raise Exception(f"Login failed. {message}")
+
+    def _load_cached_token(self, rejected: str | None) -> bool:
+        """
+        Take over a valid token another process stored in the token cache.
+        Returns False if there is none.
+        """
+        if self.token_cache is None:
+            return False
+        cached = self.token_cache.load(self._credentials["client_id"])
+        if cached is None:
+            return False
+        token, expiry = cached
+        if token == rejected or not self._expiry_valid(expiry):
+            return False
+        self._token, self._token_expiry = token, expiry
+        return True
+
+    def _login_failed(self, status_code: int, reason: str):
+        message = f"Error retrieving token\n{status_code}:{reason}"
+        log.error(message)
+        return Exception(f"Login failed. {message}")
+
+    def _request_token(self) -> None:
+        response = self.session.post(
+            _ACCESS_TOKEN_URL, data=self._credentials, timeout=self.timeout
+        )
+        if not response.ok:
+            raise self._login_failed(response.status_code, response.reason)
+        self._store_token(response.json())
+
+    def _get_token(self, rejected: str | None = None) -> str:
+        """
+        Return a valid token, retrieving a new one from the identity service if necessary.
+
+            rejected -- a token the API did not accept. If it is still the current token, a new one is retrieved.
+        """
+        if rejected is None and self._token_valid():
+            return self._token
+        with self._token_lock:
+            # another thread may have refreshed the token while we were waiting
+            if (
+                rejected is not None and rejected == self._token
+            ) or not self._token_valid():
+                if self.token_cache is None:
+                    self._request_token()
+                else:
+                    # other processes wait for this login and reuse its token
+                    with self.token_cache.lock(self._credentials["client_id"]):
+                        if not self._load_cached_token(rejected):
+                            self._request_token()
+            return self._token
 
     def check_health(self):
         """
@@ -66,10 +371,149 @@ class BaseNtClient:
         """
 
         url = f"{self._API_BASE_URL}/health"
-        response = requests.get(
-            url, headers={"Authorization": "Bearer {}".format(self.token)}
+        return self._send(url).text
+
+    def close(self) -> None:
+        """
+        Close all pooled connections of the client.
+        """
+        if self._session is not None:
+            self._session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def _send(self, url: str, stream: bool = False) -> requests.Response:
+        """
+        Send an authorized GET request over the pooled session.
+        If the API rejects the token, the request is repeated once with a new token.
+
+            stream -- if True, the body is not read yet, see requests.get
+        """
+        token = self._get_token()
+        self._wait_for_rate_limit()
+        response = self.session.get(
+            url,
+            headers={"Authorization": f"Bearer {token}"},
+            timeout=self.timeout,
+            stream=stream,
+        )
+        if response.status_code == 401:
+            log.info("Token was rejected, retrieving a new one")
+            response.close()
+            token = self._get_token(rejected=token)
+            self._wait_for_rate_limit()
+            response = self.session.get(
+                url,
+                headers={"Authorization": f"Bearer {token}"},
+                timeout=self.timeout,
+                stream=stream,
+            )
+        return response
+
+    def _rate_limit_delay(self) -> float:
+        # seconds to wait before the next request to the API
+        if self.rate_limiter is None:
+            return 0
+        return self.rate_limiter.reserve(self._credentials["client_id"])
+
+    def _wait_for_rate_limit(self) -> None:
+        delay = self._rate_limit_delay()
+        if delay > 0:
+            time.sleep(delay)
+
+    def _retry_exceptions(self) -> tuple[type[BaseException], ...]:
+        if self.retry_policy.retry_exceptions is not None:
+            return self.retry_policy.retry_exceptions
+        return (
+            requests.ConnectionError,
+            requests.Timeout,
+            requests.exceptions.ChunkedEncodingError,
+        )
+
+    def _get(
+        self,
+        url: str,
+        stream: bool = False,
+        bisect: bool = False,
+        read: Callable[[requests.Response], pd.DataFrame] | None = None,
+    ) -> requests.Response | pd.DataFrame:
+        """
+        Send an authorized GET request and raise an HTTPError for unsuccessful responses.
+        Requests that fail for transient reasons are repeated according to the retry policy.
+
+            stream -- if True, the body of a successful response is not read yet and the caller closes it
+            bisect -- if True, errors after which adaptive splitting bisects the timeframe (see _bisect_on)
+                      are raised right away instead of being retried with the same timeframe
+            read -- called with the streamed successful response, its result is returned instead of the
+                    response. The connection breaking while read consumes the body is retried like a
+                    failed request.
+        """
+        attempt = 0
+        while True:
+            try:
+                response = self._send(url, stream or read is not None)
+            except self._retry_exceptions() as e:
+                delay = self._retry_delay(e, attempt, bisect)
+                reason = type(e).__name__
+            else:
+                delay = None
+                if response.status_code in self.retry_policy.retry_statuses and not (
+                    bisect and response.status_code >= 500
+                ):
+                    delay = self.retry_policy.delay(
+                        attempt, response.headers.get("Retry-After")
+                    )
+                if delay is not None:
+                    response.close()
+                    reason = str(response.status_code)
+                elif not response.ok:
+                    self.retry_statistics.record_request(failed=True)
+                    # release the connection of a streamed response
+                    response.close()
+                    response.raise_for_status()
+                elif read is None:
+                    self.retry_statistics.record_request()
+                    return response
+                else:
+                    try:
+                        with response:
+                            result = read(response)
+                    except (
+                        requests.ConnectionError,
+                        requests.exceptions.ChunkedEncodingError,
+                    ) as e:
+                        # the error belongs to a response that arrived, see _bisect_on
+                        if e.response is None:
+                            e.response = response
+                        delay = self._retry_delay(e, attempt, bisect)
+                        reason = type(e).__name__
+                    except Exception:
+                        self.retry_statistics.record_request(failed=True)
+                        raise
+                    else:
+                        self.retry_statistics.record_request()
+                        return result
+            log.info(f"Request failed ({reason}), retrying in {delay:.1f}s: {url}")
+            self.retry_statistics.record_retry(reason)
+            time.sleep(delay)
+            attempt += 1
+
+    def _retry_delay(self, error: Exception, attempt: int, bisect: bool) -> float:
+        # seconds to wait before the request that raised error is repeated, raises error if it is not
+        delay = (
+            self.retry_policy.delay(attempt)
+            if isinstance(error, self._retry_exceptions())
+            and not (bisect and self._bisect_on(error))
+            else None
         )
-        return response.text
+        if delay is None:
+            self.retry_statistics.record_request(failed=True)
+            raise error
+        return delay
 
     def set_strict(self, strict: bool) -> None:
         """
@@ -83,10 +527,207 @@ class BaseNtClient:
         """
         Set the maximum time that is queried with a single api call.
 
-            strict -- True for raising errors, False for returning empty dataframes.
+            max_query_distance -- longest timeframe that is queried with one request.
         """
         self.max_query_distance = max_query_distance
 
+    def set_min_query_distance(self, min_query_distance: dt.timedelta) -> None:
+        """
+        Set the shortest timeframe adaptive splitting creates.
+
+            min_query_distance -- split timeframes are multiples of this timedelta.
+        """
+        self.min_query_distance = min_query_distance
+
+    def set_adaptive_split(self, adaptive_split: bool) -> None:
+        """
+        Enable or disable splitting timeframes in half when a request fails with a HTTP 5xx error, times out
+        or its connection breaks while the body is read. Disabling it forgets the timeframes learned so far.
+        """
+        self.adaptive_split = adaptive_split
+        if not adaptive_split:
+            self._query_distances.clear()
+            self._query_successes.clear()
+
+    def set_retry_policy(self, retry_policy: RetryPolicy) -> None:
+        """
+        Set which failed requests are repeated and how long the client waits in between.
+
+            retry_policy -- RetryPolicy(max_attempts=1) disables retrying.
+        """
+        self.retry_policy = retry_policy
+
+    def set_rate_limiter(self, rate_limiter: RateLimiter | None) -> None:
+        """
+        Set the RateLimiter all requests to the API wait for.
+
+            rate_limiter -- None sends requests without waiting.
+        """
+        self.rate_limiter = rate_limiter
+
+    def set_alignment(
+        self, alignment: str | None, resource_url: str | None = None
+    ) -> None:
+        """
+        Set the calendar boundaries split queries are cut at.
+
+            alignment -- "day", "month", "year" or None for splitting every max_query_distance.
+                         Units longer than max_query_distance are split further.
+            resource_url -- endpoint the alignment applies to, e.g. "hochrechnung/Solar".
+                            None sets the default of all endpoints.
+        """
+        self._check_alignment(alignment)
+        if resource_url is None:
+            self.alignment = alignment
+        else:
+            self._alignments[resource_url.strip("/")] = alignment
+
+    @staticmethod
+    def _check_alignment(alignment: str | None) -> None:
+        if alignment is not None and alignment not in _ALIGNMENTS:
+            raise ValueError(
+                f"alignment has to be one of {', '.join(_ALIGNMENTS)} or None, not {alignment!r}"
+            )
+
+    def _alignment(self, resource_url: str) -> str | None:
+        alignment = self._alignments.get(resource_url, self.alignment)
+        if alignment is None and self.chunk_cache is not None:
+            return self.chunk_cache.alignment
+        if alignment is None and self.mirror is not None:
+            return "month"
+        return alignment
+
+    def set_chunk_cache(self, chunk_cache: ChunkCache | None) -> None:
+        """
+        Set the ChunkCache that stores requested timeframes on disk.
+
+            chunk_cache -- None requests every timeframe from the API.
+        """
+        if chunk_cache is not None:
+            self._check_alignment(chunk_cache.alignment)
+        self.chunk_cache = chunk_cache
+
+    def set_memory_cache(self, memory_cache: MemoryCache | None) -> None:
+        """
+        Set the MemoryCache that keeps the results of queries in memory.
+
+            memory_cache -- None sends requests for every query.
+        """
+        self.memory_cache = memory_cache
+
+    def set_mirror(self, mirror: Mirror | None) -> None:
+        """
+        Set the Mirror that queries are read from before the API is requested.
+
+            mirror -- None requests every query from the API.
+        """
+        self.mirror = mirror
+
+    def set_archive(self, archive: ResponseArchive | None) -> None:
+        """
+        Set the ResponseArchive that keeps the body of every response.
+
+            archive -- None does not archive responses.
+        """
+        self.archive = archive
+
+    def set_csv_engine(self, csv_engine: str) -> None:
+        """
+        Set the engine responses are parsed with.
+
+            csv_engine -- "c" for pandas or "pyarrow" for the multithreaded CSV reader of pyarrow
+        """
+        if csv_engine not in parsing.CSV_ENGINES:
+            raise ValueError(
+                f"csv_engine has to be one of {', '.join(parsing.CSV_ENGINES)}, not {csv_engine!r}"
+            )
+        if csv_engine == "pyarrow" and parsing.pyarrow is None:
+            raise ImportError(
+                "csv_engine='pyarrow' requires pyarrow, install it with 'pip install netztransparenz[cache]'"
+            )
+        self.csv_engine = csv_engine
+
+    def set_arrow_dtypes(self, arrow_dtypes: bool) -> None:
+        """
+        Set whether dataframes use pyarrow backed dtypes instead of numpy dtypes.
+        """
+        self.arrow_dtypes = arrow_dtypes
+
+    def set_float32(self, float32: bool) -> None:
+        """
+        Set whether measured values are stored as float32 instead of float64.
+        """
+        self.float32 = float32
+
+    def set_backend(self, backend: str) -> None:
+        """
+        Set the type the readers return.
+
+            backend -- "pandas" for pandas Dataframes, "arrow" for pyarrow Tables or "polars" for Polars DataFrames.
+                       Timestamps are native timestamp columns, the index of a Dataframe becomes the first column.
+        """
+        self._check_backend(backend)
+        self.backend = backend
+
+    @staticmethod
+    def _check_backend(backend: str) -> None:
+        if backend not in parsing.BACKENDS:
+            raise ValueError(
+                f"backend has to be one of {', '.join(parsing.BACKENDS)}, not {backend!r}"
+            )
+        if backend == "arrow" and parsing.pyarrow is None:
+            raise ImportError(
+                "backend='arrow' requires pyarrow, install it with 'pip install netztransparenz[cache]'"
+            )
+        if backend == "polars" and (parsing.polars is None or parsing.pyarrow is None):
+            raise ImportError(
+                "backend='polars' requires polars and pyarrow, install them with 'pip install netztransparenz[polars]'"
+            )
+
+    def _read_csv(
+        self,
+        resource_url: str,
+        body: str | bytes | BinaryIO,
+        na_values: list[str],
+        thousands: str | None = None,
+        usecols: set[str] | None = None,
+        table: bool = False,
+    ) -> pd.DataFrame:
+        """
+        Parse a CSV response of the endpoint, into a pyarrow Table if table is True.
+        """
+        # the schema of the endpoint types most columns, so the parser does not have to infer them
+        if table:
+            return parsing.read_arrow(
+                body,
+                na_values,
+                thousands,
+                schema.schema(resource_url).dtypes(self.float32),
+                usecols,
+            )
+        return parsing.read_csv(
+            body,
+            na_values,
+            thousands=thousands,
+            engine=self.csv_engine,
+            arrow_dtypes=self.arrow_dtypes,
+            dtypes=schema.schema(resource_url).dtypes(self.float32),
+            usecols=usecols,
+        )
+
+    def _apply_dtypes(self, resource_url: str, df: pd.DataFrame) -> pd.DataFrame:
+        # data from the cache or the mirror may have been parsed with other settings
+        df = schema.apply(df, resource_url, self.float32)
+        return parsing.arrow_backed(df) if self.arrow_dtypes else df
+
+    def set_max_workers(self, max_workers: int) -> None:
+        """
+        Set the number of requests that are sent in parallel for split queries.
+
+            max_workers -- 1 sends the requests one after another.
+        """
+        self.max_workers = max_workers
+
     def _check_preconditions(
         self,
         start: dt.datetime | None,
@@ -122,14 +763,792 @@ class BaseNtClient:
             return pd.read_csv(io.StringIO(endpoints[endpoint]["header"]), sep=";")
 
     def _split_timeframe(
-        self, dt_begin: dt.datetime, dt_end: dt.datetime
+        self,
+        dt_begin: dt.datetime,
+        dt_end: dt.datetime,
+        distance: dt.timedelta | None = None,
+        alignment: str | None = None,
     ) -> list[tuple[dt.datetime, dt.datetime]]:
+        """
+        Split the timeframe into consecutive timeframes of at most distance,
+        or at every UTC calendar boundary given by alignment.
+        With both, calendar units longer than distance are split further.
+        """
+        if alignment is not None:
+            result = []
+            current_start = dt_begin
+            while current_start < dt_end:
+                unit_start = _align(current_start, alignment)
+                unit_end = _next_boundary(current_start, alignment)
+                # split from the start of the unit, so overlapping queries request the same timeframes
+                pieces = (
+                    self._split_timeframe(unit_start, unit_end, distance)
+                    if distance is not None
+                    else [(unit_start, unit_end)]
+                )
+                for start, end in pieces:
+                    if start < dt_end and end > current_start:
+                        result.append((max(start, current_start), min(end, dt_end)))
+                current_start = min(unit_end, dt_end)
+            return result
+        distance = distance or self.max_query_distance
         current_start = dt_begin
-        current_end = dt_begin + self.max_query_distance
+        current_end = dt_begin + distance
         result = []
         while current_end < dt_end:
             result.append((current_start, current_end))
             current_start = current_end
-            current_end = current_start + self.max_query_distance
+            current_end = current_start + distance
         result.append((current_start, dt_end))
         return result
+
+    def _query_distance(self, resource_url: str) -> dt.timedelta:
+        if self.adaptive_split:
+            return self._query_distances.get(resource_url, self.max_query_distance)
+        return self.max_query_distance
+
+    def _timeframes(
+        self,
+        resource_url: str,
+        dt_begin: dt.datetime | None,
+        dt_end: dt.datetime | None,
+        split: bool,
+    ) -> list[tuple[dt.datetime | None, dt.datetime | None]]:
+        """
+        Return the timeframes that are requested for a query between dt_begin and dt_end.
+        Dates are interpreted as UTC. Without dates the whole dataseries is one timeframe.
+        """
+        if (dt_begin is None) or (dt_end is None):
+            return [(None, None)]
+        dt_begin = dt_begin.replace(tzinfo=dt.UTC)
+        dt_end = dt_end.replace(tzinfo=dt.UTC)
+        alignment = self._alignment(resource_url)
+        distance = self._query_distance(resource_url)
+        if split and alignment is not None:
+            return self._split_timeframe(dt_begin, dt_end, distance, alignment)
+        if split and (dt_begin + distance) < dt_end:
+            # split into multiple api calls
+            return self._split_timeframe(dt_begin, dt_end, distance)
+        return [(dt_begin, dt_end)]
+
+    def _bisect_timeframe(
+        self, resource_url: str, dt_begin: dt.datetime, dt_end: dt.datetime
+    ) -> dt.datetime | None:
+        """
+        Return the point to split a failed timeframe at, or None if it can not be split any further.
+        The endpoint will be queried with at most the resulting timeframe size from now on.
+        """
+        half = self._half(dt_begin, dt_end)
+        if half is None:
+            return None
+        with self._query_lock:
+            if half < self._query_distance(resource_url):
+                self._query_distances[resource_url] = half
+            self._query_successes[resource_url] = 0
+        log.info(f"Splitting {resource_url} timeframe {dt_begin} - {dt_end} in half")
+        return dt_begin + half
+
+    def _half(self, dt_begin: dt.datetime, dt_end: dt.datetime) -> dt.timedelta | None:
+        # half of the timeframe as a multiple of min_query_distance, None if it is shorter than that
+        half = (
+            ((dt_end - dt_begin) / 2)
+            // self.min_query_distance
+            * self.min_query_distance
+        )
+        return half if half >= self.min_query_distance else None
+
+    def _timeframe_succeeded(
+        self, resource_url: str, dt_begin: dt.datetime, dt_end: dt.datetime
+    ) -> None:
+        # Grow the timeframe again after several requests of the currently allowed size worked
+        with self._query_lock:
+            distance = self._query_distance(resource_url)
+            if dt_end - dt_begin < distance or distance >= self.max_query_distance:
+                return
+            successes = self._query_successes.get(resource_url, 0) + 1
+            if successes >= _ADAPTIVE_GROWTH_AFTER:
+                self._query_distances[resource_url] = min(
+                    distance * 2, self.max_query_distance
+                )
+                successes = 0
+            self._query_successes[resource_url] = successes
+
+    def _adaptive_timeframes(
+        self, resource_url: str, dt_begin: dt.datetime, dt_end: dt.datetime
+    ) -> list[tuple[dt.datetime, dt.datetime]]:
+        """
+        Split a timeframe that was planned before splitting learned a smaller size for the endpoint,
+        so it is not requested with a size that already failed.
+        """
+        return self._split_timeframe(
+            dt_begin, dt_end, self._query_distance(resource_url)
+        )
+
+    def _bisect_on(self, error: Exception) -> bool:
+        """
+        Return True for errors after which a request is retried with a smaller timeframe.
+        """
+        if isinstance(error, requests.HTTPError):
+            return error.response is not None and error.response.status_code >= 500
+        if isinstance(error, requests.Timeout):
+            return True
+        # the connection broke while the body of a large response was read, see _get
+        return (
+            isinstance(
+                error,
+                (requests.ConnectionError, requests.exceptions.ChunkedEncodingError),
+            )
+            and error.response is not None
+        )
+
+    def _read_adaptive(
+        self,
+        resource_url: str,
+        read: Callable[[dt.datetime, dt.datetime], pd.DataFrame],
+        dt_begin: dt.datetime,
+        dt_end: dt.datetime,
+    ) -> pd.DataFrame:
+        """
+        Read the timeframe and split it in half whenever the request fails in a way that suggests it was too large.
+        """
+        try:
+            df = read(dt_begin, dt_end)
+        except Exception as e:
+            middle = (
+                self._bisect_timeframe(resource_url, dt_begin, dt_end)
+                if self._bisect_on(e)
+                else None
+            )
+            if middle is None:
+                raise
+            return self._concat(
+                [
+                    self._read_adaptive(resource_url, read, dt_begin, middle),
+                    self._read_adaptive(resource_url, read, middle, dt_end),
+                ]
+            )
+        self._timeframe_succeeded(resource_url, dt_begin, dt_end)
+        return df
+
+    def _timeframe_url(
+        self,
+        resource_url: str,
+        dt_begin: dt.datetime | None,
+        dt_end: dt.datetime | None,
+    ) -> str:
+        url = f"{self._API_BASE_URL}/data/{resource_url}"
+        if (dt_begin is not None) and (dt_end is not None):
+            start_of_data = dt_begin.strftime(self._api_date_format)
+            end_of_data = dt_end.strftime(self._api_date_format)
+            url = f"{url}/{start_of_data}/{end_of_data}"
+        return url
+
+    def _read_endpoint(
+        self,
+        resource_url: str,
+        dt_begin: dt.datetime | None = None,
+        dt_end: dt.datetime | None = None,
+        transform_dates: bool = False,
+        columns: list[str] | None = None,
+        backend: str | None = None,
+        **path,
+    ) -> pd.DataFrame:
+        """
+        Read the endpoint resource_url as described in the registry, all readers of the clients call this.
+
+            resource_url -- url of the endpoint without the base url and without leading or trailing "/"
+            transform_dates -- transform the date columns as described by the layout of the endpoint
+            columns -- only these columns are returned, None returns all columns
+            backend -- type of the result, see set_backend (default: the backend of the client)
+            path -- arguments the path of endpoints that do not take the timeframe as path parameters is formatted with
+        """
+        endpoint = registry.endpoint(resource_url)
+        return self._read(
+            resource_url,
+            dt_begin,
+            dt_end,
+            parse=functools.partial(self._parse_endpoint, endpoint),
+            transform=endpoint.layout.transform,
+            transform_dates=transform_dates,
+            url=endpoint.url(self._API_BASE_URL, **path),
+            columns=columns,
+            backend=backend,
+        )
+
+    def _parse_endpoint(
+        self,
+        endpoint: registry.Endpoint,
+        body: BinaryIO,
+        usecols: set[str] | None = None,
+        table: bool = False,
+    ) -> pd.DataFrame:
+        """
+        Parse a response of endpoint as described by its layout, see the parse argument of _read.
+        """
+        layout = endpoint.layout
+        if layout.json:
+            return parsing.read_json(body)
+        df = self._read_csv(
+            endpoint.resource_url,
+            body,
+            list(layout.na_values),
+            layout.thousands,
+            usecols=usecols if layout.usecols else None,
+            table=table and layout.table,
+        )
+        if layout.rename:
+            df = parsing.rename(df, dict(layout.rename))
+        return df
+
+    def _read(
+        self,
+        resource_url: str,
+        dt_begin: dt.datetime | None,
+        dt_end: dt.datetime | None,
+        parse: Callable[[BinaryIO], pd.DataFrame],
+        transform: Callable[[pd.DataFrame], pd.DataFrame] | None = None,
+        transform_dates: bool = False,
+        split: bool = True,
+        url: str | None = None,
+        columns: list[str] | None = None,
+        backend: str | None = None,
+    ) -> pd.DataFrame:
+        """
+        Read the endpoint resource_url for the timeframe between dt_begin and dt_end.
+        Checks the preconditions, splits long timeframes and parses each response.
+
+            resource_url -- url of the endpoint without the base url and without leading or trailing "/"
+            parse -- turns the body of a response into a dataframe, see parsing.read_csv. It is called with the set of columns
+                     to parse as usecols if only some columns are needed and with table=True if a pyarrow Table
+                     is preferred, and may ignore both.
+            transform -- applied to every parsed dataframe if transform_dates is True
+            split -- if False, the timeframe is always requested with a single call
+            url -- full request url for endpoints that do not take the timeframe as path parameters
+            columns -- only these columns are returned, None returns all columns
+            backend -- type of the result, see set_backend (default: the backend of the client)
+        """
+        query = self._query(
+            resource_url,
+            dt_begin,
+            dt_end,
+            parse,
+            transform,
+            transform_dates,
+            split,
+            url,
+            columns,
+            backend,
+        )
+        if query.result is not None:
+            return query.result
+        read = functools.partial(self._read_timeframe, query)
+        return self._finish(query, self._read_timeframes(read, query.timeframes))
+
+    def _query(
+        self,
+        resource_url: str,
+        dt_begin: dt.datetime | None,
+        dt_end: dt.datetime | None,
+        parse: Callable[[BinaryIO], pd.DataFrame],
+        transform: Callable[[pd.DataFrame], pd.DataFrame] | None,
+        transform_dates: bool,
+        split: bool,
+        url: str | None,
+        columns: list[str] | None,
+        backend: str | None,
+    ) -> _Query:
+        """
+        Check the arguments of _read and decide how the timeframes of the query are read.
+        Queries that are answered without reading any timeframe carry their result.
+        """
+        backend = backend if backend is not None else self.backend
+        self._check_backend(backend)
+        transformed = transform_dates and transform is not None
+        self._check_columns(resource_url, columns, transformed)
+        query = _Query(
+            resource_url, parse, transform, transform_dates, url, columns, backend
+        )
+        if not self._check_preconditions(
+            dt_begin, endpoints[f"/{resource_url}"]["first_data"], dt_end
+        ):
+            empty = self._return_empty_frame(f"/{resource_url}", transform_dates)
+            return dataclasses.replace(
+                query, result=self._output(empty, columns, backend)
+            )
+        key = self._memory_key(
+            resource_url, dt_begin, dt_end, transform_dates, url, columns, backend
+        )
+        if key is not None:
+            df = self.memory_cache.get(key)
+            if df is not None:
+                return dataclasses.replace(query, result=df)
+
+        split = split and url is None
+        cached = self._cache_query(dt_begin, dt_end, url)
+        mirrored = self._mirror_query(dt_begin, dt_end, url, transform, transform_dates)
+        # the caches store aligned timeframes, so cached queries are always split
+        split = split or cached or mirrored
+        return dataclasses.replace(
+            query,
+            timeframes=self._timeframes(resource_url, dt_begin, dt_end, split),
+            key=key,
+            cached=cached,
+            mirrored=mirrored,
+            adaptive=split and self.adaptive_split and dt_begin is not None,
+            # the chunk cache stores all columns, so they are only projected while parsing without it
+            usecols=None
+            if cached
+            else self._usecols(resource_url, columns, transformed),
+            # the caches store Dataframes, data from them is converted to the backend at the end
+            table=backend != "pandas" and not cached and not mirrored,
+        )
+
+    def _read_timeframe(
+        self, query: _Query, dt_begin: dt.datetime | None, dt_end: dt.datetime | None
+    ) -> pd.DataFrame:
+        """
+        Read one timeframe of the query, from the mirror or the chunk cache if they hold it.
+        """
+        parts, missing = self._lookup(query, dt_begin, dt_end)
+        for start, end in missing:
+            parts.append((start, self._fetch_timeframe(query, start, end)))
+        return self._combine(parts)
+
+    def _lookup(
+        self, query: _Query, dt_begin: dt.datetime | None, dt_end: dt.datetime | None
+    ) -> tuple[list[tuple[dt.datetime | None, pd.DataFrame]], list[tuple]]:
+        """
+        Return the data of the timeframe the mirror or the chunk cache hold, each with the start of the
+        timeframe it covers, and the timeframes that have to be requested.
+        """
+        if query.mirrored:
+            df = self._load_mirrored(
+                query.resource_url, dt_begin, dt_end, query.columns
+            )
+            if df is not None:
+                return [(dt_begin, df)], []
+        if query.cached:
+            return self._load_cached(query, dt_begin, dt_end)
+        return [], [(dt_begin, dt_end)]
+
+    def _combine(
+        self, parts: list[tuple[dt.datetime | None, pd.DataFrame]]
+    ) -> pd.DataFrame:
+        # the parts of a timeframe are concatenated in the order of their start
+        return self._concat([df for _, df in sorted(parts, key=lambda part: part[0])])
+
+    def _fetch_timeframe(
+        self, query: _Query, dt_begin: dt.datetime | None, dt_end: dt.datetime | None
+    ) -> pd.DataFrame:
+        """
+        Request and parse the timeframe, splitting it if adaptive splitting is active,
+        and store it in the chunk cache.
+        """
+        read = functools.partial(self._request_timeframe, query)
+        if query.adaptive:
+            df = self._concat(
+                [
+                    self._read_adaptive(query.resource_url, read, start, end)
+                    for start, end in self._adaptive_timeframes(
+                        query.resource_url, dt_begin, dt_end
+                    )
+                ]
+            )
+        else:
+            df = read(dt_begin, dt_end)
+        if query.cached:
+            self._store_chunk(
+                query.resource_url, dt_begin, dt_end, query.transform_dates, df
+            )
+        return df
+
+    def _request_timeframe(
+        self, query: _Query, dt_begin: dt.datetime | None, dt_end: dt.datetime | None
+    ) -> pd.DataFrame:
+        return self._fetch_body(
+            query.resource_url,
+            dt_begin,
+            dt_end,
+            self._query_url(query, dt_begin, dt_end),
+            functools.partial(self._parse, query),
+            self._bisects(query, dt_begin, dt_end),
+        )
+
+    def _bisects(
+        self, query: _Query, dt_begin: dt.datetime | None, dt_end: dt.datetime | None
+    ) -> bool:
+        # a timeframe that adaptive splitting can still halve is split on its first failure instead of retried
+        return query.adaptive and self._half(dt_begin, dt_end) is not None
+
+    def _query_url(
+        self, query: _Query, dt_begin: dt.datetime | None, dt_end: dt.datetime | None
+    ) -> str:
+        return query.url or self._timeframe_url(query.resource_url, dt_begin, dt_end)
+
+    def _finish(self, query: _Query, df: pd.DataFrame):
+        """
+        Convert the data of all timeframes to the result of the query and keep it in the memory cache.
+        """
+        df = self._output(df, query.columns, query.backend)
+        if query.key is not None:
+            self.memory_cache.put(query.key, df)
+        return df
+
+    @staticmethod
+    def _check_columns(
+        resource_url: str, columns: list[str] | None, transformed: bool
+    ) -> None:
+        if columns is None:
+            return
+        header = endpoints[f"/{resource_url}"][
+            "transformed_header" if transformed else "header"
+        ].split(";")
+        # an empty name marks endpoints whose columns depend on the query, like the years of /Jahresmarktpraemie
+        unknown = [column for column in columns if column not in header]
+        if unknown and "" not in header:
+            raise ValueError(
+                f"/{resource_url} has no columns {', '.join(map(repr, unknown))}, "
+                f"available columns: {', '.join(header)}"
+            )
+
+    @staticmethod
+    def _usecols(
+        resource_url: str, columns: list[str] | None, transformed: bool
+    ) -> set[str] | None:
+        """
+        Return the columns of the raw data that have to be parsed to return columns.
+        With transformed dates the date, time and timezone columns are parsed as well.
+        """
+        if columns is None:
+            return None
+        if not transformed:
+            return set(columns)
+        endpoint = endpoints[f"/{resource_url}"]
+        transformed_header = endpoint["transformed_header"].split(";")
+        kinds = schema.schema(resource_url).kinds
+        return {
+            column
+            for column in endpoint["header"].split(";")
+            if column in columns
+            or column not in transformed_header
+            or kinds.get(column) == "string"
+        }
+
+    @staticmethod
+    def _project(df: pd.DataFrame, columns: list[str] | None) -> pd.DataFrame:
+        # the index, e.g. "von", is kept even if it is not requested
+        if columns is None:
+            return df
+        return df[[column for column in columns if column in df.columns]]
+
+    @classmethod
+    def _output(
+        cls,
+        df: pd.DataFrame | parsing.pyarrow.Table,
+        columns: list[str] | None,
+        backend: str,
+    ):
+        """
+        Return the result of a query in the type of the backend with only columns.
+        Tables have no index, so only the requested columns are kept.
+        """
+        if backend == "pandas":
+            return cls._project(df, columns)
+        if isinstance(df, pd.DataFrame):
+            df = parsing.to_arrow(df)
+        if columns is not None:
+            df = df.select([column for column in columns if column in df.column_names])
+        return parsing.polars.from_arrow(df) if backend == "polars" else df
+
+    def _memory_key(
+        self,
+        resource_url: str,
+        dt_begin: dt.datetime | None,
+        dt_end: dt.datetime | None,
+        transform_dates: bool,
+        url: str | None,
+        columns: list[str] | None = None,
+        backend: str = "pandas",
+    ) -> tuple | None:
+        """
+        Return the key of the query in the memory cache, or None if the result is not kept in memory.
+        Without a ttl only queries that end before the current UTC day are kept, later data may still change.
+        """
+        if self.memory_cache is None:
+            return None
+        if dt_begin is not None and dt_end is not None:
+            dt_begin = dt_begin.replace(tzinfo=dt.UTC)
+            dt_end = dt_end.replace(tzinfo=dt.UTC)
+        if self.memory_cache.ttl is None:
+            today = dt.datetime.now(dt.UTC).replace(
+                hour=0, minute=0, second=0, microsecond=0
+            )
+            if dt_end is None or dt_end > today:
+                return None
+        return (
+            resource_url,
+            url,
+            dt_begin,
+            dt_end,
+            transform_dates,
+            self.arrow_dtypes,
+            self.float32,
+            tuple(columns) if columns is not None else None,
+            backend,
+        )
+
+    def _cache_query(
+        self, dt_begin: dt.datetime | None, dt_end: dt.datetime | None, url: str | None
+    ) -> bool:
+        # only queries with a timeframe are cached
+        return (
+            self.chunk_cache is not None
+            and url is None
+            and dt_begin is not None
+            and dt_end is not None
+        )
+
+    @staticmethod
+    def _freshness(resource_url: str) -> dict[str, dt.timedelta]:
+        family = resource_url.rsplit("/", 1)[-1]
+        return freshness.get(family, freshness["default"])
+
+    def _fetch_body(
+        self,
+        resource_url: str,
+        dt_begin: dt.datetime | None,
+        dt_end: dt.datetime | None,
+        url: str,
+        read: Callable[[BinaryIO], pd.DataFrame],
+        bisect: bool = False,
+    ) -> pd.DataFrame:
+        """
+        Return the result of read for the body of the response to url as a binary stream. The body is
+        read from the connection while read consumes it, so it is never held in memory as a whole.
+        The request is repeated when the connection breaks before the body is read completely.
+        Responses are archived, or read from the archive in replay mode.
+
+            bisect -- see _get
+        """
+        if self.archive is not None and self.archive.replay:
+            body = self.archive.load(url)
+            if body is not None:
+                return read(io.BytesIO(body))
+
+        def read_response(response: requests.Response) -> pd.DataFrame:
+            if self.archive is not None:
+                body = response.content
+                self.archive.store(resource_url, dt_begin, dt_end, url, body)
+                return read(io.BytesIO(body))
+            return read(
+                io.BufferedReader(
+                    _ChunkReader(response.iter_content(_STREAM_CHUNK_SIZE)),
+                    _STREAM_CHUNK_SIZE,
+                )
+            )
+
+        return self._get(url, bisect=bisect, read=read_response)
+
+    def _mirror_query(
+        self,
+        dt_begin: dt.datetime | None,
+        dt_end: dt.datetime | None,
+        url: str | None,
+        transform: Callable | None,
+        transform_dates: bool,
+    ) -> bool:
+        # the mirror holds data with transformed dates, rows are selected by their start
+        return (
+            self.mirror is not None
+            and url is None
+            and dt_begin is not None
+            and dt_end is not None
+            and (transform_dates or transform is None)
+        )
+
+    def _load_mirrored(
+        self,
+        resource_url: str,
+        dt_begin: dt.datetime,
+        dt_end: dt.datetime,
+        columns: list[str] | None = None,
+    ) -> pd.DataFrame | None:
+        """
+        Return the rows of the timeframe from the mirror, or None if the mirror does not hold the timeframe
+        completely. Only timeframes within one month can be read from the mirror.
+        """
+        month = _align(dt_begin, "month")
+        if dt_end > _next_boundary(dt_begin, "month") or not self.mirror.complete(
+            resource_url, month
+        ):
+            return None
+        if columns is not None:
+            # the start of the rows selects them, see _row_starts
+            start = endpoints[f"/{resource_url}"]["transformed_header"].split(";")[0]
+            columns = [start, *columns]
+        df = self.mirror.read(resource_url, month, columns)
+        if df is None:
+            return None
+        starts = _row_starts(df, resource_url)
+        selected = (starts >= np.datetime64(dt_begin.replace(tzinfo=None), "ns")) & (
+            starts < np.datetime64(dt_end.replace(tzinfo=None), "ns")
+        )
+        log.debug(f"Read {resource_url} {dt_begin} - {dt_end} from mirror")
+        return self._apply_dtypes(resource_url, df[selected])
+
+    def _load_cached(
+        self, query: _Query, dt_begin: dt.datetime, dt_end: dt.datetime
+    ) -> tuple[
+        list[tuple[dt.datetime, pd.DataFrame]], list[tuple[dt.datetime, dt.datetime]]
+    ]:
+        """
+        Return the rows of the timeframe the chunk cache holds, each part with its start, and the parts
+        of the timeframe that are not cached, see _lookup. Cached timeframes that reach beyond the
+        timeframe are cut to it, so any covered timeframe is read without a request. Both are derived
+        from the same stored timeframes, so a part is never read and requested at once.
+        """
+        resource_url = query.resource_url
+        policy = self._freshness(resource_url)
+        # recent timeframes may still be revised and are only used for a while
+        max_age = (
+            None
+            if dt.datetime.now(dt.UTC) - dt_end >= policy["immutable_after"]
+            else policy["ttl"]
+        )
+        columns = self._cached_columns(query)
+        parts, missing = [], []
+        covered = dt_begin
+        for chunk_begin, chunk_end in self.chunk_cache.chunks(
+            resource_url, dt_begin, dt_end, query.transform_dates, max_age
+        ):
+            # overlapping cached timeframes are read only once
+            start, end = max(chunk_begin, covered), min(chunk_end, dt_end)
+            if start >= end:
+                continue
+            if start > covered:
+                missing.append((covered, start))
+                covered = start
+            df = self.chunk_cache.load(
+                resource_url,
+                chunk_begin,
+                chunk_end,
+                query.transform_dates,
+                max_age,
+                columns,
+            )
+            if df is None:
+                # the file was removed or could not be read, a later timeframe may still cover it
+                continue
+            log.debug(f"Read {resource_url} {start} - {end} from cache")
+            if (start, end) != (chunk_begin, chunk_end):
+                df = self._cut(query, df, start, end)
+            parts.append((start, self._apply_dtypes(resource_url, df)))
+            covered = end
+        if covered < dt_end:
+            missing.append((covered, dt_end))
+        return parts, missing
+
+    def _cached_columns(self, query: _Query) -> list[str] | None:
+        # the columns read from the chunk cache, with the dates the rows are cut by, see _cut
+        if query.columns is None:
+            return None
+        if query.transform_dates or query.transform is None:
+            start = endpoints[f"/{query.resource_url}"]["transformed_header"]
+            return [start.split(";")[0], *query.columns]
+        return list(self._usecols(query.resource_url, query.columns, True))
+
+    def _cut(
+        self,
+        query: _Query,
+        df: pd.DataFrame,
+        dt_begin: dt.datetime,
+        dt_end: dt.datetime,
+    ) -> pd.DataFrame:
+        """
+        Return the rows of cached data that start between dt_begin and dt_end.
+        """
+        dates = df
+        if not query.transform_dates and query.transform is not None:
+            # raw rows only have a start once their date columns are transformed
+            date_columns = self._usecols(query.resource_url, [], True)
+            dates = query.transform(
+                df[[column for column in df.columns if column in date_columns]]
+            )
+        starts = _row_starts(dates, query.resource_url)
+        selected = (starts >= np.datetime64(dt_begin.replace(tzinfo=None), "ns")) & (
+            starts < np.datetime64(dt_end.replace(tzinfo=None), "ns")
+        )
+        return df[selected]
+
+    def _store_chunk(
+        self,
+        resource_url: str,
+        dt_begin: dt.datetime,
+        dt_end: dt.datetime,
+        transform_dates: bool,
+        df: pd.DataFrame,
+    ) -> None:
+        # data of the current day is not complete yet
+        today = dt.datetime.now(dt.UTC).replace(
+            hour=0, minute=0, second=0, microsecond=0
+        )
+        if dt_end <= today:
+            self.chunk_cache.store(resource_url, dt_begin, dt_end, transform_dates, df)
+
+    @staticmethod
+    def _parse(query: _Query, body: str | bytes | BinaryIO) -> pd.DataFrame:
+        options = {}
+        if query.usecols is not None:
+            options["usecols"] = query.usecols
+        if query.table:
+            options["table"] = True
+        df = query.parse(body, **options)
+        if query.transform_dates and query.transform is not None:
+            if isinstance(df, pd.DataFrame):
+                return query.transform(df)
+            arrow_transform = parsing.arrow_transform(query.transform)
+            if arrow_transform is None:
+                return parsing.to_arrow(query.transform(df.to_pandas()))
+            df = arrow_transform(df)
+        return df
+
+    @staticmethod
+    def _concat(dataframes: list[pd.DataFrame]) -> pd.DataFrame:
+        if len(dataframes) == 1:
+            return dataframes[0]
+        if not isinstance(dataframes[0], pd.DataFrame):
+            # columns that are null in some responses are promoted to the type of the others
+            return parsing.pyarrow.concat_tables(
+                dataframes, promote_options="permissive"
+            )
+        df = pd.concat(dataframes)
+        # categoricals with different categories are concatenated as strings
+        categorical = [
+            column
+            for column, dtype in dataframes[0].dtypes.items()
+            if isinstance(dtype, pd.CategoricalDtype)
+            and not isinstance(df[column].dtype, pd.CategoricalDtype)
+        ]
+        if categorical:
+            df = df.astype(dict.fromkeys(categorical, "category"))
+        return df
+
+    def _read_timeframes(
+        self,
+        read: Callable[[dt.datetime, dt.datetime], pd.DataFrame],
+        timeframes: list[tuple[dt.datetime, dt.datetime]],
+    ) -> pd.DataFrame:
+        """
+        Call read for every timeframe and concatenate the results in the order of the timeframes.
+        Up to max_workers timeframes are read in parallel.
+        """
+        if self.max_workers > 1 and len(timeframes) > 1:
+            with ThreadPoolExecutor(
+                max_workers=min(self.max_workers, len(timeframes))
+            ) as executor:
+                dataframes = list(
+                    executor.map(lambda timeframe: read(*timeframe), timeframes)
+                )
+        else:
+            dataframes = [read(*timeframe) for timeframe in timeframes]
+        return self._concat(dataframes)
@@ -0,0 +1,312 @@
+"""
+On-disk cache of parsed responses, stored as parquet files per endpoint and timeframe.
+Requires the optional dependency pyarrow (pip install netztransparenz[cache]).
+"""
+
+from __future__ import annotations
+
+import contextlib
+import datetime as dt
+import hashlib
+import logging
+import os
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+from netztransparenz import _lazy
+from netztransparenz.coverage import CoverageIndex
+from netztransparenz.token_cache import _cache_home
+
+pd = _lazy.load("pandas")
+pyarrow = _lazy.load("pyarrow", "parquet", optional=True)
+
+log = logging.getLogger("ChunkCache")
+
+_NAME_DATE_FORMAT = "%Y%m%dT%H%M%S"
+# key in the parquet metadata that holds the unix time the data was requested at
+_FETCHED_KEY = b"netztransparenz.fetched"
+
+
+class ChunkCache:
+    def __init__(
+        self,
+        directory: str | os.PathLike | None = None,
+        max_size: int | None = 2**30,
+        alignment: str = "month",
+    ):
+        """
+        Creates the cache. Every timeframe a client requests is stored in its own file. A later query
+        reads the rows of all stored timeframes that overlap it and only requests the parts that are not
+        cached yet. The cached intervals are kept in a CoverageIndex (coverage.sqlite), see missing.
+
+            directory -- where the files are stored (default: ~/.cache/netztransparenz/chunks)
+            max_size -- size of the cache in bytes, the least recently used files are removed when it
+                        is exceeded. None for no limit. (default: 1 GiB)
+            alignment -- "day", "month" or "year", the calendar boundaries queries are split at if
+                         the client has no alignment configured. Units longer than the
+                         max_query_distance of the client are still split further. (default: "month")
+        """
+        if pyarrow is None:
+            raise ImportError(
+                "ChunkCache requires pyarrow, install it with 'pip install netztransparenz[cache]'"
+            )
+        self.directory = (
+            Path(directory) if directory is not None else _cache_home() / "chunks"
+        )
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_size = max_size
+        self.alignment = alignment
+        self._lock = threading.Lock()
+        index_path = self.directory / "coverage.sqlite"
+        new_index = not index_path.exists()
+        self.coverage = CoverageIndex(index_path)
+        if new_index or not self.coverage.sized:
+            # caches created before the index existed or before it recorded the sizes of the files
+            for path in self._files():
+                resource_url, start, end, kind = self._parse_path(path)
+                key = _coverage_key(resource_url, kind)
+                with contextlib.suppress(FileNotFoundError):
+                    stat = path.stat()
+                    if new_index:
+                        self.coverage.add(key, start, end, fetched=_fetched(path))
+                    self.coverage.set_size(key, start, end, stat.st_size, stat.st_mtime)
+
+    def _endpoint_directory(self, resource_url: str) -> Path:
+        return self.directory.joinpath(*resource_url.strip("/").split("/"))
+
+    def _path(
+        self,
+        resource_url: str,
+        dt_begin: dt.datetime,
+        dt_end: dt.datetime,
+        transformed: bool,
+    ) -> Path:
+        kind = "transformed" if transformed else "raw"
+        name = f"{dt_begin:{_NAME_DATE_FORMAT}}_{dt_end:{_NAME_DATE_FORMAT}}_{kind}.parquet"
+        return self._endpoint_directory(resource_url) / name
+
+    def _parse_path(self, path: Path) -> tuple[str, dt.datetime, dt.datetime, str]:
+        # inverse of _path, returns endpoint, timeframe and kind of a cached file
+        start, end, kind = path.stem.split("_")
+        return (
+            path.parent.relative_to(self.directory).as_posix(),
+            dt.datetime.strptime(start, _NAME_DATE_FORMAT),
+            dt.datetime.strptime(end, _NAME_DATE_FORMAT),
+            kind,
+        )
+
+    def _remove(self, path: Path) -> None:
+        resource_url, start, end, kind = self._parse_path(path)
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(path)
+        self.coverage.remove(_coverage_key(resource_url, kind), start, end)
+
+    def load(
+        self,
+        resource_url: str,
+        dt_begin: dt.datetime,
+        dt_end: dt.datetime,
+        transformed: bool,
+        max_age: dt.timedelta | None = None,
+        columns: list[str] | None = None,
+    ) -> pd.DataFrame | None:
+        """
+        Return the cached dataframe of the timeframe, or None if it is not cached.
+
+            max_age -- data that was requested longer ago is treated as not cached. None for no limit.
+            columns -- only these columns and the index are read. None reads all columns.
+        """
+        key = _coverage_key(resource_url, transformed)
+        # the index answers without touching the file system for timeframes that were never stored
+        if self.coverage.chunk(key, dt_begin, dt_end) is None:
+            return None
+        path = self._path(resource_url, dt_begin, dt_end, transformed)
+        try:
+            table = _read_table(path, columns)
+        except (OSError, pyarrow.ArrowException) as e:
+            if not isinstance(e, FileNotFoundError):
+                log.warning(f"Could not read cached file {path}: {e}")
+            self.coverage.remove(key, dt_begin, dt_end)
+            return None
+        if max_age is not None:
+            fetched = float((table.schema.metadata or {}).get(_FETCHED_KEY, 0))
+            if time.time() - fetched > max_age.total_seconds():
+                return None
+        # the index records when the file was used last, see _evict
+        self.coverage.touch(key, dt_begin, dt_end)
+        return table.to_pandas()
+
+    def store(
+        self,
+        resource_url: str,
+        dt_begin: dt.datetime,
+        dt_end: dt.datetime,
+        transformed: bool,
+        df: pd.DataFrame,
+    ) -> None:
+        """
+        Store the dataframe of the timeframe. The file is replaced atomically.
+        """
+        path = self._path(resource_url, dt_begin, dt_end, transformed)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, temporary_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        os.close(fd)
+        fetched = time.time()
+        try:
+            table = pyarrow.Table.from_pandas(df)
+            table = table.replace_schema_metadata(
+                {**(table.schema.metadata or {}), _FETCHED_KEY: str(fetched)}
+            )
+            pyarrow.parquet.write_table(table, temporary_path)
+            size = os.path.getsize(temporary_path)
+            os.replace(temporary_path, path)
+        except (OSError, ValueError, pyarrow.ArrowException) as e:
+            log.warning(f"Could not cache {resource_url} {dt_begin} - {dt_end}: {e}")
+            with contextlib.suppress(OSError):
+                os.remove(temporary_path)
+            return
+        digest = hashlib.sha256(
+            pd.util.hash_pandas_object(df, index=True).to_numpy().tobytes()
+        ).hexdigest()
+        self.coverage.add(
+            _coverage_key(resource_url, transformed),
+            dt_begin,
+            dt_end,
+            digest,
+            fetched,
+            size,
+        )
+        self._evict()
+
+    def missing(
+        self,
+        resource_url: str,
+        dt_begin: dt.datetime,
+        dt_end: dt.datetime,
+        transformed: bool,
+        max_age: dt.timedelta | None = None,
+    ) -> list[tuple[dt.datetime, dt.datetime]]:
+        """
+        Return the parts of the timeframe (UTC) that are not cached, ordered by start.
+
+            max_age -- data that was requested longer ago is treated as not cached. None for no limit.
+        """
+        return self.coverage.missing(
+            _coverage_key(resource_url, transformed),
+            dt_begin,
+            dt_end,
+            _fetched_after(max_age),
+        )
+
+    def chunks(
+        self,
+        resource_url: str,
+        dt_begin: dt.datetime,
+        dt_end: dt.datetime,
+        transformed: bool,
+        max_age: dt.timedelta | None = None,
+    ) -> list[tuple[dt.datetime, dt.datetime]]:
+        """
+        Return the cached timeframes (UTC) that overlap the timeframe, ordered by start, see load.
+
+            max_age -- data that was requested longer ago is treated as not cached. None for no limit.
+        """
+        return self.coverage.chunks(
+            _coverage_key(resource_url, transformed),
+            dt_begin,
+            dt_end,
+            _fetched_after(max_age),
+        )
+
+    def _files(self, resource_url: str | None = None) -> list[Path]:
+        directory = (
+            self._endpoint_directory(resource_url)
+            if resource_url is not None
+            else self.directory
+        )
+        return list(directory.rglob("*.parquet"))
+
+    def size(self) -> int:
+        """
+        Return the size of all cached files in bytes, as recorded in the index.
+        """
+        return self.coverage.size()
+
+    def _evict(self) -> None:
+        # Remove the least recently used files until the cache fits into max_size. The sizes and
+        # the last uses are kept in the index, so a write does not look at every cached file.
+        if self.max_size is None:
+            return
+        with self._lock:
+            excess = self.coverage.size() - self.max_size
+            while excess > 0:
+                chunks = self.coverage.least_recently_used(16)
+                if not chunks:
+                    break
+                for key, start, end, size in chunks:
+                    if excess <= 0:
+                        break
+                    resource_url, kind = key.rsplit(":", 1)
+                    self._remove(
+                        self._path(resource_url, start, end, kind == "transformed")
+                    )
+                    excess -= size
+
+    def invalidate(
+        self,
+        resource_url: str | None = None,
+        dt_begin: dt.datetime | None = None,
+        dt_end: dt.datetime | None = None,
+    ) -> None:
+        """
+        Remove cached timeframes, so they are requested from the API again.
+
+            resource_url -- endpoint to remove, e.g. "hochrechnung/Solar". None removes all endpoints.
+            dt_begin -- only remove timeframes that end after dt_begin (UTC)
+            dt_end -- only remove timeframes that start before dt_end (UTC)
+        """
+        for path in self._files(resource_url):
+            _, start, end, _ = self._parse_path(path)
+            if (dt_begin is not None and end <= dt_begin.replace(tzinfo=None)) or (
+                dt_end is not None and start >= dt_end.replace(tzinfo=None)
+            ):
+                continue
+            self._remove(path)
+
+    def clear(self) -> None:
+        """
+        Remove all cached timeframes.
+        """
+        self.invalidate()
+
+
+def _read_table(path: Path, columns: list[str] | None) -> pyarrow.Table:
+    """
+    Read the parquet file, only the columns that are in the file if columns is given.
+    The index of the dataframe the file was written from is always read.
+    """
+    with pyarrow.parquet.ParquetFile(path) as file:
+        if columns is not None:
+            columns = [name for name in file.schema_arrow.names if name in columns]
+        return file.read(columns=columns, use_pandas_metadata=True)
+
+
+def _fetched(path: Path) -> float | None:
+    # unix time the file was requested at, see store
+    with contextlib.suppress(OSError, pyarrow.ArrowException, KeyError, ValueError):
+        metadata = pyarrow.parquet.read_schema(path).metadata or {}
+        return float(metadata[_FETCHED_KEY])
+    return None
+
+
+def _fetched_after(max_age: dt.timedelta | None) -> float | None:
+    return time.time() - max_age.total_seconds() if max_age is not None else None
+
+
+def _coverage_key(resource_url: str, transformed: bool | str) -> str:
+    # raw and transformed data are cached separately, so they are covered separately
+    if not isinstance(transformed, str):
+        transformed = "transformed" if transformed else "raw"
+    return f"{resource_url.strip('/')}:{transformed}"
@@ -5,13 +5,254 @@ To access the API it is required to set up a free account and client in the
 Netztransparenz extranet. (see: https://www.netztransparenz.de/en/Web-API)
 """
 
-from .vermarktung_client import VermarktungClient
-from .hochrechnung_client import HochrechnungClient
+from __future__ import annotations
+
+import collections
+import datetime as dt
+import functools
+import inspect
+from collections.abc import Callable, Iterator, MutableMapping
+from concurrent.futures import ThreadPoolExecutor
+
+from . import _lazy
+from .base_client import _align, _next_boundary, _row_starts
+from .constants import endpoints
 from .dienstleistungen_client import DienstleistungenClient
+from .hochrechnung_client import HochrechnungClient
+from .mirror import Mirror
 from .nrvsaldo_client import NrvSaldoClient
+from .vermarktung_client import VermarktungClient
+
+np = _lazy.load("numpy")
+pd = _lazy.load("pandas")
 
 
 class NetztransparenzClient(
     VermarktungClient, HochrechnungClient, DienstleistungenClient, NrvSaldoClient
 ):
-    pass
+    def update_mirror(
+        self,
+        mirror: Mirror | None = None,
+        endpoints: list[str] | None = None,
+        until: dt.datetime | None = None,
+    ) -> int:
+        """
+        Store every month of the endpoints in the mirror that it does not hold completely yet and return
+        the number of months that were requested. Months are marked as complete in the manifest of the
+        mirror once they can not be revised anymore (see constants.freshness), so an interrupted or
+        repeated update only requests the missing and recent months. Up to max_workers months are
+        requested in parallel.
+
+            mirror -- Mirror to update (default: the mirror of the client)
+            endpoints -- urls of the endpoints, e.g. ["hochrechnung/Solar"]
+                         (default: all endpoints that take a timeframe)
+            until -- last month that is stored (default: now)
+        """
+        mirror = self._mirror_for_update(mirror)
+
+        def update(endpoint, month, month_end, complete):
+            df = self._sync_reader(endpoint)(month, month_end)
+            mirror.write(endpoint, month, df, complete)
+
+        months = list(self._mirror_months(mirror, endpoints, until))
+        if self.max_workers > 1:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                list(executor.map(lambda month: update(*month), months))
+        else:
+            for month in months:
+                update(*month)
+        return len(months)
+
+    def _mirror_for_update(self, mirror: Mirror | None) -> Mirror:
+        mirror = mirror if mirror is not None else self.mirror
+        if mirror is None:
+            raise ValueError("No mirror given and the client has no mirror")
+        return mirror
+
+    def _mirror_months(
+        self,
+        mirror: Mirror,
+        selected: list[str] | None,
+        until: dt.datetime | None,
+    ) -> Iterator[tuple[str, dt.datetime, dt.datetime, bool]]:
+        """
+        Yield endpoint, start and end of every month the mirror does not hold completely,
+        and whether the month can not change anymore.
+        """
+        now = dt.datetime.now(dt.UTC).replace(tzinfo=None, second=0, microsecond=0)
+        until = min(until.replace(tzinfo=None), now) if until is not None else now
+        if selected is None:
+            selected = [
+                url.strip("/")
+                for url, metadata in endpoints.items()
+                if "reader" in metadata
+            ]
+        for endpoint in selected:
+            endpoint = endpoint.strip("/")
+            if "reader" not in endpoints.get(f"/{endpoint}", {}):
+                raise ValueError(f"{endpoint} can not be mirrored")
+            final_before = now - self._freshness(endpoint)["immutable_after"]
+            month = _align(endpoints[f"/{endpoint}"]["first_data"], "month")
+            while month < until:
+                month_end = _next_boundary(month, "month")
+                if not mirror.complete(endpoint, month):
+                    yield (
+                        endpoint,
+                        month,
+                        min(month_end, now),
+                        month_end <= final_before,
+                    )
+                month = month_end
+
+    def sync(
+        self,
+        endpoint: str,
+        store: MutableMapping,
+        overlap: dt.timedelta = dt.timedelta(hours=6),
+        start: dt.datetime | None = None,
+    ) -> pd.DataFrame:
+        """
+        Bring the data of endpoint in store up to date and return the data that was requested.
+        Only the timeframe after the last row in store, minus overlap, is requested. Rows of that
+        timeframe are replaced by the new data, so revisions are picked up and repeating a sync
+        does not duplicate rows. Dates are always transformed.
+
+            endpoint -- url of the endpoint without leading or trailing "/", e.g. "NrvSaldo/NRVSaldo/Betrieblich"
+            store -- mapping from endpoint to dataframe, e.g. a ParquetStore or a dict
+            overlap -- timeframe before the last row that is requested again to catch late revisions
+            start -- first date requested if the store holds no data of the endpoint
+                     (default: first data of the endpoint)
+        """
+        endpoint = endpoint.strip("/")
+        dt_begin, dt_end = self._sync_timeframe(endpoint, store, overlap, start)
+        df = self._sync_reader(endpoint)(dt_begin, dt_end)
+        return self._sync_merge(endpoint, store, dt_begin, df)
+
+    def _sync_timeframe(
+        self,
+        endpoint: str,
+        store: MutableMapping,
+        overlap: dt.timedelta,
+        start: dt.datetime | None,
+    ) -> tuple[dt.datetime, dt.datetime]:
+        metadata = endpoints.get(f"/{endpoint}")
+        if metadata is None or "reader" not in metadata:
+            raise ValueError(f"{endpoint} can not be synchronized")
+        existing = store.get(endpoint)
+        if existing is not None and len(existing) > 0:
+            last = pd.Timestamp(_row_starts(existing, endpoint).max()).to_pydatetime()
+            dt_begin = (last - overlap).replace(minute=0, second=0, microsecond=0)
+        else:
+            dt_begin = start if start is not None else metadata["first_data"]
+        dt_end = dt.datetime.now(dt.UTC).replace(tzinfo=None, second=0, microsecond=0)
+        return dt_begin.replace(tzinfo=None), dt_end
+
+    def _sync_reader(
+        self,
+        endpoint: str,
+        transform_dates: bool = True,
+        columns: list[str] | None = None,
+        backend: str | None = "pandas",
+    ) -> Callable:
+        # sync and the mirror store pandas Dataframes, whatever the backend of the client is
+        reader = getattr(self, endpoints[f"/{endpoint}"]["reader"])
+        # readers of endpoints without separate date columns have no transform_dates
+        if "transform_dates" in inspect.signature(reader).parameters:
+            return functools.partial(
+                reader,
+                transform_dates=transform_dates,
+                columns=columns,
+                backend=backend,
+            )
+        return functools.partial(reader, columns=columns, backend=backend)
+
+    def stream(
+        self,
+        endpoint: str,
+        dt_begin: dt.datetime | None = None,
+        dt_end: dt.datetime | None = None,
+        chunk: str | dt.timedelta = "month",
+        transform_dates: bool = True,
+        columns: list[str] | None = None,
+        read_ahead: int = 1,
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Yield the data of endpoint between dt_begin and dt_end as one dataframe per chunk, in time order.
+        Only the yielded chunk and up to read_ahead chunks that are requested in the background are held
+        in memory, so long timeframes can be processed without loading them at once.
+
+            endpoint -- url of the endpoint without leading or trailing "/", e.g. "NrvSaldo/NRVSaldo/Betrieblich"
+            dt_begin -- datetime object for start of data in UTC (default: first data of the endpoint)
+            dt_end -- datetime object for end of data in UTC (default: now)
+            chunk -- "day", "month" or "year" to split at UTC calendar boundaries, or a timedelta
+            transform_dates -- see the reader of the endpoint (default: True)
+            columns -- only return these columns, see constants.endpoints for their names (default: all columns)
+            read_ahead -- number of chunks that are requested while the current one is processed.
+                          0 requests every chunk only when it is needed. (default: 1)
+        """
+        reader, timeframes = self._stream_timeframes(
+            endpoint, dt_begin, dt_end, chunk, transform_dates, columns
+        )
+        if read_ahead < 1:
+            for timeframe in timeframes:
+                yield reader(*timeframe)
+            return
+        pending = collections.deque()
+        with ThreadPoolExecutor(max_workers=read_ahead) as executor:
+            try:
+                for timeframe in timeframes:
+                    pending.append(executor.submit(reader, *timeframe))
+                    if len(pending) > read_ahead:
+                        yield pending.popleft().result()
+                while pending:
+                    yield pending.popleft().result()
+            finally:
+                # the consumer stopped early, requests that did not start yet are not needed anymore
+                for future in pending:
+                    future.cancel()
+
+    def _stream_timeframes(
+        self,
+        endpoint: str,
+        dt_begin: dt.datetime | None,
+        dt_end: dt.datetime | None,
+        chunk: str | dt.timedelta,
+        transform_dates: bool,
+        columns: list[str] | None,
+    ) -> tuple[Callable, list[tuple[dt.datetime, dt.datetime]]]:
+        endpoint = endpoint.strip("/")
+        metadata = endpoints.get(f"/{endpoint}")
+        if metadata is None or "reader" not in metadata:
+            raise ValueError(f"{endpoint} can not be streamed")
+        if dt_begin is None:
+            dt_begin = metadata["first_data"]
+        if dt_end is None:
+            dt_end = dt.datetime.now(dt.UTC).replace(second=0, microsecond=0)
+        dt_begin = dt_begin.replace(tzinfo=None)
+        dt_end = dt_end.replace(tzinfo=None)
+        if isinstance(chunk, str):
+            self._check_alignment(chunk)
+            timeframes = self._split_timeframe(dt_begin, dt_end, alignment=chunk)
+        else:
+            timeframes = self._split_timeframe(dt_begin, dt_end, chunk)
+        reader = self._sync_reader(endpoint, transform_dates, columns, backend=None)
+        return reader, timeframes
+
+    def _sync_merge(
+        self,
+        endpoint: str,
+        store: MutableMapping,
+        dt_begin: dt.datetime,
+        df: pd.DataFrame,
+    ) -> pd.DataFrame:
+        begin = np.datetime64(dt_begin, "ns")
+        df = df[_row_starts(df, endpoint) >= begin]
+        existing = store.get(endpoint)
+        if existing is not None and len(existing) > 0:
+            merged = self._concat(
+                [existing[_row_starts(existing, endpoint) < begin], df]
+            )
+        else:
+            merged = df
+        store[endpoint] = merged
+        return df
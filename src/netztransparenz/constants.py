@@ -1,309 +1,502 @@
 import datetime as dt
 
+# first_data -- first datapoint of the endpoint
+# reader -- method of NetztransparenzClient that reads a timeframe of the endpoint
+# layout -- how responses are parsed and their dates transformed, see registry.layouts
+# path -- url of endpoints that do not take the timeframe as path parameters, formatted with arguments of the reader
+# header, transformed_header -- columns of the raw data and of the data with transformed dates
 endpoints = {
     "/prognose/Solar": {
         "first_data": dt.datetime(2011, 3, 31, 22),
+        "reader": "prognose_solar",
+        "layout": "nt",
         "header": "Datum;von;Zeitzone von;bis;Zeitzone bis;50Hertz (MW);Amprion (MW);TenneT TSO (MW);TransnetBW (MW)",
         "transformed_header": "von;bis;50Hertz (MW);Amprion (MW);TenneT TSO (MW);TransnetBW (MW)",
     },
     "/prognose/Wind": {
         "first_data": dt.datetime(2011, 3, 31, 22),
+        "reader": "prognose_wind",
+        "layout": "nt",
         "header": "Datum;von;Zeitzone von;bis;Zeitzone bis;50Hertz (MW);Amprion (MW);TenneT TSO (MW);TransnetBW (MW)",
         "transformed_header": "von;bis;50Hertz (MW);Amprion (MW);TenneT TSO (MW);TransnetBW (MW)",
     },
     "/Spotmarktpreise": {
         "first_data": dt.datetime(2020, 12, 31, 23),
+        "reader": "spotmarktpreise",
+        "layout": "spotmarktpreise",
         "header": "Datum;von;Zeitzone von;bis;Zeitzone bis;Spotmarktpreis in ct/kWh",
         "transformed_header": "von;bis;Spotmarktpreis in ct/kWh",
     },
     "/hochrechnung/Solar": {
         "first_data": dt.datetime(2011, 3, 31, 22),
+        "reader": "hochrechnung_solar",
+        "layout": "nt",
         "header": "Datum;von;Zeitzone von;bis;Zeitzone bis;50Hertz (MW);Amprion (MW);TenneT TSO (MW);TransnetBW (MW)",
         "transformed_header": "von;bis;50Hertz (MW);Amprion (MW);TenneT TSO (MW);TransnetBW (MW)",
     },
     "/hochrechnung/Wind": {
         "first_data": dt.datetime(2011, 3, 31, 22),
+        "reader": "hochrechnung_wind",
+        "layout": "nt",
         "header": "Datum;von;Zeitzone von;bis;Zeitzone bis;50Hertz (MW);Amprion (MW);TenneT TSO (MW);TransnetBW (MW)",
         "transformed_header": "von;bis;50Hertz (MW);Amprion (MW);TenneT TSO (MW);TransnetBW (MW)",
     },
     "/onlineHochrechnung/Solar": {
         "first_data": dt.datetime(2011, 12, 31, 23),
+        "reader": "online_hochrechnung_solar",
+        "layout": "nt",
         "header": "Datum;von;Zeitzone von;bis;Zeitzone bis;50Hertz (MW);Amprion (MW);TenneT TSO (MW);TransnetBW (MW)",
         "transformed_header": "von;bis;50Hertz (MW);Amprion (MW);TenneT TSO (MW);TransnetBW (MW)",
     },
     "/onlineHochrechnung/Windonshore": {
         "first_data": dt.datetime(2011, 12, 31, 23),
+        "reader": "online_hochrechnung_windonshore",
+        "layout": "nt",
         "header": "Datum;von;Zeitzone von;bis;Zeitzone bis;50Hertz (MW);Amprion (MW);TenneT TSO (MW);TransnetBW (MW)",
         "transformed_header": "von;bis;50Hertz (MW);Amprion (MW);TenneT TSO (MW);TransnetBW (MW)",
     },
     "/onlineHochrechnung/Windoffshore": {
         "first_data": dt.datetime(2011, 12, 31, 23),
+        "reader": "online_hochrechnung_windoffshore",
+        "layout": "nt",
         "header": "Datum;von;Zeitzone von;bis;Zeitzone bis;50Hertz (MW);Amprion (MW);TenneT TSO (MW);TransnetBW (MW)",
         "transformed_header": "von;bis;50Hertz (MW);Amprion (MW);TenneT TSO (MW);TransnetBW (MW)",
     },
     "/NegativePreise": {
         "first_data": dt.datetime(2020, 12, 31, 23),
+        "reader": "negative_preise",
+        "layout": "negative_preise",
         "header": "Datum;Stunde1;Stunde3;Stunde4;Stunde6",
         "transformed_header": "Datum;Stunde1;Stunde3;Stunde4;Stunde6",
     },
     "/NegativePreise/1": {
         "first_data": dt.datetime(2020, 12, 31, 23),
+        "reader": "negative_preise_1h",
+        "layout": "negative_preise",
         "header": "Datum;Negativ",
         "transformed_header": "Datum;Negativ",
     },
     "/NegativePreise/3": {
         "first_data": dt.datetime(2020, 12, 31, 23),
+        "reader": "negative_preise_3h",
+        "layout": "negative_preise",
         "header": "Datum;Negativ",
         "transformed_header": "Datum;Negativ",
     },
     "/NegativePreise/4": {
         "first_data": dt.datetime(2020, 12, 31, 23),
+        "reader": "negative_preise_4h",
+        "layout": "negative_preise",
         "header": "Datum;Negativ",
         "transformed_header": "Datum;Negativ",
     },
     "/NegativePreise/6": {
         "first_data": dt.datetime(2020, 12, 31, 23),
+        "reader": "negative_preise_6h",
+        "layout": "negative_preise",
         "header": "Datum;Negativ",
         "transformed_header": "Datum;Negativ",
     },
     "/NegativePreise/15": {
         "first_data": dt.datetime(2020, 12, 31, 23),
+        "reader": "negative_preise_15m",
+        "layout": "negative_preise",
         "header": "Datum;Negativ",
         "transformed_header": "Datum;Negativ",
     },
     "/vermarktung/InanspruchnahmeAusgleichsenergie": {
         "first_data": dt.datetime(2011, 3, 31, 22),
+        "reader": "vermarktung_inanspruchnahme_ausgleichsenergie",
+        "layout": "vermarktung",
         "header": "Datum;von;Zeitzone von;bis;Zeitzone bis;50Hertz (kWh);Amprion (kWh);TenneT TSO (kWh);TransnetBW (kWh)",
         "transformed_header": "von;bis;50Hertz (kWh);Amprion (kWh);TenneT TSO (kWh);TransnetBW (kWh)",
     },
     "/vermarktung/UntertaegigeStrommengen": {
         "first_data": dt.datetime(2011, 3, 31, 22),
+        "reader": "vermarktung_untertaegige_strommengen",
+        "layout": "vermarktung",
         "header": "Datum;von;Zeitzone von;bis;Zeitzone bis;50Hertz (MW);Amprion (MW);TenneT TSO (MW);TransnetBW (MW)",
         "transformed_header": "von;bis;50Hertz (MW);Amprion (MW);TenneT TSO (MW);TransnetBW (MW)",
     },
     "/vermarktung/DifferenzEinspeiseprognose": {
         "first_data": dt.datetime(2011, 3, 31, 22),
+        "reader": "vermarktung_differenz_einspeiseprognose",
+        "layout": "vermarktung",
         "header": "Datum;von;Zeitzone von;bis;Zeitzone bis;50Hertz (MW);Amprion (MW);TenneT TSO (MW);TransnetBW (MW)",
         "transformed_header": "von;bis;50Hertz (MW);Amprion (MW);TenneT TSO (MW);TransnetBW (MW)",
     },
     "/vermarktung/VermarktungExaa": {
         "first_data": dt.datetime(2011, 12, 31, 23),
+        "reader": "vermarktung_exaa",
+        "layout": "vermarktung",
         "header": "Datum;von;Zeitzone von;bis;Zeitzone bis;50Hertz (MW);Amprion (MW);TenneT TSO (MW);TransnetBW (MW)",
         "transformed_header": "von;bis;50Hertz (MW);Amprion (MW);TenneT TSO (MW);TransnetBW (MW)",
     },
     "/vermarktung/VermarktungEpex": {
         "first_data": dt.datetime(2011, 12, 31, 23),
+        "reader": "vermarktung_epex",
+        "layout": "vermarktung",
         "header": "Datum;von;Zeitzone von;bis;Zeitzone bis;50Hertz (MW);Amprion (MW);TenneT TSO (MW);TransnetBW (MW)",
         "transformed_header": "von;bis;50Hertz (MW);Amprion (MW);TenneT TSO (MW);TransnetBW (MW)",
     },
     "/vermarktung/VermarktungsSonstige": {
         "first_data": dt.datetime(2011, 12, 31, 22),
+        "reader": "vermarktung_sonstige",
+        "layout": "vermarktung",
         "header": "Datum;von;Zeitzone von;bis;Zeitzone bis;50Hertz (MW);Amprion (MW);TenneT TSO (MW);TransnetBW (MW)",
         "transformed_header": "von;bis;50Hertz (MW);Amprion (MW);TenneT TSO (MW);TransnetBW (MW)",
     },
     "/vermarktung/VermarktungsSolar": {
         "first_data": dt.datetime(2013, 12, 31, 23),
+        "reader": "vermarktung_solar",
+        "layout": "vermarktung",
         "header": "Datum;von;Zeitzone von;bis;Zeitzone bis;50Hertz (MW);Amprion (MW);TenneT TSO (MW);TransnetBW (MW)",
         "transformed_header": "von;bis;50Hertz (MW);Amprion (MW);TenneT TSO (MW);TransnetBW (MW)",
     },
     "/vermarktung/VermarktungsWind": {
         "first_data": dt.datetime(2013, 12, 31, 23),
+        "reader": "vermarktung_wind",
+        "layout": "vermarktung",
         "header": "Datum;von;Zeitzone von;bis;Zeitzone bis;50Hertz (MW);Amprion (MW);TenneT TSO (MW);TransnetBW (MW)",
         "transformed_header": "von;bis;50Hertz (MW);Amprion (MW);TenneT TSO (MW);TransnetBW (MW)",
     },
     "/IdAep": {
         "first_data": dt.datetime(2020, 6, 30, 22),
+        "reader": "id_aep",
+        "layout": "id_aep",
         "header": "Datum von;(Uhrzeit) von;Zeitzone von;(Uhrzeit) bis;Zeitzone bis;ID AEP in €/MWh",
         "transformed_header": "von;bis;ID AEP in €/MWh",
     },
     "/marktpraemie": {
         "first_data": dt.datetime(2012, 1, 1),
+        "layout": "marktpraemie",
+        "path": "marktpraemie/{begin.month}/{begin.year}/{end.month}/{end.year}",
         "header": "Monat;MW-EPEX in ct/kWh;MW Wind Onshore in ct/kWh;PM Wind Onshore fernsteuerbar in ct/kWh;MW Wind Offshore in ct/kWh;PM Wind Offshore fernsteuerbar in ct/kWh;MW Solar in ct/kWh;PM Solar fernsteuerbar in ct/kWh;MW steuerbar in ct/kWh;PM steuerbar in ct/kWh;Negative Stunden (6H);Negative Stunden (4H);Negative Stunden (3H);Negative Stunden (1H);Negative Stunden (15MIN)",
         "transformed_header": "Monat;MW-EPEX in ct/kWh;MW Wind Onshore in ct/kWh;PM Wind Onshore fernsteuerbar in ct/kWh;MW Wind Offshore in ct/kWh;PM Wind Offshore fernsteuerbar in ct/kWh;MW Solar in ct/kWh;PM Solar fernsteuerbar in ct/kWh;MW steuerbar in ct/kWh;PM steuerbar in ct/kWh;Negative Stunden (6H);Negative Stunden (4H);Negative Stunden (3H);Negative Stunden (1H);Negative Stunden (15MIN)",
     },
     "/Jahresmarktpraemie": {
         "first_data": dt.datetime(2020, 1, 1),
+        "layout": "jahresmarktpraemie",
+        "path": "Jahresmarktpraemie/{year}",
         "header": "Alle Werte in ct/kWh;",
         "transformed_header": "Alle Werte in ct/kWh;JW;JW Wind an Land;JW Wind auf See;JW Solar",
     },
     "/redispatch": {
         "first_data": dt.datetime(2021, 1, 1),
+        "reader": "redispatch",
+        "layout": "systemdienstleistungen",
         "header": "BEGINN_DATUM;BEGINN_UHRZEIT;ZEITZONE_VON;ENDE_DATUM;ENDE_UHRZEIT;ZEITZONE_BIS;GRUND_DER_MASSNAHME;RICHTUNG;MITTLERE_LEISTUNG_MW;MAXIMALE_LEISTUNG_MW;GESAMTE_ARBEIT_MWH;ANWEISENDER_UENB;ANFORDERNDER_UENB;BETROFFENE_ANLAGE;PRIMAERENERGIEART",
         "transformed_header": "BEGINN;ENDE;GRUND_DER_MASSNAHME;RICHTUNG;MITTLERE_LEISTUNG_MW;MAXIMALE_LEISTUNG_MW;GESAMTE_ARBEIT_MWH;ANWEISENDER_UENB;ANFORDERNDER_UENB;BETROFFENE_ANLAGE;PRIMAERENERGIEART",
     },
     "/Kapazitaetsreserve": {
         "first_data": dt.datetime(2021, 1, 1),
+        "reader": "kapazitaetsreserve",
+        "layout": "systemdienstleistungen",
         "header": "BEGINN_DATUM;BEGINN_UHRZEIT;ZEITZONE_VON;ENDE_DATUM;ENDE_UHRZEIT;ZEITZONE_BIS;GRUND_DER_MASSNAHME;RICHTUNG;MITTLERE_LEISTUNG_MW;MAXIMALE_LEISTUNG_MW;GESAMTE_ARBEIT_MWH;ANWEISENDER_UENB;ANFORDERNDER_UENB;BETROFFENE_ANLAGE;PRIMAERENERGIEART",
         "transformed_header": "BEGINN;ENDE;GRUND_DER_MASSNAHME;RICHTUNG;MITTLERE_LEISTUNG_MW;MAXIMALE_LEISTUNG_MW;GESAMTE_ARBEIT_MWH;ANWEISENDER_UENB;ANFORDERNDER_UENB;BETROFFENE_ANLAGE;PRIMAERENERGIEART",
     },
     "/VorhaltungkRD": {
         "first_data": dt.datetime(2025, 1, 1),
+        "reader": "vorhaltung_krd",
+        "layout": "systemdienstleistungen",
         "header": "BEGINN_DATUM;BEGINN_UHRZEIT;ZEITZONE_VON;ENDE_DATUM;ENDE_UHRZEIT;ZEITZONE_BIS;GRUND_DER_MASSNAHME;RICHTUNG;MITTLERE_LEISTUNG_MW;MAXIMALE_LEISTUNG_MW;GESAMTE_ARBEIT_MWH;ANWEISENDER_UENB;ANFORDERNDER_UENB;BETROFFENE_ANLAGE;PRIMAERENERGIEART",
         "transformed_header": "BEGINN;ENDE;GRUND_DER_MASSNAHME;RICHTUNG;MITTLERE_LEISTUNG_MW;MAXIMALE_LEISTUNG_MW;GESAMTE_ARBEIT_MWH;ANWEISENDER_UENB;ANFORDERNDER_UENB;BETROFFENE_ANLAGE;PRIMAERENERGIEART",
     },
     "/TrafficLight": {
         "first_data": dt.datetime(2021, 9, 21, 22),
+        "reader": "traffic_light",
+        "layout": "json",
         "header": "From;To;Value",
         "transformed_header": "From;To;Value",
     },
     "/NrvSaldo/NRVSaldo/Betrieblich": {
         "first_data": dt.datetime(2014, 3, 25, 23),
+        "reader": "nrvsaldo_nrvsaldo_betrieblich",
+        "layout": "nrvsaldo",
         "header": "Datum;Zeitzone;von;bis;Datenkategorie;Datentyp;Einheit;Deutschland;AEP Knappheitskomponente;Mrl-Mol-Abweichung;Srl-Mol-Abweichung",
         "transformed_header": "von;bis;Datenkategorie;Datentyp;Einheit;Deutschland;AEP Knappheitskomponente;Mrl-Mol-Abweichung;Srl-Mol-Abweichung",
     },
     "/NrvSaldo/NRVSaldo/Qualitaetsgesichert": {
         "first_data": dt.datetime(2013, 12, 31, 23),
+        "reader": "nrvsaldo_nrvsaldo_qualitaetsgesichert",
+        "layout": "nrvsaldo",
         "header": "Datum;Zeitzone;von;bis;Datenkategorie;Datentyp;Einheit;Deutschland",
         "transformed_header": "von;bis;Datenkategorie;Datentyp;Einheit;Deutschland",
     },
     "/NrvSaldo/RZSaldo/Betrieblich": {
         "first_data": dt.datetime(2011, 6, 26, 22),
+        "reader": "nrvsaldo_rzsaldo_betrieblich",
+        "layout": "nrvsaldo",
         "header": "Datum;Zeitzone;von;bis;Datenkategorie;Datentyp;Einheit;50Hertz;Amprion;TenneT TSO;TransnetBW",
         "transformed_header": "von;bis;Datenkategorie;Datentyp;Einheit;50Hertz;Amprion;TenneT TSO;TransnetBW",
     },
     "/NrvSaldo/RZSaldo/Qualitaetsgesichert": {
         "first_data": dt.datetime(2014, 4, 30, 22),
+        "reader": "nrvsaldo_rzsaldo_qualitaetsgesichert",
+        "layout": "nrvsaldo",
         "header": "Datum;Zeitzone;von;bis;Datenkategorie;Datentyp;Einheit;50Hertz;Amprion;TenneT TSO;TransnetBW",
         "transformed_header": "von;bis;Datenkategorie;Datentyp;Einheit;50Hertz;Amprion;TenneT TSO;TransnetBW",
     },
     "/NrvSaldo/AktivierteSRL/Betrieblich": {
         "first_data": dt.datetime(2011, 6, 26, 22),
+        "reader": "nrvsaldo_aktivierte_srl_betrieblich",
+        "layout": "nrvsaldo",
         "header": "Datum;Zeitzone;von;bis;Datenkategorie;Datentyp;Einheit;50Hertz (Positiv);Amprion (Positiv);TenneT TSO (Positiv);TransnetBW (Positiv);Deutschland (Positiv);50Hertz (Negativ);Amprion (Negativ);TenneT TSO (Negativ);TransnetBW (Negativ);Deutschland (Negativ);MOL-Abweichung",
         "transformed_header": "von;bis;Datenkategorie;Datentyp;Einheit;50Hertz (Positiv);Amprion (Positiv);TenneT TSO (Positiv);TransnetBW (Positiv);Deutschland (Positiv);50Hertz (Negativ);Amprion (Negativ);TenneT TSO (Negativ);TransnetBW (Negativ);Deutschland (Negativ);MOL-Abweichung",
     },
     "/NrvSaldo/AktivierteSRL/Qualitaetsgesichert": {
         "first_data": dt.datetime(2014, 4, 30, 22),
+        "reader": "nrvsaldo_aktivierte_srl_qualitaetsgesichert",
+        "layout": "nrvsaldo",
         "header": "Datum;Zeitzone;von;bis;Datenkategorie;Datentyp;Einheit;50Hertz (Positiv);Amprion (Positiv);TenneT TSO (Positiv);TransnetBW (Positiv);Deutschland (Positiv);50Hertz (Negativ);Amprion (Negativ);TenneT TSO (Negativ);TransnetBW (Negativ);Deutschland (Negativ)",
         "transformed_header": "von;bis;Datenkategorie;Datentyp;Einheit;50Hertz (Positiv);Amprion (Positiv);TenneT TSO (Positiv);TransnetBW (Positiv);Deutschland (Positiv);50Hertz (Negativ);Amprion (Negativ);TenneT TSO (Negativ);TransnetBW (Negativ);Deutschland (Negativ)",
     },
     "/NrvSaldo/AktivierteMRL/Betrieblich": {
         "first_data": dt.datetime(2011, 6, 26, 22),
+        "reader": "nrvsaldo_aktivierte_mrl_betrieblich",
+        "layout": "nrvsaldo",
         "header": "Datum;Zeitzone;von;bis;Datenkategorie;Datentyp;Einheit;50Hertz (Positiv);Amprion (Positiv);TenneT TSO (Positiv);TransnetBW (Positiv);Deutschland (Positiv);50Hertz (Negativ);Amprion (Negativ);TenneT TSO (Negativ);TransnetBW (Negativ);Deutschland (Negativ);MOL-Abweichung",
         "transformed_header": "von;bis;Datenkategorie;Datentyp;Einheit;50Hertz (Positiv);Amprion (Positiv);TenneT TSO (Positiv);TransnetBW (Positiv);Deutschland (Positiv);50Hertz (Negativ);Amprion (Negativ);TenneT TSO (Negativ);TransnetBW (Negativ);Deutschland (Negativ);MOL-Abweichung",
     },
     "/NrvSaldo/AktivierteMRL/Qualitaetsgesichert": {
         "first_data": dt.datetime(2014, 4, 30, 22),
+        "reader": "nrvsaldo_aktivierte_mrl_qualitaetsgesichert",
+        "layout": "nrvsaldo",
         "header": "Datum;Zeitzone;von;bis;Datenkategorie;Datentyp;Einheit;50Hertz (Positiv);Amprion (Positiv);TenneT TSO (Positiv);TransnetBW (Positiv);Deutschland (Positiv);50Hertz (Negativ);Amprion (Negativ);TenneT TSO (Negativ);TransnetBW (Negativ);Deutschland (Negativ)",
         "transformed_header": "von;bis;Datenkategorie;Datentyp;Einheit;50Hertz (Positiv);Amprion (Positiv);TenneT TSO (Positiv);TransnetBW (Positiv);Deutschland (Positiv);50Hertz (Negativ);Amprion (Negativ);TenneT TSO (Negativ);TransnetBW (Negativ);Deutschland (Negativ)",
     },
     "/NrvSaldo/SRLOptimierung/Betrieblich": {
         "first_data": dt.datetime(2022, 6, 23, 22),
+        "reader": "nrvsaldo_srl_optimierung_betrieblich",
+        "layout": "nrvsaldo",
         "header": "Datum;Zeitzone;von;bis;Datenkategorie;Datentyp;Einheit;50Hertz (Positiv);Amprion (Positiv);TenneT TSO (Positiv);TransnetBW (Positiv);Deutschland (Positiv);50Hertz (Negativ);Amprion (Negativ);TenneT TSO (Negativ);TransnetBW (Negativ);Deutschland (Negativ)",
         "transformed_header": "von;bis;Datenkategorie;Datentyp;Einheit;50Hertz (Positiv);Amprion (Positiv);TenneT TSO (Positiv);TransnetBW (Positiv);Deutschland (Positiv);50Hertz (Negativ);Amprion (Negativ);TenneT TSO (Negativ);TransnetBW (Negativ);Deutschland (Negativ)",
     },
     "/NrvSaldo/SRLOptimierung/Qualitaetsgesichert": {
         "first_data": dt.datetime(2022, 6, 21, 22),
+        "reader": "nrvsaldo_srl_optimierung_qualitaetsgesichert",
+        "layout": "nrvsaldo",
         "header": "Datum;Zeitzone;von;bis;Datenkategorie;Datentyp;Einheit;50Hertz (Positiv);Amprion (Positiv);TenneT TSO (Positiv);TransnetBW (Positiv);Deutschland (Positiv);50Hertz (Negativ);Amprion (Negativ);TenneT TSO (Negativ);TransnetBW (Negativ);Deutschland (Negativ)",
         "transformed_header": "von;bis;Datenkategorie;Datentyp;Einheit;50Hertz (Positiv);Amprion (Positiv);TenneT TSO (Positiv);TransnetBW (Positiv);Deutschland (Positiv);50Hertz (Negativ);Amprion (Negativ);TenneT TSO (Negativ);TransnetBW (Negativ);Deutschland (Negativ)",
     },
     "/NrvSaldo/MRLOptimierung/Betrieblich": {
         "first_data": dt.datetime(2011, 6, 26, 22),
+        "reader": "nrvsaldo_mrl_optimierung_betrieblich",
+        "layout": "nrvsaldo",
         "header": "Datum;Zeitzone;von;bis;Datenkategorie;Datentyp;Einheit;50Hertz (Positiv);Amprion (Positiv);TenneT TSO (Positiv);TransnetBW (Positiv);Deutschland (Positiv);50Hertz (Negativ);Amprion (Negativ);TenneT TSO (Negativ);TransnetBW (Negativ);Deutschland (Negativ)",
         "transformed_header": "von;bis;Datenkategorie;Datentyp;Einheit;50Hertz (Positiv);Amprion (Positiv);TenneT TSO (Positiv);TransnetBW (Positiv);Deutschland (Positiv);50Hertz (Negativ);Amprion (Negativ);TenneT TSO (Negativ);TransnetBW (Negativ);Deutschland (Negativ)",
     },
     "/NrvSaldo/MRLOptimierung/Qualitaetsgesichert": {
         "first_data": dt.datetime(2014, 5, 31, 22),
+        "reader": "nrvsaldo_mrl_optimierung_qualitaetsgesichert",
+        "layout": "nrvsaldo",
         "header": "Datum;Zeitzone;von;bis;Datenkategorie;Datentyp;Einheit;50Hertz (Positiv);Amprion (Positiv);TenneT TSO (Positiv);TransnetBW (Positiv);Deutschland (Positiv);50Hertz (Negativ);Amprion (Negativ);TenneT TSO (Negativ);TransnetBW (Negativ);Deutschland (Negativ)",
         "transformed_header": "von;bis;Datenkategorie;Datentyp;Einheit;50Hertz (Positiv);Amprion (Positiv);TenneT TSO (Positiv);TransnetBW (Positiv);Deutschland (Positiv);50Hertz (Negativ);Amprion (Negativ);TenneT TSO (Negativ);TransnetBW (Negativ);Deutschland (Negativ)",
     },
     "/NrvSaldo/PRL/Betrieblich": {
         "first_data": dt.datetime(2022, 6, 21, 22),
+        "reader": "nrvsaldo_prl_betrieblich",
+        "layout": "nrvsaldo",
         "header": "Datum;Zeitzone;von;bis;Datenkategorie;Datentyp;Einheit;50Hertz (Positiv);Amprion (Positiv);TenneT TSO (Positiv);TransnetBW (Positiv);Deutschland (Positiv);50Hertz (Negativ);Amprion (Negativ);TenneT TSO (Negativ);TransnetBW (Negativ);Deutschland (Negativ)",
         "transformed_header": "von;bis;Datenkategorie;Datentyp;Einheit;50Hertz (Positiv);Amprion (Positiv);TenneT TSO (Positiv);TransnetBW (Positiv);Deutschland (Positiv);50Hertz (Negativ);Amprion (Negativ);TenneT TSO (Negativ);TransnetBW (Negativ);Deutschland (Negativ)",
     },
     "/NrvSaldo/PRL/Qualitaetsgesichert": {
         "first_data": dt.datetime(2022, 6, 21, 22),
+        "reader": "nrvsaldo_prl_qualitaetsgesichert",
+        "layout": "nrvsaldo",
         "header": "Datum;Zeitzone;von;bis;Datenkategorie;Datentyp;Einheit;50Hertz (Positiv);Amprion (Positiv);TenneT TSO (Positiv);TransnetBW (Positiv);Deutschland (Positiv);50Hertz (Negativ);Amprion (Negativ);TenneT TSO (Negativ);TransnetBW (Negativ);Deutschland (Negativ)",
         "transformed_header": "von;bis;Datenkategorie;Datentyp;Einheit;50Hertz (Positiv);Amprion (Positiv);TenneT TSO (Positiv);TransnetBW (Positiv);Deutschland (Positiv);50Hertz (Negativ);Amprion (Negativ);TenneT TSO (Negativ);TransnetBW (Negativ);Deutschland (Negativ)",
     },
     "/NrvSaldo/Difference/Betrieblich": {
         "first_data": dt.datetime(2022, 6, 21, 22),
+        "reader": "nrvsaldo_difference_betrieblich",
+        "layout": "nrvsaldo",
         "header": "Datum;Zeitzone;von;bis;Datenkategorie;Datentyp;Einheit;50Hertz (Positiv);Amprion (Positiv);TenneT TSO (Positiv);TransnetBW (Positiv);Deutschland (Positiv);50Hertz (Negativ);Amprion (Negativ);TenneT TSO (Negativ);TransnetBW (Negativ);Deutschland (Negativ)",
         "transformed_header": "von;bis;Datenkategorie;Datentyp;Einheit;50Hertz (Positiv);Amprion (Positiv);TenneT TSO (Positiv);TransnetBW (Positiv);Deutschland (Positiv);50Hertz (Negativ);Amprion (Negativ);TenneT TSO (Negativ);TransnetBW (Negativ);Deutschland (Negativ)",
     },
     "/NrvSaldo/Difference/Qualitaetsgesichert": {
         "first_data": dt.datetime(2022, 6, 21, 22),
+        "reader": "nrvsaldo_difference_qualitaetsgesichert",
+        "layout": "nrvsaldo",
         "header": "Datum;Zeitzone;von;bis;Datenkategorie;Datentyp;Einheit;50Hertz (Positiv);Amprion (Positiv);TenneT TSO (Positiv);TransnetBW (Positiv);Deutschland (Positiv);50Hertz (Negativ);Amprion (Negativ);TenneT TSO (Negativ);TransnetBW (Negativ);Deutschland (Negativ)",
         "transformed_header": "von;bis;Datenkategorie;Datentyp;Einheit;50Hertz (Positiv);Amprion (Positiv);TenneT TSO (Positiv);TransnetBW (Positiv);Deutschland (Positiv);50Hertz (Negativ);Amprion (Negativ);TenneT TSO (Negativ);TransnetBW (Negativ);Deutschland (Negativ)",
     },
     "/NrvSaldo/Zusatzmassnahmen/Betrieblich": {
         "first_data": dt.datetime(2019, 12, 31, 23),
+        "reader": "nrvsaldo_zusatzmassnahmen_betrieblich",
+        "layout": "nrvsaldo",
         "header": "Datum;Zeitzone;von;bis;Datenkategorie;Datentyp;Einheit;50Hertz (Positiv);Amprion (Positiv);TenneT TSO (Positiv);TransnetBW (Positiv);Deutschland (Positiv);50Hertz (Negativ);Amprion (Negativ);TenneT TSO (Negativ);TransnetBW (Negativ);Deutschland (Negativ)",
         "transformed_header": "von;bis;Datenkategorie;Datentyp;Einheit;50Hertz (Positiv);Amprion (Positiv);TenneT TSO (Positiv);TransnetBW (Positiv);Deutschland (Positiv);50Hertz (Negativ);Amprion (Negativ);TenneT TSO (Negativ);TransnetBW (Negativ);Deutschland (Negativ)",
     },
     "/NrvSaldo/Zusatzmassnahmen/Qualitaetsgesichert": {
         "first_data": dt.datetime(2013, 12, 31, 23),
+        "reader": "nrvsaldo_zusatzmassnahmen_qualitaetsgesichert",
+        "layout": "nrvsaldo",
         "header": "Datum;Zeitzone;von;bis;Datenkategorie;Datentyp;Einheit;50Hertz (Positiv);Amprion (Positiv);TenneT TSO (Positiv);TransnetBW (Positiv);Deutschland (Positiv);50Hertz (Negativ);Amprion (Negativ);TenneT TSO (Negativ);TransnetBW (Negativ);Deutschland (Negativ)",
         "transformed_header": "von;bis;Datenkategorie;Datentyp;Einheit;50Hertz (Positiv);Amprion (Positiv);TenneT TSO (Positiv);TransnetBW (Positiv);Deutschland (Positiv);50Hertz (Negativ);Amprion (Negativ);TenneT TSO (Negativ);TransnetBW (Negativ);Deutschland (Negativ)",
     },
     "/NrvSaldo/Nothilfe/Betrieblich": {
         "first_data": dt.datetime(2025, 5, 31, 22),
+        "reader": "nrvsaldo_nothilfe_betrieblich",
+        "layout": "nrvsaldo",
         "header": "Datum;Zeitzone;von;bis;Datenkategorie;Datentyp;Einheit;50Hertz (Positiv);Amprion (Positiv);TenneT TSO (Positiv);TransnetBW (Positiv);Deutschland (Positiv);50Hertz (Negativ);Amprion (Negativ);TenneT TSO (Negativ);TransnetBW (Negativ);Deutschland (Negativ)",
         "transformed_header": "von;bis;Datenkategorie;Datentyp;Einheit;50Hertz (Positiv);Amprion (Positiv);TenneT TSO (Positiv);TransnetBW (Positiv);Deutschland (Positiv);50Hertz (Negativ);Amprion (Negativ);TenneT TSO (Negativ);TransnetBW (Negativ);Deutschland (Negativ)",
     },
     "/NrvSaldo/Nothilfe/Qualitaetsgesichert": {
         "first_data": dt.datetime(2013, 12, 31, 23),
+        "reader": "nrvsaldo_nothilfe_qualitaetsgesichert",
+        "layout": "nrvsaldo",
         "header": "Datum;Zeitzone;von;bis;Datenkategorie;Datentyp;Einheit;50Hertz (Positiv);Amprion (Positiv);TenneT TSO (Positiv);TransnetBW (Positiv);Deutschland (Positiv);50Hertz (Negativ);Amprion (Negativ);TenneT TSO (Negativ);TransnetBW (Negativ);Deutschland (Negativ)",
         "transformed_header": "von;bis;Datenkategorie;Datentyp;Einheit;50Hertz (Positiv);Amprion (Positiv);TenneT TSO (Positiv);TransnetBW (Positiv);Deutschland (Positiv);50Hertz (Negativ);Amprion (Negativ);TenneT TSO (Negativ);TransnetBW (Negativ);Deutschland (Negativ)",
     },
     "/NrvSaldo/reBAP/Qualitaetsgesichert": {
         "first_data": dt.datetime(2013, 12, 31, 23),
+        "reader": "nrvsaldo_rebap_qualitaetsgesichert",
+        "layout": "nrvsaldo",
         "header": "Datum;Zeitzone;von;bis;Datenkategorie;Datentyp;Einheit;reBAP unterdeckt;reBAP ueberdeckt",
         "transformed_header": "von;bis;Datenkategorie;Datentyp;Einheit;reBAP unterdeckt;reBAP ueberdeckt",
     },
     "/NrvSaldo/AEPModule/Qualitaetsgesichert": {
         "first_data": dt.datetime(2022, 6, 21, 22),
+        "reader": "nrvsaldo_aep_module_qualitaetsgesichert",
+        "layout": "nrvsaldo",
         "header": "Datum;Zeitzone;von;bis;Datenkategorie;Datentyp;Einheit;AEP Modul 1;AEP Modul 2;AEP Modul 3",
         "transformed_header": "von;bis;Datenkategorie;Datentyp;Einheit;AEP Modul 1;AEP Modul 2;AEP Modul 3",
     },
     "/NrvSaldo/FinanzielleWirkungAEPModule/Qualitaetsgesichert": {
         "first_data": dt.datetime(2022, 6, 21, 22),
+        "reader": "nrvsaldo_finanzielle_wirkung_aep_module_qualitaetsgesichert",
+        "layout": "nrvsaldo",
         "header": "Datum;Zeitzone;von;bis;Datenkategorie;Datentyp;Einheit;AEP Modul 1;AEP Modul 2;AEP Modul 3",
         "transformed_header": "von;bis;Datenkategorie;Datentyp;Einheit;AEP Modul 1;AEP Modul 2;AEP Modul 3",
     },
     "/NrvSaldo/AepSchaetzer/Betrieblich": {
         "first_data": dt.datetime(2023, 3, 13, 23),
+        "reader": "nrvsaldo_aep_schaetzer_betrieblich",
+        "layout": "nrvsaldo",
         "header": "Datum;Zeitzone;von;bis;Datenkategorie;Datentyp;Einheit;AEP-Schätzer;Status",
         "transformed_header": "von;bis;Datenkategorie;Datentyp;Einheit;AEP-Schätzer;Status",
     },
     "/NrvSaldo/AbschaltbareLasten/Betrieblich": {
         "first_data": dt.datetime(2023, 11, 30, 23),
+        "reader": "nrvsaldo_abschaltbare_lasten_betrieblich",
+        "layout": "nrvsaldo",
         "header": "Datum;Zeitzone;von;bis;Datenkategorie;Datentyp;Einheit;Deutschland (Positiv);50Hertz (Positiv);Amprion (Positiv);TenneT TSO (Positiv);TransnetBW (Positiv)",
         "transformed_header": "von;bis;Datenkategorie;Datentyp;Einheit;Deutschland (Positiv);50Hertz (Positiv);Amprion (Positiv);TenneT TSO (Positiv);TransnetBW (Positiv)",
     },
     "/NrvSaldo/AbschaltbareLasten/Qualitaetsgesichert": {
         "first_data": dt.datetime(2023, 11, 30, 23),
+        "reader": "nrvsaldo_abschaltbare_lasten_qualitaetsgesichert",
+        "layout": "nrvsaldo",
         "header": "Datum;Zeitzone;von;bis;Datenkategorie;Datentyp;Einheit;Deutschland (Positiv);50Hertz (Positiv);Amprion (Positiv);TenneT TSO (Positiv);TransnetBW (Positiv)",
         "transformed_header": "von;bis;Datenkategorie;Datentyp;Einheit;Deutschland (Positiv);50Hertz (Positiv);Amprion (Positiv);TenneT TSO (Positiv);TransnetBW (Positiv)",
     },
     "/NrvSaldo/VoAA/Qualitaetsgesichert": {
         "first_data": dt.datetime(2023, 11, 1),
+        "reader": "nrvsaldo_voaa_qualitaetsgesichert",
+        "layout": "nrvsaldo",
         "header": "Datum;Zeitzone;von;bis;Datenkategorie;Datentyp;Einheit;VoAA (Positiv);VoAA (Negativ)",
         "transformed_header": "von;bis;Datenkategorie;Datentyp;Einheit;VoAA (Positiv);VoAA (Negativ)",
     },
     "/NrvSaldo/SrlMolAbweichungen/Betrieblich": {
         "first_data": dt.datetime(2023, 12, 31, 23),
+        "reader": "nrvsaldo_srl_mol_abweichungen_betrieblich",
+        "layout": "srl_mol_abweichungen",
         "header": "Datum von;Zeitzone von;Uhrzeit von;Datum bis;Zeitzone bis;Uhrzeit bis;Datenkategorie;Datentyp;Abruf-ÜNB;Störung in der MOL-Verarbeitung;Trennung von SRL-Kooperation;Sonstiges",
         "transformed_header": "von;bis;Datenkategorie;Datentyp;Abruf-ÜNB;Störung in der MOL-Verarbeitung;Trennung von SRL-Kooperation;Sonstiges",
     },
     "/NrvSaldo/MrlMolAbweichungen/Betrieblich": {
         "first_data": dt.datetime(2023, 12, 31, 23),
+        "reader": "nrvsaldo_mrl_mol_abweichungen_betrieblich",
+        "layout": "nrvsaldo",
         "header": "Datum;Zeitzone;von;bis;Datenkategorie;Datentyp;Netzengpass;Technische Störung Abrufsystem;Technische Störung Anbieter;Test Aktivierung",
         "transformed_header": "von;bis;Datenkategorie;Datentyp;Netzengpass;Technische Störung Abrufsystem;Technische Störung Anbieter;Test Aktivierung",
     },
     "/AusgewieseneABSM": {
         "first_data": dt.datetime(2024, 9, 30, 22),
+        "reader": "ausgewiesene_absm",
+        "layout": "abregelung",
         "header": "Datum;Zeitzone;von;bis;Datenkategorie;Einheit;H1;H2;T1;T2;T3;T4;T5;T6",
         "transformed_header": "von;bis;Datenkategorie;Einheit;H1;H2;T1;T2;T3;T4;T5;T6",
     },
     "/ZugeteilteABSM": {
         "first_data": dt.datetime(2024, 9, 30, 22),
+        "reader": "zugeteilte_absm",
+        "layout": "abregelung",
         "header": "Datum;Zeitzone;von;bis;Datenkategorie;Einheit;H1;H2;T1;T2;T3;T4;T5;T6",
         "transformed_header": "von;bis;Datenkategorie;Einheit;H1;H2;T1;T2;T3;T4;T5;T6",
     },
     "/Erzeugungsverbot": {
         "first_data": dt.datetime(2024, 9, 30, 22),
+        "reader": "erzeugungsverbot",
+        "layout": "abregelung",
         "header": "Datum;Zeitzone;von;bis;Datenkategorie;H1;H2;T1;T2;T3;T4;T5;T6",
         "transformed_header": "von;bis;Datenkategorie;H1;H2;T1;T2;T3;T4;T5;T6",
     },
 }
+
+# How long cached data of an endpoint family may still be revised by the API, see ChunkCache.
+# The family of an endpoint is the last part of its url, other endpoints use "default".
+# Data of the current UTC day is never cached.
+#   immutable_after -- cached timeframes that ended longer ago are never requested again
+#   ttl -- cached timeframes that ended more recently are requested again after this timedelta
+freshness = {
+    "default": {
+        "immutable_after": dt.timedelta(days=7),
+        "ttl": dt.timedelta(hours=1),
+    },
+    # operational data, revised until the quality-assured data is published
+    "Betrieblich": {
+        "immutable_after": dt.timedelta(days=90),
+        "ttl": dt.timedelta(hours=1),
+    },
+    # final once published, which happens several weeks after the fact
+    "Qualitaetsgesichert": {
+        "immutable_after": dt.timedelta(days=60),
+        "ttl": dt.timedelta(days=1),
+    },
+}
+
+# Types of the columns of the raw data, see netztransparenz.schema. Columns that are not listed
+# and do not match number_columns are typed by the parser.
+#   string -- text that is transformed into timestamps
+#   category -- text with few distinct values, stored once per value
+column_types = {
+    "Datum": "string",
+    "von": "string",
+    "bis": "string",
+    "Datum von": "string",
+    "Datum bis": "string",
+    "Uhrzeit von": "string",
+    "Uhrzeit bis": "string",
+    "(Uhrzeit) von": "string",
+    "(Uhrzeit) bis": "string",
+    "BEGINN_DATUM": "string",
+    "BEGINN_UHRZEIT": "string",
+    "ENDE_DATUM": "string",
+    "ENDE_UHRZEIT": "string",
+    # names of the rows of the transposed market premium tables
+    "Alle Werte in ct/kWh": "string",
+    "Zeitzone": "category",
+    "Zeitzone von": "category",
+    "Zeitzone bis": "category",
+    "ZEITZONE_VON": "category",
+    "ZEITZONE_BIS": "category",
+    "Datenkategorie": "category",
+    "Datentyp": "category",
+    "Einheit": "category",
+    "Status": "category",
+    "Abruf-ÜNB": "category",
+    "GRUND_DER_MASSNAHME": "category",
+    "RICHTUNG": "category",
+    "ANWEISENDER_UENB": "category",
+    "ANFORDERNDER_UENB": "category",
+    "BETROFFENE_ANLAGE": "category",
+    "PRIMAERENERGIEART": "category",
+}
+
+# Regular expression for the names of columns that hold measured values, they are read as floats
+number_columns = (
+    r"(50Hertz|Amprion|TenneT TSO|TransnetBW|Deutschland|VoAA)( \(.*\))?"
+    r"|.* in (ct/kWh|€/MWh)|.*_MWH?|reBAP .*|AEP .*|Spotmarktpreis .*"
+)
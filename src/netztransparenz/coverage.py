@@ -0,0 +1,389 @@
+"""
+Persistent index of the timeframes a cache holds, stored in SQLite.
+"""
+
+import contextlib
+import datetime as dt
+import os
+import sqlite3
+import time
+
+_DATE_FORMAT = "%Y-%m-%dT%H:%M:%S.%f"
+# chunks that overlap a timeframe, the lower bound of start keeps it a range scan of the primary key
+_CHUNKS_QUERY = (
+    "SELECT start, end FROM chunks WHERE endpoint = ? AND start >= ? AND start < ? AND end > ? "
+    "AND fetched >= ? ORDER BY start, end DESC"
+)
+
+
+def _key(moment: dt.datetime) -> str:
+    # UTC without timezone and with a fixed width, so timestamps compare as text
+    return moment.replace(tzinfo=None).strftime(_DATE_FORMAT)
+
+
+def _moment(value: str) -> dt.datetime:
+    return dt.datetime.strptime(value, _DATE_FORMAT).replace(tzinfo=dt.UTC)
+
+
+class CoverageIndex:
+    def __init__(self, path: str | os.PathLike):
+        """
+        Creates the index. It records every stored timeframe with the time it was requested and the hash of
+        its content, and the covered intervals per endpoint, where adjacent and overlapping timeframes are merged.
+        The longest stored timeframe per endpoint bounds the search for timeframes overlapping a query.
+        The size and the last use of every timeframe and their total size let a cache evict without
+        looking at its files.
+
+            path -- SQLite database file
+        """
+        self.path = path
+        with self._connect() as connection:
+            connection.execute("PRAGMA journal_mode=WAL")
+            new_spans = not connection.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'spans'"
+            ).fetchone()
+            connection.executescript(
+                """
+                CREATE TABLE IF NOT EXISTS chunks (
+                    endpoint TEXT NOT NULL,
+                    start TEXT NOT NULL,
+                    end TEXT NOT NULL,
+                    fetched REAL NOT NULL,
+                    hash TEXT,
+                    size INTEGER NOT NULL DEFAULT 0,
+                    used REAL NOT NULL DEFAULT 0,
+                    PRIMARY KEY (endpoint, start, end)
+                );
+                CREATE TABLE IF NOT EXISTS coverage (
+                    endpoint TEXT NOT NULL,
+                    start TEXT NOT NULL,
+                    end TEXT NOT NULL,
+                    PRIMARY KEY (endpoint, start)
+                );
+                CREATE TABLE IF NOT EXISTS spans (
+                    endpoint TEXT PRIMARY KEY,
+                    longest REAL NOT NULL
+                );
+                CREATE TABLE IF NOT EXISTS totals (
+                    id INTEGER PRIMARY KEY CHECK (id = 0),
+                    size INTEGER NOT NULL
+                );
+                INSERT OR IGNORE INTO totals VALUES (0, 0);
+                """
+            )
+            columns = {
+                row[1] for row in connection.execute("PRAGMA table_info(chunks)")
+            }
+            # False for indexes created before sizes were recorded, see set_size
+            self.sized = "size" in columns
+            if not self.sized:
+                connection.executescript(
+                    """
+                    ALTER TABLE chunks ADD COLUMN size INTEGER NOT NULL DEFAULT 0;
+                    ALTER TABLE chunks ADD COLUMN used REAL NOT NULL DEFAULT 0;
+                    """
+                )
+            connection.execute(
+                "CREATE INDEX IF NOT EXISTS chunks_used ON chunks (used)"
+            )
+            if new_spans:
+                # indexes created before the longest timeframes were recorded
+                longest = {}
+                for endpoint, start, end in connection.execute(
+                    "SELECT endpoint, start, end FROM chunks"
+                ):
+                    seconds = (_moment(end) - _moment(start)).total_seconds()
+                    longest[endpoint] = max(longest.get(endpoint, 0.0), seconds)
+                connection.executemany(
+                    "INSERT OR REPLACE INTO spans VALUES (?, ?)", longest.items()
+                )
+
+    @contextlib.contextmanager
+    def _connect(self):
+        # one connection per call, so the index can be used from several threads
+        connection = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+        try:
+            yield connection
+        finally:
+            connection.close()
+
+    @contextlib.contextmanager
+    def _transaction(self):
+        with self._connect() as connection:
+            # take the write lock right away, so concurrent processes do not merge intervals at the same time
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                yield connection
+            except BaseException:
+                connection.execute("ROLLBACK")
+                raise
+            connection.execute("COMMIT")
+
+    def add(
+        self,
+        endpoint: str,
+        dt_begin: dt.datetime,
+        dt_end: dt.datetime,
+        digest: str | None = None,
+        fetched: float | None = None,
+        size: int = 0,
+    ) -> None:
+        """
+        Record that the timeframe of endpoint is stored.
+
+            digest -- hash of the stored content
+            fetched -- unix time the timeframe was requested at (default: now)
+            size -- bytes the stored content uses
+        """
+        start, end = _key(dt_begin), _key(dt_end)
+        with self._transaction() as connection:
+            replaced = connection.execute(
+                "SELECT size FROM chunks WHERE endpoint = ? AND start = ? AND end = ?",
+                (endpoint, start, end),
+            ).fetchone()
+            connection.execute(
+                "INSERT OR REPLACE INTO chunks (endpoint, start, end, fetched, hash, size, used) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    endpoint,
+                    start,
+                    end,
+                    fetched if fetched is not None else time.time(),
+                    digest,
+                    size,
+                    time.time(),
+                ),
+            )
+            connection.execute(
+                "UPDATE totals SET size = size + ?",
+                (size - (replaced[0] if replaced else 0),),
+            )
+            connection.execute(
+                "INSERT INTO spans VALUES (?, ?) "
+                "ON CONFLICT (endpoint) DO UPDATE SET longest = MAX(longest, excluded.longest)",
+                (endpoint, (dt_end - dt_begin).total_seconds()),
+            )
+            # merge with every interval that overlaps or touches the new one
+            touching = connection.execute(
+                "SELECT start, end FROM coverage WHERE endpoint = ? AND start <= ? AND end >= ?",
+                (endpoint, end, start),
+            ).fetchall()
+            for other_start, other_end in touching:
+                start, end = min(start, other_start), max(end, other_end)
+            connection.execute(
+                "DELETE FROM coverage WHERE endpoint = ? AND start <= ? AND end >= ?",
+                (endpoint, end, start),
+            )
+            connection.execute(
+                "INSERT INTO coverage VALUES (?, ?, ?)", (endpoint, start, end)
+            )
+
+    def remove(self, endpoint: str, dt_begin: dt.datetime, dt_end: dt.datetime) -> None:
+        """
+        Record that the timeframe of endpoint is not stored anymore.
+        Other stored timeframes may still cover parts of it.
+        """
+        start, end = _key(dt_begin), _key(dt_end)
+        with self._transaction() as connection:
+            removed = connection.execute(
+                "SELECT size FROM chunks WHERE endpoint = ? AND start = ? AND end = ?",
+                (endpoint, start, end),
+            ).fetchone()
+            connection.execute(
+                "DELETE FROM chunks WHERE endpoint = ? AND start = ? AND end = ?",
+                (endpoint, start, end),
+            )
+            if removed:
+                connection.execute("UPDATE totals SET size = size - ?", (removed[0],))
+            overlapping = connection.execute(
+                "SELECT start, end FROM coverage WHERE endpoint = ? AND start < ? AND end > ?",
+                (endpoint, end, start),
+            ).fetchall()
+            if not overlapping:
+                return
+            connection.execute(
+                "DELETE FROM coverage WHERE endpoint = ? AND start < ? AND end > ?",
+                (endpoint, end, start),
+            )
+            # every chunk lies within one interval, so the intervals are rebuilt from the chunks inside them
+            low = min(other_start for other_start, _ in overlapping)
+            high = max(other_end for _, other_end in overlapping)
+            remaining = connection.execute(
+                "SELECT start, end FROM chunks WHERE endpoint = ? AND start >= ? AND start < ? ORDER BY start",
+                (endpoint, low, high),
+            ).fetchall()
+            intervals = []
+            for chunk_start, chunk_end in remaining:
+                if intervals and chunk_start <= intervals[-1][1]:
+                    intervals[-1][1] = max(intervals[-1][1], chunk_end)
+                else:
+                    intervals.append([chunk_start, chunk_end])
+            connection.executemany(
+                "INSERT INTO coverage VALUES (?, ?, ?)",
+                [
+                    (endpoint, interval_start, interval_end)
+                    for interval_start, interval_end in intervals
+                ],
+            )
+
+    def intervals(
+        self,
+        endpoint: str,
+        dt_begin: dt.datetime | None = None,
+        dt_end: dt.datetime | None = None,
+    ) -> list[tuple[dt.datetime, dt.datetime]]:
+        """
+        Return the covered intervals of endpoint ordered by start,
+        only those overlapping dt_begin to dt_end if they are given.
+        """
+        start = _key(dt_begin) if dt_begin is not None else ""
+        end = _key(dt_end) if dt_end is not None else "9"
+        with self._connect() as connection:
+            # intervals do not overlap, so only the last one starting before dt_begin can reach into the
+            # timeframe. Both queries are range scans on the primary key.
+            before = connection.execute(
+                "SELECT start, end FROM coverage WHERE endpoint = ? AND start <= ? ORDER BY start DESC LIMIT 1",
+                (endpoint, start),
+            ).fetchall()
+            inside = connection.execute(
+                "SELECT start, end FROM coverage WHERE endpoint = ? AND start > ? AND start < ? ORDER BY start",
+                (endpoint, start, end),
+            ).fetchall()
+        return [
+            (_moment(other_start), _moment(other_end))
+            for other_start, other_end in before + inside
+            if other_end > start
+        ]
+
+    def missing(
+        self,
+        endpoint: str,
+        dt_begin: dt.datetime,
+        dt_end: dt.datetime,
+        fetched_after: float | None = None,
+    ) -> list[tuple[dt.datetime, dt.datetime]]:
+        """
+        Return the parts of the timeframe of endpoint that are not covered, ordered by start.
+
+            fetched_after -- unix time, timeframes requested before it do not count as covered
+        """
+        dt_begin = dt_begin.replace(tzinfo=dt.UTC)
+        dt_end = dt_end.replace(tzinfo=dt.UTC)
+        if fetched_after is None:
+            covered = self.intervals(endpoint, dt_begin, dt_end)
+        else:
+            covered = self.chunks(endpoint, dt_begin, dt_end, fetched_after)
+        result = []
+        current = dt_begin
+        for start, end in covered:
+            if start > current:
+                result.append((current, min(start, dt_end)))
+            current = max(current, end)
+        if current < dt_end:
+            result.append((current, dt_end))
+        return result
+
+    def chunks(
+        self,
+        endpoint: str,
+        dt_begin: dt.datetime,
+        dt_end: dt.datetime,
+        fetched_after: float | None = None,
+    ) -> list[tuple[dt.datetime, dt.datetime]]:
+        """
+        Return the stored timeframes of endpoint that overlap dt_begin to dt_end, ordered by start.
+        Of timeframes with the same start the longest comes first.
+
+            fetched_after -- unix time, only timeframes requested after it are returned
+        """
+        with self._connect() as connection:
+            longest = connection.execute(
+                "SELECT longest FROM spans WHERE endpoint = ?", (endpoint,)
+            ).fetchone()
+            if longest is None:
+                return []
+            rows = connection.execute(
+                _CHUNKS_QUERY,
+                (
+                    endpoint,
+                    _key(dt_begin - dt.timedelta(seconds=longest[0])),
+                    _key(dt_end),
+                    _key(dt_begin),
+                    fetched_after if fetched_after is not None else float("-inf"),
+                ),
+            ).fetchall()
+        return [(_moment(start), _moment(end)) for start, end in rows]
+
+    def chunk(
+        self, endpoint: str, dt_begin: dt.datetime, dt_end: dt.datetime
+    ) -> tuple[float, str | None] | None:
+        """
+        Return when the timeframe of endpoint was requested and the hash of its content,
+        or None if it is not stored.
+        """
+        with self._connect() as connection:
+            return connection.execute(
+                "SELECT fetched, hash FROM chunks WHERE endpoint = ? AND start = ? AND end = ?",
+                (endpoint, _key(dt_begin), _key(dt_end)),
+            ).fetchone()
+
+    def touch(self, endpoint: str, dt_begin: dt.datetime, dt_end: dt.datetime) -> None:
+        """
+        Record that the timeframe of endpoint was used now, see least_recently_used.
+        """
+        with self._connect() as connection:
+            connection.execute(
+                "UPDATE chunks SET used = ? WHERE endpoint = ? AND start = ? AND end = ?",
+                (time.time(), endpoint, _key(dt_begin), _key(dt_end)),
+            )
+
+    def set_size(
+        self,
+        endpoint: str,
+        dt_begin: dt.datetime,
+        dt_end: dt.datetime,
+        size: int,
+        used: float,
+    ) -> None:
+        """
+        Record the size and the last use (unix time) of a stored timeframe,
+        for indexes created before sizes were recorded.
+        """
+        start, end = _key(dt_begin), _key(dt_end)
+        with self._transaction() as connection:
+            replaced = connection.execute(
+                "SELECT size FROM chunks WHERE endpoint = ? AND start = ? AND end = ?",
+                (endpoint, start, end),
+            ).fetchone()
+            if replaced is None:
+                return
+            connection.execute(
+                "UPDATE chunks SET size = ?, used = ? WHERE endpoint = ? AND start = ? AND end = ?",
+                (size, used, endpoint, start, end),
+            )
+            connection.execute(
+                "UPDATE totals SET size = size + ?", (size - replaced[0],)
+            )
+
+    def size(self) -> int:
+        """
+        Return the total size of all stored timeframes in bytes.
+        """
+        with self._connect() as connection:
+            return connection.execute("SELECT size FROM totals").fetchone()[0]
+
+    def least_recently_used(
+        self, count: int
+    ) -> list[tuple[str, dt.datetime, dt.datetime, int]]:
+        """
+        Return endpoint, timeframe and size of the count stored timeframes that were used longest ago.
+        """
+        with self._connect() as connection:
+            rows = connection.execute(
+                "SELECT endpoint, start, end, size FROM chunks ORDER BY used LIMIT ?",
+                (count,),
+            ).fetchall()
+        return [
+            (endpoint, _moment(start), _moment(end), size)
+            for endpoint, start, end, size in rows
+        ]
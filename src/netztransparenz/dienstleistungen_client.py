@@ -3,178 +3,18 @@ Client for all Endpoints of the "Systemdienstleistungen" Group
 """
 
 from netztransparenz.base_client import BaseNtClient
-from netztransparenz.constants import endpoints
 
-import requests
 import datetime as dt
-import io
-
-import pandas as pd
 
 
 class DienstleistungenClient(BaseNtClient):
-    def _basic_read_systemdienstleistungen(
-        self,
-        resource_url,
-        dt_begin: dt.datetime | None = None,
-        dt_end: dt.datetime | None = None,
-        transform_dates=False,
-    ):
-        """
-        Internal method to read data in the format of most 'systemdienstleistungen' dataseries.
-        Target format is: Dates separated in "BEGINN_DATUM", "BEGINN_UHRZEIT", "ENDE_DATUM",
-        "ENDE_UHRZEIT", "ZEITZONE_VON", "ZEITZONE_BIS".
-        Return a pandas Dataframe with data of the endpoint specified with resource_url.
-        If either dt_begin or dt_end is None, all available data will be queried.
-
-            resource_url -- url of the endpoint without the base url and without leading or trailing "/"
-            dt_begin -- datetime object for start of data in UTC
-            dt_end -- datetime object for end of data in UTC
-            transform_dates -- The data contains times with date, time and timezone in separate columns
-                               if this option resolves to "True" the times will be transformed into two
-                               columns "BEGINN" and "ENDE" that contain fully qualified timestamps. (default: False)
-        """
-        if not self._check_preconditions(
-            dt_begin, endpoints[f"/{resource_url}"]["first_data"], dt_end
-        ):
-            return self._return_empty_frame(f"/{resource_url}", transform_dates)
-
-        url = f"{self._API_BASE_URL}/data/{resource_url}"
-        if (dt_begin is not None) and (dt_end is not None):
-            dt_begin = dt_begin.replace(tzinfo=dt.UTC)
-            dt_end = dt_end.replace(tzinfo=dt.UTC)
-            if (dt_begin + self.max_query_distance) < dt_end:
-                # split into multiple api calls
-                timeframes = self._split_timeframe(dt_begin, dt_end)
-                dataframes = []
-                for timeframe in timeframes:
-                    dataframes.append(
-                        self._basic_read_systemdienstleistungen(
-                            resource_url, timeframe[0], timeframe[1], transform_dates
-                        )
-                    )
-                return pd.concat(dataframes)
-            start_of_data = dt_begin.strftime(self._api_date_format)
-            end_of_data = dt_end.strftime(self._api_date_format)
-            url = f"{self._API_BASE_URL}/data/{resource_url}/{start_of_data}/{end_of_data}"
-
-        response = requests.get(
-            url, headers={"Authorization": "Bearer {}".format(self.token)}
-        )
-        response.raise_for_status()
-        df = pd.read_csv(
-            io.StringIO(response.text),
-            sep=";",
-            header=0,
-            decimal=",",
-            na_values=["N.A."],
-        )
-
-        if transform_dates:
-            df["BEGINN"] = pd.to_datetime(
-                df["BEGINN_DATUM"]
-                + " "
-                + df["BEGINN_UHRZEIT"]
-                + " "
-                + df["ZEITZONE_VON"],
-                format="%d.%m.%Y %H:%M %Z",
-                utc=True,
-            ).dt.tz_localize(None)
-            df["ENDE"] = pd.to_datetime(
-                df["ENDE_DATUM"] + " " + df["ENDE_UHRZEIT"] + " " + df["ZEITZONE_BIS"],
-                format="%d.%m.%Y %H:%M %Z",
-                utc=True,
-            ).dt.tz_localize(None)
-            df = df.drop(
-                [
-                    "BEGINN_DATUM",
-                    "BEGINN_UHRZEIT",
-                    "ENDE_DATUM",
-                    "ENDE_UHRZEIT",
-                    "ZEITZONE_VON",
-                    "ZEITZONE_BIS",
-                ],
-                axis=1,
-            )
-
-        return df
-
-    def _basic_read_abregelung(
-        self,
-        resource_url,
-        dt_begin: dt.datetime | None = None,
-        dt_end: dt.datetime | None = None,
-        transform_dates=False,
-    ):
-        """
-        Internal method to read data in the format of most dataseries concerning power reduction.
-        Target format is: Dates separated in "Datum", "Zeitzone", "von", "bis".
-        Return a pandas Dataframe with data of the endpoint specified with resource_url.
-        If either dt_begin or dt_end is None, all available data will be queried.
-
-            resource_url -- url of the endpoint without the base url and without leading or trailing "/"
-            dt_begin -- datetime object for start of data in UTC
-            dt_end -- datetime object for end of data in UTC
-            transform_dates -- The data contains times with date, time and timezone in separate columns
-                               if this option resolves to "True" the times will be transformed into two
-                               columns "BEGINN" and "ENDE" that contain fully qualified timestamps. (default: False)
-        """
-        if not self._check_preconditions(
-            dt_begin, endpoints[f"/{resource_url}"]["first_data"], dt_end
-        ):
-            return self._return_empty_frame(f"/{resource_url}", transform_dates)
-
-        url = f"{self._API_BASE_URL}/data/{resource_url}"
-        if (dt_begin is not None) and (dt_end is not None):
-            dt_begin = dt_begin.replace(tzinfo=dt.UTC)
-            dt_end = dt_end.replace(tzinfo=dt.UTC)
-            if (dt_begin + self.max_query_distance) < dt_end:
-                # split into multiple api calls
-                timeframes = self._split_timeframe(dt_begin, dt_end)
-                dataframes = []
-                for timeframe in timeframes:
-                    dataframes.append(
-                        self._basic_read_abregelung(
-                            resource_url, timeframe[0], timeframe[1], transform_dates
-                        )
-                    )
-                return pd.concat(dataframes)
-            start_of_data = dt_begin.strftime(self._api_date_format)
-            end_of_data = dt_end.strftime(self._api_date_format)
-            url = f"{url}/{start_of_data}/{end_of_data}"
-
-        response = requests.get(
-            url, headers={"Authorization": "Bearer {}".format(self.token)}
-        )
-        response.raise_for_status()
-        df = pd.read_csv(
-            io.StringIO(response.text),
-            sep=";",
-            header=0,
-            decimal=",",
-            na_values=["N.A."],
-        )
-
-        if transform_dates:
-            df["von"] = pd.to_datetime(
-                df["Datum"] + " " + df["von"] + " " + df["Zeitzone"],
-                format="%d.%m.%Y %H:%M %Z",
-                utc=True,
-            ).dt.tz_localize(None)
-            df["bis"] = pd.to_datetime(
-                df["Datum"] + " " + df["bis"] + " " + df["Zeitzone"],
-                format="%d.%m.%Y %H:%M %Z",
-                utc=True,
-            ).dt.tz_localize(None)
-            df = df.drop(["Datum", "Zeitzone"], axis=1)
-
-        return df
-
     def redispatch(
         self,
         dt_begin: dt.datetime | None = None,
         dt_end: dt.datetime | None = None,
         transform_dates=False,
+        columns: list[str] | None = None,
+        backend: str | None = None,
     ):
         """
         Return a pandas Dataframe with data of the endpoint /redispatch.
@@ -185,9 +25,16 @@ class DienstleistungenClient(BaseNtClient):
             transform_dates -- The data contains times with date, time and timezone in separate columns
                                if this option resolves to "True" the times will be transformed into two
                                columns "BEGINN" and "ENDE" that contain fully qualified timestamps. (default: False)
-        """
-        return self._basic_read_systemdienstleistungen(
-            "redispatch", dt_begin, dt_end, transform_dates
+            columns -- only return these columns, see constants.endpoints for their names (default: all columns)
+            backend -- "pandas", "arrow" or "polars", the type of the result (default: the backend of the client)
+        """
+        return self._read_endpoint(
+            "redispatch",
+            dt_begin,
+            dt_end,
+            transform_dates,
+            columns=columns,
+            backend=backend,
         )
 
     def kapazitaetsreserve(
@@ -195,6 +42,8 @@ class DienstleistungenClient(BaseNtClient):
         dt_begin: dt.datetime | None = None,
         dt_end: dt.datetime | None = None,
         transform_dates=False,
+        columns: list[str] | None = None,
+        backend: str | None = None,
     ):
         """
         Return a pandas Dataframe with data of the endpoint /Kapazitaetsreserve.
@@ -205,9 +54,16 @@ class DienstleistungenClient(BaseNtClient):
             transform_dates -- The data contains times with date, time and timezone in separate columns
                                if this option resolves to "True" the times will be transformed into two
                                columns "BEGINN" and "ENDE" that contain fully qualified timestamps. (default: False)
-        """
-        return self._basic_read_systemdienstleistungen(
-            "Kapazitaetsreserve", dt_begin, dt_end, transform_dates
+            columns -- only return these columns, see constants.endpoints for their names (default: all columns)
+            backend -- "pandas", "arrow" or "polars", the type of the result (default: the backend of the client)
+        """
+        return self._read_endpoint(
+            "Kapazitaetsreserve",
+            dt_begin,
+            dt_end,
+            transform_dates,
+            columns=columns,
+            backend=backend,
         )
 
     def vorhaltung_krd(
@@ -215,6 +71,8 @@ class DienstleistungenClient(BaseNtClient):
         dt_begin: dt.datetime | None = None,
         dt_end: dt.datetime | None = None,
         transform_dates=False,
+        columns: list[str] | None = None,
+        backend: str | None = None,
     ):
         """
         Return a pandas Dataframe with data of the endpoint /VorhaltungkRD.
@@ -225,9 +83,16 @@ class DienstleistungenClient(BaseNtClient):
             transform_dates -- The data contains times with date, time and timezone in separate columns
                                if this option resolves to "True" the times will be transformed into two
                                columns "BEGINN" and "ENDE" that contain fully qualified timestamps. (default: False)
-        """
-        return self._basic_read_systemdienstleistungen(
-            "VorhaltungkRD", dt_begin, dt_end, transform_dates
+            columns -- only return these columns, see constants.endpoints for their names (default: all columns)
+            backend -- "pandas", "arrow" or "polars", the type of the result (default: the backend of the client)
+        """
+        return self._read_endpoint(
+            "VorhaltungkRD",
+            dt_begin,
+            dt_end,
+            transform_dates,
+            columns=columns,
+            backend=backend,
         )
 
     def ausgewiesene_absm(
@@ -235,6 +100,8 @@ class DienstleistungenClient(BaseNtClient):
         dt_begin: dt.datetime | None = None,
         dt_end: dt.datetime | None = None,
         transform_dates=False,
+        columns: list[str] | None = None,
+        backend: str | None = None,
     ):
         """
         Return a pandas Dataframe with data of the endpoint /AusgewieseneABSM.
@@ -245,9 +112,16 @@ class DienstleistungenClient(BaseNtClient):
             transform_dates -- The data contains times with date, time and timezone in separate columns
                                if this option resolves to "True" the times will be transformed into two
                                columns "BEGINN" and "ENDE" that contain fully qualified timestamps. (default: False)
-        """
-        return self._basic_read_abregelung(
-            "AusgewieseneABSM", dt_begin, dt_end, transform_dates
+            columns -- only return these columns, see constants.endpoints for their names (default: all columns)
+            backend -- "pandas", "arrow" or "polars", the type of the result (default: the backend of the client)
+        """
+        return self._read_endpoint(
+            "AusgewieseneABSM",
+            dt_begin,
+            dt_end,
+            transform_dates,
+            columns=columns,
+            backend=backend,
         )
 
     def zugeteilte_absm(
@@ -255,6 +129,8 @@ class DienstleistungenClient(BaseNtClient):
         dt_begin: dt.datetime | None = None,
         dt_end: dt.datetime | None = None,
         transform_dates=False,
+        columns: list[str] | None = None,
+        backend: str | None = None,
     ):
         """
         Return a pandas Dataframe with data of the endpoint /ZugeteilteABSM.
@@ -265,9 +141,16 @@ class DienstleistungenClient(BaseNtClient):
             transform_dates -- The data contains times with date, time and timezone in separate columns
                                if this option resolves to "True" the times will be transformed into two
                                columns "BEGINN" and "ENDE" that contain fully qualified timestamps. (default: False)
-        """
-        return self._basic_read_abregelung(
-            "ZugeteilteABSM", dt_begin, dt_end, transform_dates
+            columns -- only return these columns, see constants.endpoints for their names (default: all columns)
+            backend -- "pandas", "arrow" or "polars", the type of the result (default: the backend of the client)
+        """
+        return self._read_endpoint(
+            "ZugeteilteABSM",
+            dt_begin,
+            dt_end,
+            transform_dates,
+            columns=columns,
+            backend=backend,
         )
 
     def erzeugungsverbot(
@@ -275,6 +158,8 @@ class DienstleistungenClient(BaseNtClient):
         dt_begin: dt.datetime | None = None,
         dt_end: dt.datetime | None = None,
         transform_dates=False,
+        columns: list[str] | None = None,
+        backend: str | None = None,
     ):
         """
         Return a pandas Dataframe with data of the endpoint /Erzeugungsverbot.
@@ -285,7 +170,14 @@ class DienstleistungenClient(BaseNtClient):
             transform_dates -- The data contains times with date, time and timezone in separate columns
                                if this option resolves to "True" the times will be transformed into two
                                columns "BEGINN" and "ENDE" that contain fully qualified timestamps. (default: False)
-        """
-        return self._basic_read_abregelung(
-            "Erzeugungsverbot", dt_begin, dt_end, transform_dates
+            columns -- only return these columns, see constants.endpoints for their names (default: all columns)
+            backend -- "pandas", "arrow" or "polars", the type of the result (default: the backend of the client)
+        """
+        return self._read_endpoint(
+            "Erzeugungsverbot",
+            dt_begin,
+            dt_end,
+            transform_dates,
+            columns=columns,
+            backend=backend,
         )
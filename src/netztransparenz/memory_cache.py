@@ -0,0 +1,162 @@
+"""
+In-process cache of query results, bounded by the memory the dataframes use.
+"""
+
+from __future__ import annotations
+
+import datetime as dt
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Hashable
+
+from netztransparenz import _lazy
+
+pd = _lazy.load("pandas")
+np = _lazy.load("numpy")
+
+
+def _copy_on_write() -> bool:
+    # pandas 3 always copies on write, pandas 2 only if the option is enabled
+    return (
+        int(pd.__version__.split(".")[0]) >= 3
+        or pd.get_option("mode.copy_on_write") is True
+    )
+
+
+def _freezable(dtype) -> bool:
+    # assigning to a read-only numpy array raises a ValueError. Datetimelike columns fail with an internal
+    # error instead and extension arrays can not be made read-only through the public API, so they are copied.
+    return isinstance(dtype, np.dtype) and dtype.kind not in "mM"
+
+
+def _freeze(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Return a copy of df whose numpy columns are read-only arrays, so results can share them without
+    copy-on-write. Only used on pandas 2, see _copy_on_write, whose constructor keeps the arrays it is
+    given with copy=False.
+    """
+    arrays = {}
+    for position, dtype in enumerate(df.dtypes):
+        column = df.iloc[:, position]
+        if _freezable(dtype):
+            values = column.to_numpy(copy=True)
+            values.flags.writeable = False
+        else:
+            values = column.array.copy()
+        # keyed by position, column names may repeat
+        arrays[position] = values
+    frozen = pd.DataFrame(arrays, index=df.index.copy(), copy=False)
+    frozen.columns = df.columns.copy()
+    return frozen
+
+
+def _share(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Return a dataframe the caller can modify without changing df, which is a cached dataframe.
+    With copy-on-write this is a shallow copy that shares the data until one of them is modified.
+    Without copy-on-write the shallow copy shares the read-only arrays of df, see _freeze.
+    """
+    if not isinstance(df, pd.DataFrame):
+        # pyarrow Tables and Polars DataFrames are not modified in place
+        return df
+    result = df.copy(deep=False)
+    if _copy_on_write():
+        return result
+    # the index and the columns are not copied by a shallow copy, e.g. renaming them would change df
+    result.index = result.index.copy()
+    result.columns = result.columns.copy()
+    for position, dtype in enumerate(df.dtypes):
+        if not _freezable(dtype):
+            result.isetitem(position, result.iloc[:, position].copy())
+    return result
+
+
+def _size(df) -> int:
+    # bytes used by a pandas Dataframe, a pyarrow Table or a Polars DataFrame
+    if isinstance(df, pd.DataFrame):
+        return int(df.memory_usage(deep=True, index=True).sum())
+    if hasattr(df, "estimated_size"):
+        return int(df.estimated_size())
+    return int(df.nbytes)
+
+
+class MemoryCache:
+    def __init__(self, max_bytes: int = 256 * 2**20, ttl: dt.timedelta | None = None):
+        """
+        Creates the cache. The least recently used results are removed when the dataframes together
+        use more than max_bytes of memory.
+
+            max_bytes -- memory the cached dataframes may use (default: 256 MiB)
+            ttl -- results are requested again after this timedelta. None keeps them until they
+                   are evicted. (default: None)
+
+        Results share their data with the cache. With copy-on-write (always on in pandas 3, enabled in
+        pandas 2 with pd.set_option("mode.copy_on_write", True)) they can be modified like any dataframe.
+        Without it the numpy columns of pandas results are read-only: assigning values in place, e.g.
+        df.iloc[0, 0] = 1, raises a ValueError, while adding or replacing columns works. Columns with
+        other dtypes, e.g. datetimes with a timezone or nullable integers, are copied for every result.
+        Use df.copy() to get a writable copy.
+        """
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[Hashable, tuple[pd.DataFrame, int, float]] = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> pd.DataFrame | None:
+        """
+        Return the cached result for key, or None if there is none.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if (
+                entry is not None
+                and self.ttl is not None
+                and time.monotonic() - entry[2] > self.ttl.total_seconds()
+            ):
+                self._remove(key)
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+        return _share(entry[0])
+
+    def put(self, key: Hashable, df: pd.DataFrame) -> None:
+        """
+        Cache df for key. Dataframes larger than max_bytes are not cached.
+        """
+        size = _size(df)
+        if size > self.max_bytes:
+            return
+        if isinstance(df, pd.DataFrame):
+            # the cached dataframe is never returned itself, see _share
+            df = df.copy(deep=False) if _copy_on_write() else _freeze(df)
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (df, size, time.monotonic())
+            self.size += size
+            while self.size > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+
+    def _remove(self, key: Hashable) -> None:
+        _, size, _ = self._entries.pop(key)
+        self.size -= size
+
+    def clear(self) -> None:
+        """
+        Remove all cached results.
+        """
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
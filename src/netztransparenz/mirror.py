@@ -0,0 +1,114 @@
+"""
+Local copy of whole endpoints, stored as parquet files partitioned by endpoint, year and month.
+Requires the optional dependency pyarrow (pip install netztransparenz[cache]).
+"""
+
+from __future__ import annotations
+
+import contextlib
+import datetime as dt
+import json
+import os
+import tempfile
+from pathlib import Path
+
+from netztransparenz import _lazy
+from netztransparenz._filelock import locked
+from netztransparenz.chunk_cache import _read_table
+
+pd = _lazy.load("pandas")
+pyarrow = _lazy.load("pyarrow", optional=True)
+
+
+class Mirror:
+    def __init__(self, directory: str | os.PathLike):
+        """
+        Creates the mirror. The data of every month is stored in <directory>/<endpoint>/<year>/<month>.parquet.
+        The manifest (manifest.json) lists the months that are complete and will not change anymore,
+        so an interrupted NetztransparenzClient.update_mirror continues where it stopped.
+
+            directory -- where the files are stored
+        """
+        if pyarrow is None:
+            raise ImportError(
+                "Mirror requires pyarrow, install it with 'pip install netztransparenz[cache]'"
+            )
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._manifest_path = self.directory / "manifest.json"
+        self._manifest: dict[str, list[str]] = {}
+        self._manifest_mtime = None
+
+    def path(self, endpoint: str, month: dt.datetime) -> Path:
+        """
+        Return the file of the month of endpoint.
+        """
+        return self.directory.joinpath(
+            *endpoint.strip("/").split("/"), f"{month:%Y}", f"{month:%m}.parquet"
+        )
+
+    def _load_manifest(self) -> dict[str, list[str]]:
+        # other processes may update the mirror at the same time, so the manifest is read again if it changed
+        try:
+            mtime = self._manifest_path.stat().st_mtime_ns
+        except FileNotFoundError:
+            return {}
+        if mtime != self._manifest_mtime:
+            with open(self._manifest_path) as file:
+                self._manifest = json.load(file)
+            self._manifest_mtime = mtime
+        return self._manifest
+
+    def complete(self, endpoint: str, month: dt.datetime) -> bool:
+        """
+        Return True if the month of endpoint is stored and will not change anymore.
+        """
+        months = self._load_manifest().get(endpoint.strip("/"), [])
+        return f"{month:%Y-%m}" in months
+
+    def read(
+        self, endpoint: str, month: dt.datetime, columns: list[str] | None = None
+    ) -> pd.DataFrame | None:
+        """
+        Return the data of the month of endpoint, or None if it is not stored.
+
+            columns -- only these columns and the index are read. None reads all columns.
+        """
+        try:
+            return _read_table(self.path(endpoint, month), columns).to_pandas()
+        except FileNotFoundError:
+            return None
+
+    def write(
+        self, endpoint: str, month: dt.datetime, df: pd.DataFrame, complete: bool
+    ) -> None:
+        """
+        Store the data of the month of endpoint. The file is replaced atomically.
+
+            complete -- if True, the month is added to the manifest and not requested again
+        """
+        path = self.path(endpoint, month)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, temporary_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        os.close(fd)
+        try:
+            df.to_parquet(temporary_path)
+            os.replace(temporary_path, path)
+        except BaseException:
+            with contextlib.suppress(OSError):
+                os.remove(temporary_path)
+            raise
+        if complete:
+            self._mark_complete(endpoint.strip("/"), f"{month:%Y-%m}")
+
+    def _mark_complete(self, endpoint: str, month: str) -> None:
+        with locked(self.directory / "manifest.lock"):
+            self._manifest_mtime = None
+            manifest = self._load_manifest()
+            months = set(manifest.get(endpoint, []))
+            months.add(month)
+            manifest[endpoint] = sorted(months)
+            fd, temporary_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            with os.fdopen(fd, "w") as file:
+                json.dump(manifest, file, indent=1)
+            os.replace(temporary_path, self._manifest_path)
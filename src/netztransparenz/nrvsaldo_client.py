@@ -3,126 +3,40 @@ Client for all Endpoints of the "NrvSaldo/" Group
 """
 
 from netztransparenz.base_client import BaseNtClient
-from netztransparenz.constants import endpoints
-import requests
 import datetime as dt
-import io
-
-import pandas as pd
-
-_nrvsaldo_date_format = "%d.%m.%Y %H:%M %Z"
 
 
 class NrvSaldoClient(BaseNtClient):
-    def _basic_read_nrvsaldo(
+    def traffic_light(
         self,
-        resource_url,
-        dt_begin: dt.datetime | None = None,
-        dt_end: dt.datetime | None = None,
-        transform_dates=False,
+        dt_begin: dt.datetime,
+        dt_end: dt.datetime,
+        columns: list[str] | None = None,
+        backend: str | None = None,
     ):
-        """
-        Internal method to read data in the format of most /nrvsaldo dataseries.
-        Target format is: Dates separated in "Datum", "von", "bis", "Zeitzone".
-        Return a pandas Dataframe with data of the endpoint specified with resource_url.
-        If either dt_begin or dt_end is None, all available data will be queried.
-
-            resource_url -- url of the endpoint without the base url and without leading or trailing "/"
-            earliest_data -- first datapoint in the source collection
-            dt_begin -- datetime object for start of data in UTC (no values before: 2011-03-31T22:00:00)
-            dt_end -- datetime object for end of data in UTC
-            transform_dates -- The data contains times with date, time and timezone in separate columns
-                               if this option resolves to "True" the times will be transformed into two
-                               columns "von" and "bis" that contain fully qualified timestamps. (default: False)
-        """
-        if not self._check_preconditions(
-            dt_begin, endpoints[f"/{resource_url}"]["first_data"], dt_end
-        ):
-            return self._return_empty_frame(f"/{resource_url}", transform_dates)
-
-        url = f"{self._API_BASE_URL}/data/{resource_url}"
-        if (dt_begin is not None) and (dt_end is not None):
-            dt_begin = dt_begin.replace(tzinfo=dt.UTC)
-            dt_end = dt_end.replace(tzinfo=dt.UTC)
-            if (dt_begin + self.max_query_distance) < dt_end:
-                # split into multiple api calls
-                timeframes = self._split_timeframe(dt_begin, dt_end)
-                dataframes = []
-                for timeframe in timeframes:
-                    dataframes.append(
-                        self._basic_read_nrvsaldo(
-                            resource_url, timeframe[0], timeframe[1], transform_dates
-                        )
-                    )
-                return pd.concat(dataframes)
-            start_of_data = dt_begin.strftime(self._api_date_format)
-            end_of_data = dt_end.strftime(self._api_date_format)
-            url = url + f"/{start_of_data}/{end_of_data}"
-
-        response = requests.get(
-            url, headers={"Authorization": "Bearer {}".format(self.token)}
-        )
-        response.raise_for_status()
-        df = pd.read_csv(
-            io.StringIO(response.text),
-            sep=";",
-            header=0,
-            decimal=",",
-            na_values=["N.A.", "N.E.", ""],
-        )
-
-        if transform_dates:
-            df["von"] = pd.to_datetime(
-                df["Datum"] + " " + df["von"] + " " + df["Zeitzone"],
-                format=_nrvsaldo_date_format,
-                utc=True,
-            )
-            df["bis"] = pd.to_datetime(
-                df["Datum"] + " " + df["bis"] + " " + df["Zeitzone"],
-                format=_nrvsaldo_date_format,
-                utc=True,
-            )
-            # The end of timeframes may be 00:00 of the next day witch is not correctly represented in timestamps
-            df["bis"] = df["bis"].where(
-                df["bis"].dt.time != dt.time(0, 0), df["bis"] + dt.timedelta(days=1)
-            )
-            df = df.drop(["Datum", "Zeitzone"], axis=1).set_index("von")
-        return df
-
-    def traffic_light(self, dt_begin: dt.datetime, dt_end: dt.datetime):
         """
         Return a pandas Dataframe with data of the endpoint /TrafficLight.
 
             dt_begin -- datetime object for start of data in UTC (no values before: 2021-09-21T22:00:00)
             dt_end -- datetime object for end of data in UTC
+            columns -- only return these columns, see constants.endpoints for their names (default: all columns)
+            backend -- "pandas", "arrow" or "polars", the type of the result (default: the backend of the client)
         """
-        if not self._check_preconditions(
-            dt_begin, endpoints["/TrafficLight"]["first_data"], dt_end
-        ):
-            return self._return_empty_frame("/TrafficLight", False)
-
-        dt_begin = dt_begin.replace(tzinfo=dt.UTC)
-        dt_end = dt_end.replace(tzinfo=dt.UTC)
-        if (dt_begin + self.max_query_distance) < dt_end:
-            # split into multiple api calls
-            timeframes = self._split_timeframe(dt_begin, dt_end)
-            dataframes = []
-            for timeframe in timeframes:
-                dataframes.append(self.traffic_light(timeframe[0], timeframe[1]))
-            return pd.concat(dataframes)
-
-        url = f"{self._API_BASE_URL}/data/TrafficLight/{dt_begin.strftime(self._api_date_format)}/{dt_end.strftime(self._api_date_format)}"
-
-        response = requests.get(
-            url, headers={"Authorization": "Bearer {}".format(self.token)}
+        return self._read_endpoint(
+            "TrafficLight",
+            dt_begin,
+            dt_end,
+            columns=columns,
+            backend=backend,
         )
-        response.raise_for_status()
-        df = pd.read_json(io.StringIO(response.text))
-
-        return df
 
     def nrvsaldo_nrvsaldo_betrieblich(
-        self, dt_begin: dt.datetime, dt_end: dt.datetime, transform_dates=False
+        self,
+        dt_begin: dt.datetime,
+        dt_end: dt.datetime,
+        transform_dates=False,
+        columns: list[str] | None = None,
+        backend: str | None = None,
     ):
         """
         Return a pandas Dataframe with data of the endpoint /NrvSaldo/NRVSaldo/Betrieblich/.
@@ -132,13 +46,25 @@ class NrvSaldoClient(BaseNtClient):
             transform_dates -- The data contains times with date, time and timezone in separate columns
                                if this option resolves to "True" the times will be transformed into two
                                columns "von" and "bis" that contain fully qualified timestamps. (default: False)
+            columns -- only return these columns, see constants.endpoints for their names (default: all columns)
+            backend -- "pandas", "arrow" or "polars", the type of the result (default: the backend of the client)
         """
-        return self._basic_read_nrvsaldo(
-            "NrvSaldo/NRVSaldo/Betrieblich", dt_begin, dt_end, transform_dates
+        return self._read_endpoint(
+            "NrvSaldo/NRVSaldo/Betrieblich",
+            dt_begin,
+            dt_end,
+            transform_dates,
+            columns=columns,
+            backend=backend,
         )
 
     def nrvsaldo_nrvsaldo_qualitaetsgesichert(
-        self, dt_begin: dt.datetime, dt_end: dt.datetime, transform_dates=False
+        self,
+        dt_begin: dt.datetime,
+        dt_end: dt.datetime,
+        transform_dates=False,
+        columns: list[str] | None = None,
+        backend: str | None = None,
     ):
         """
         Return a pandas Dataframe with data of the endpoint /NrvSaldo/NRVSaldo/Qualitaetsgesichert/.
@@ -148,13 +74,25 @@ class NrvSaldoClient(BaseNtClient):
             transform_dates -- The data contains times with date, time and timezone in separate columns
                                if this option resolves to "True" the times will be transformed into two
                                columns "von" and "bis" that contain fully qualified timestamps. (default: False)
+            columns -- only return these columns, see constants.endpoints for their names (default: all columns)
+            backend -- "pandas", "arrow" or "polars", the type of the result (default: the backend of the client)
         """
-        return self._basic_read_nrvsaldo(
-            "NrvSaldo/NRVSaldo/Qualitaetsgesichert", dt_begin, dt_end, transform_dates
+        return self._read_endpoint(
+            "NrvSaldo/NRVSaldo/Qualitaetsgesichert",
+            dt_begin,
+            dt_end,
+            transform_dates,
+            columns=columns,
+            backend=backend,
         )
 
     def nrvsaldo_rzsaldo_betrieblich(
-        self, dt_begin: dt.datetime, dt_end: dt.datetime, transform_dates=False
+        self,
+        dt_begin: dt.datetime,
+        dt_end: dt.datetime,
+        transform_dates=False,
+        columns: list[str] | None = None,
+        backend: str | None = None,
     ):
         """
         Return a pandas Dataframe with data of the endpoint /NrvSaldo/RZSaldo/Betrieblich/.
@@ -164,13 +102,25 @@ class NrvSaldoClient(BaseNtClient):
             transform_dates -- The data contains times with date, time and timezone in separate columns
                                if this option resolves to "True" the times will be transformed into two
                                columns "von" and "bis" that contain fully qualified timestamps. (default: False)
+            columns -- only return these columns, see constants.endpoints for their names (default: all columns)
+            backend -- "pandas", "arrow" or "polars", the type of the result (default: the backend of the client)
         """
-        return self._basic_read_nrvsaldo(
-            "NrvSaldo/RZSaldo/Betrieblich", dt_begin, dt_end, transform_dates
+        return self._read_endpoint(
+            "NrvSaldo/RZSaldo/Betrieblich",
+            dt_begin,
+            dt_end,
+            transform_dates,
+            columns=columns,
+            backend=backend,
         )
 
     def nrvsaldo_rzsaldo_qualitaetsgesichert(
-        self, dt_begin: dt.datetime, dt_end: dt.datetime, transform_dates=False
+        self,
+        dt_begin: dt.datetime,
+        dt_end: dt.datetime,
+        transform_dates=False,
+        columns: list[str] | None = None,
+        backend: str | None = None,
     ):
         """
         Return a pandas Dataframe with data of the endpoint /NrvSaldo/RZSaldo/Qualitaetsgesichert/.
@@ -180,13 +130,25 @@ class NrvSaldoClient(BaseNtClient):
             transform_dates -- The data contains times with date, time and timezone in separate columns
                                if this option resolves to "True" the times will be transformed into two
                                columns "von" and "bis" that contain fully qualified timestamps. (default: False)
+            columns -- only return these columns, see constants.endpoints for their names (default: all columns)
+            backend -- "pandas", "arrow" or "polars", the type of the result (default: the backend of the client)
         """
-        return self._basic_read_nrvsaldo(
-            "NrvSaldo/RZSaldo/Qualitaetsgesichert", dt_begin, dt_end, transform_dates
+        return self._read_endpoint(
+            "NrvSaldo/RZSaldo/Qualitaetsgesichert",
+            dt_begin,
+            dt_end,
+            transform_dates,
+            columns=columns,
+            backend=backend,
         )
 
     def nrvsaldo_prl_betrieblich(
-        self, dt_begin: dt.datetime, dt_end: dt.datetime, transform_dates=False
+        self,
+        dt_begin: dt.datetime,
+        dt_end: dt.datetime,
+        transform_dates=False,
+        columns: list[str] | None = None,
+        backend: str | None = None,
     ):
         """
         Return a pandas Dataframe with data of the endpoint /NrvSaldo/PRL/Betrieblich/.
@@ -196,13 +158,25 @@ class NrvSaldoClient(BaseNtClient):
             transform_dates -- The data contains times with date, time and timezone in separate columns
                                if this option resolves to "True" the times will be transformed into two
                                columns "von" and "bis" that contain fully qualified timestamps. (default: False)
+            columns -- only return these columns, see constants.endpoints for their names (default: all columns)
+            backend -- "pandas", "arrow" or "polars", the type of the result (default: the backend of the client)
         """
-        return self._basic_read_nrvsaldo(
-            "NrvSaldo/PRL/Betrieblich", dt_begin, dt_end, transform_dates
+        return self._read_endpoint(
+            "NrvSaldo/PRL/Betrieblich",
+            dt_begin,
+            dt_end,
+            transform_dates,
+            columns=columns,
+            backend=backend,
         )
 
     def nrvsaldo_prl_qualitaetsgesichert(
-        self, dt_begin: dt.datetime, dt_end: dt.datetime, transform_dates=False
+        self,
+        dt_begin: dt.datetime,
+        dt_end: dt.datetime,
+        transform_dates=False,
+        columns: list[str] | None = None,
+        backend: str | None = None,
     ):
         """
         Return a pandas Dataframe with data of the endpoint /NrvSaldo/PRL/Qualitaetsgesichert/.
@@ -212,13 +186,25 @@ class NrvSaldoClient(BaseNtClient):
             transform_dates -- The data contains times with date, time and timezone in separate columns
                                if this option resolves to "True" the times will be transformed into two
                                columns "von" and "bis" that contain fully qualified timestamps. (default: False)
+            columns -- only return these columns, see constants.endpoints for their names (default: all columns)
+            backend -- "pandas", "arrow" or "polars", the type of the result (default: the backend of the client)
         """
-        return self._basic_read_nrvsaldo(
-            "NrvSaldo/PRL/Qualitaetsgesichert", dt_begin, dt_end, transform_dates
+        return self._read_endpoint(
+            "NrvSaldo/PRL/Qualitaetsgesichert",
+            dt_begin,
+            dt_end,
+            transform_dates,
+            columns=columns,
+            backend=backend,
         )
 
     def nrvsaldo_aktivierte_srl_betrieblich(
-        self, dt_begin: dt.datetime, dt_end: dt.datetime, transform_dates=False
+        self,
+        dt_begin: dt.datetime,
+        dt_end: dt.datetime,
+        transform_dates=False,
+        columns: list[str] | None = None,
+        backend: str | None = None,
     ):
         """
         Return a pandas Dataframe with data of the endpoint /NrvSaldo/AktivierteSRL/Betrieblich/.
@@ -228,13 +214,25 @@ class NrvSaldoClient(BaseNtClient):
             transform_dates -- The data contains times with date, time and timezone in separate columns
                                if this option resolves to "True" the times will be transformed into two
                                columns "von" and "bis" that contain fully qualified timestamps. (default: False)
+            columns -- only return these columns, see constants.endpoints for their names (default: all columns)
+            backend -- "pandas", "arrow" or "polars", the type of the result (default: the backend of the client)
         """
-        return self._basic_read_nrvsaldo(
-            "NrvSaldo/AktivierteSRL/Betrieblich", dt_begin, dt_end, transform_dates
+        return self._read_endpoint(
+            "NrvSaldo/AktivierteSRL/Betrieblich",
+            dt_begin,
+            dt_end,
+            transform_dates,
+            columns=columns,
+            backend=backend,
         )
 
     def nrvsaldo_aktivierte_srl_qualitaetsgesichert(
-        self, dt_begin: dt.datetime, dt_end: dt.datetime, transform_dates=False
+        self,
+        dt_begin: dt.datetime,
+        dt_end: dt.datetime,
+        transform_dates=False,
+        columns: list[str] | None = None,
+        backend: str | None = None,
     ):
         """
         Return a pandas Dataframe with data of the endpoint /NrvSaldo/AktivierteSRL/Qualitaetsgesichert/.
@@ -244,16 +242,25 @@ class NrvSaldoClient(BaseNtClient):
             transform_dates -- The data contains times with date, time and timezone in separate columns
                                if this option resolves to "True" the times will be transformed into two
                                columns "von" and "bis" that contain fully qualified timestamps. (default: False)
+            columns -- only return these columns, see constants.endpoints for their names (default: all columns)
+            backend -- "pandas", "arrow" or "polars", the type of the result (default: the backend of the client)
         """
-        return self._basic_read_nrvsaldo(
+        return self._read_endpoint(
             "NrvSaldo/AktivierteSRL/Qualitaetsgesichert",
             dt_begin,
             dt_end,
             transform_dates,
+            columns=columns,
+            backend=backend,
         )
 
     def nrvsaldo_aktivierte_mrl_betrieblich(
-        self, dt_begin: dt.datetime, dt_end: dt.datetime, transform_dates=False
+        self,
+        dt_begin: dt.datetime,
+        dt_end: dt.datetime,
+        transform_dates=False,
+        columns: list[str] | None = None,
+        backend: str | None = None,
     ):
         """
         Return a pandas Dataframe with data of the endpoint /NrvSaldo/AktivierteMRL/Betrieblich/.
@@ -263,13 +270,25 @@ class NrvSaldoClient(BaseNtClient):
             transform_dates -- The data contains times with date, time and timezone in separate columns
                                if this option resolves to "True" the times will be transformed into two
                                columns "von" and "bis" that contain fully qualified timestamps. (default: False)
+            columns -- only return these columns, see constants.endpoints for their names (default: all columns)
+            backend -- "pandas", "arrow" or "polars", the type of the result (default: the backend of the client)
         """
-        return self._basic_read_nrvsaldo(
-            "NrvSaldo/AktivierteMRL/Betrieblich", dt_begin, dt_end, transform_dates
+        return self._read_endpoint(
+            "NrvSaldo/AktivierteMRL/Betrieblich",
+            dt_begin,
+            dt_end,
+            transform_dates,
+            columns=columns,
+            backend=backend,
         )
 
     def nrvsaldo_aktivierte_mrl_qualitaetsgesichert(
-        self, dt_begin: dt.datetime, dt_end: dt.datetime, transform_dates=False
+        self,
+        dt_begin: dt.datetime,
+        dt_end: dt.datetime,
+        transform_dates=False,
+        columns: list[str] | None = None,
+        backend: str | None = None,
     ):
         """
         Return a pandas Dataframe with data of the endpoint /NrvSaldo/AktivierteMRL/Qualitaetsgesichert/.
@@ -279,16 +298,25 @@ class NrvSaldoClient(BaseNtClient):
             transform_dates -- The data contains times with date, time and timezone in separate columns
                                if this option resolves to "True" the times will be transformed into two
                                columns "von" and "bis" that contain fully qualified timestamps. (default: False)
+            columns -- only return these columns, see constants.endpoints for their names (default: all columns)
+            backend -- "pandas", "arrow" or "polars", the type of the result (default: the backend of the client)
         """
-        return self._basic_read_nrvsaldo(
+        return self._read_endpoint(
             "NrvSaldo/AktivierteMRL/Qualitaetsgesichert",
             dt_begin,
             dt_end,
             transform_dates,
+            columns=columns,
+            backend=backend,
         )
 
     def nrvsaldo_srl_optimierung_betrieblich(
-        self, dt_begin: dt.datetime, dt_end: dt.datetime, transform_dates=False
+        self,
+        dt_begin: dt.datetime,
+        dt_end: dt.datetime,
+        transform_dates=False,
+        columns: list[str] | None = None,
+        backend: str | None = None,
     ):
         """
         Return a pandas Dataframe with data of the endpoint /NrvSaldo/SRLOptimierung/Betrieblich/.
@@ -298,13 +326,25 @@ class NrvSaldoClient(BaseNtClient):
             transform_dates -- The data contains times with date, time and timezone in separate columns
                                if this option resolves to "True" the times will be transformed into two
                                columns "von" and "bis" that contain fully qualified timestamps. (default: False)
+            columns -- only return these columns, see constants.endpoints for their names (default: all columns)
+            backend -- "pandas", "arrow" or "polars", the type of the result (default: the backend of the client)
         """
-        return self._basic_read_nrvsaldo(
-            "NrvSaldo/SRLOptimierung/Betrieblich", dt_begin, dt_end, transform_dates
+        return self._read_endpoint(
+            "NrvSaldo/SRLOptimierung/Betrieblich",
+            dt_begin,
+            dt_end,
+            transform_dates,
+            columns=columns,
+            backend=backend,
         )
 
     def nrvsaldo_srl_optimierung_qualitaetsgesichert(
-        self, dt_begin: dt.datetime, dt_end: dt.datetime, transform_dates=False
+        self,
+        dt_begin: dt.datetime,
+        dt_end: dt.datetime,
+        transform_dates=False,
+        columns: list[str] | None = None,
+        backend: str | None = None,
     ):
         """
         Return a pandas Dataframe with data of the endpoint /NrvSaldo/SRLOptimierung/Qualitaetsgesichert/.
@@ -314,16 +354,25 @@ class NrvSaldoClient(BaseNtClient):
             transform_dates -- The data contains times with date, time and timezone in separate columns
                                if this option resolves to "True" the times will be transformed into two
                                columns "von" and "bis" that contain fully qualified timestamps. (default: False)
+            columns -- only return these columns, see constants.endpoints for their names (default: all columns)
+            backend -- "pandas", "arrow" or "polars", the type of the result (default: the backend of the client)
         """
-        return self._basic_read_nrvsaldo(
+        return self._read_endpoint(
             "NrvSaldo/SRLOptimierung/Qualitaetsgesichert",
             dt_begin,
             dt_end,
             transform_dates,
+            columns=columns,
+            backend=backend,
         )
 
     def nrvsaldo_mrl_optimierung_betrieblich(
-        self, dt_begin: dt.datetime, dt_end: dt.datetime, transform_dates=False
+        self,
+        dt_begin: dt.datetime,
+        dt_end: dt.datetime,
+        transform_dates=False,
+        columns: list[str] | None = None,
+        backend: str | None = None,
     ):
         """
         Return a pandas Dataframe with data of the endpoint /NrvSaldo/MRLOptimierung/Betrieblich/.
@@ -333,13 +382,25 @@ class NrvSaldoClient(BaseNtClient):
             transform_dates -- The data contains times with date, time and timezone in separate columns
                                if this option resolves to "True" the times will be transformed into two
                                columns "von" and "bis" that contain fully qualified timestamps. (default: False)
+            columns -- only return these columns, see constants.endpoints for their names (default: all columns)
+            backend -- "pandas", "arrow" or "polars", the type of the result (default: the backend of the client)
         """
-        return self._basic_read_nrvsaldo(
-            "NrvSaldo/MRLOptimierung/Betrieblich", dt_begin, dt_end, transform_dates
+        return self._read_endpoint(
+            "NrvSaldo/MRLOptimierung/Betrieblich",
+            dt_begin,
+            dt_end,
+            transform_dates,
+            columns=columns,
+            backend=backend,
         )
 
     def nrvsaldo_mrl_optimierung_qualitaetsgesichert(
-        self, dt_begin: dt.datetime, dt_end: dt.datetime, transform_dates=False
+        self,
+        dt_begin: dt.datetime,
+        dt_end: dt.datetime,
+        transform_dates=False,
+        columns: list[str] | None = None,
+        backend: str | None = None,
     ):
         """
         Return a pandas Dataframe with data of the endpoint /NrvSaldo/MRLOptimierung/Qualitaetsgesichert/.
@@ -349,16 +410,25 @@ class NrvSaldoClient(BaseNtClient):
             transform_dates -- The data contains times with date, time and timezone in separate columns
                                if this option resolves to "True" the times will be transformed into two
                                columns "von" and "bis" that contain fully qualified timestamps. (default: False)
+            columns -- only return these columns, see constants.endpoints for their names (default: all columns)
+            backend -- "pandas", "arrow" or "polars", the type of the result (default: the backend of the client)
         """
-        return self._basic_read_nrvsaldo(
+        return self._read_endpoint(
             "NrvSaldo/MRLOptimierung/Qualitaetsgesichert",
             dt_begin,
             dt_end,
             transform_dates,
+            columns=columns,
+            backend=backend,
         )
 
     def nrvsaldo_mrl_mol_abweichungen_betrieblich(
-        self, dt_begin: dt.datetime, dt_end: dt.datetime, transform_dates=False
+        self,
+        dt_begin: dt.datetime,
+        dt_end: dt.datetime,
+        transform_dates=False,
+        columns: list[str] | None = None,
+        backend: str | None = None,
     ):
         """
         Return a pandas Dataframe with data of the endpoint /NrvSaldo/MrlMolAbweichungen/Betrieblich/.
@@ -368,13 +438,25 @@ class NrvSaldoClient(BaseNtClient):
             transform_dates -- The data contains times with date, time and timezone in separate columns
                                if this option resolves to "True" the times will be transformed into two
                                columns "von" and "bis" that contain fully qualified timestamps. (default: False)
+            columns -- only return these columns, see constants.endpoints for their names (default: all columns)
+            backend -- "pandas", "arrow" or "polars", the type of the result (default: the backend of the client)
         """
-        return self._basic_read_nrvsaldo(
-            "NrvSaldo/MrlMolAbweichungen/Betrieblich", dt_begin, dt_end, transform_dates
+        return self._read_endpoint(
+            "NrvSaldo/MrlMolAbweichungen/Betrieblich",
+            dt_begin,
+            dt_end,
+            transform_dates,
+            columns=columns,
+            backend=backend,
         )
 
     def nrvsaldo_srl_mol_abweichungen_betrieblich(
-        self, dt_begin: dt.datetime, dt_end: dt.datetime, transform_dates=False
+        self,
+        dt_begin: dt.datetime,
+        dt_end: dt.datetime,
+        transform_dates=False,
+        columns: list[str] | None = None,
+        backend: str | None = None,
     ):
         """
         Return a pandas Dataframe with data of the endpoint /NrvSaldo/SrlMolAbweichungen/Betrieblich/.
@@ -384,77 +466,25 @@ class NrvSaldoClient(BaseNtClient):
             transform_dates -- The data contains times with date, time and timezone in separate columns
                                if this option resolves to "True" the times will be transformed into two
                                columns "von" and "bis" that contain fully qualified timestamps. (default: False)
+            columns -- only return these columns, see constants.endpoints for their names (default: all columns)
+            backend -- "pandas", "arrow" or "polars", the type of the result (default: the backend of the client)
         """
-        if not self._check_preconditions(
+        return self._read_endpoint(
+            "NrvSaldo/SrlMolAbweichungen/Betrieblich",
             dt_begin,
-            endpoints["/NrvSaldo/SrlMolAbweichungen/Betrieblich"]["first_data"],
             dt_end,
-        ):
-            return self._return_empty_frame(
-                "/NrvSaldo/SrlMolAbweichungen/Betrieblich", transform_dates
-            )
-
-        url = f"{self._API_BASE_URL}/data/NrvSaldo/SrlMolAbweichungen/Betrieblich"
-        if (dt_begin is not None) and (dt_end is not None):
-            dt_begin = dt_begin.replace(tzinfo=dt.UTC)
-            dt_end = dt_end.replace(tzinfo=dt.UTC)
-            if (dt_begin + self.max_query_distance) < dt_end:
-                # split into multiple api calls
-                timeframes = self._split_timeframe(dt_begin, dt_end)
-                dataframes = []
-                for timeframe in timeframes:
-                    dataframes.append(
-                        self.nrvsaldo_srl_mol_abweichungen_betrieblich(
-                            timeframe[0], timeframe[1], transform_dates
-                        )
-                    )
-                return pd.concat(dataframes)
-            start_of_data = dt_begin.strftime(self._api_date_format)
-            end_of_data = dt_end.strftime(self._api_date_format)
-            url = url + f"/{start_of_data}/{end_of_data}"
-
-        response = requests.get(
-            url, headers={"Authorization": "Bearer {}".format(self.token)}
-        )
-        response.raise_for_status()
-        df = pd.read_csv(
-            io.StringIO(response.text),
-            sep=";",
-            header=0,
-            decimal=",",
-            na_values=["N.A.", ""],
+            transform_dates,
+            columns=columns,
+            backend=backend,
         )
 
-        if transform_dates:
-            df["von"] = pd.to_datetime(
-                df["Datum von"] + " " + df["Uhrzeit von"] + " " + df["Zeitzone von"],
-                format=_nrvsaldo_date_format,
-                utc=True
-            )
-            df["bis"] = pd.to_datetime(
-                df["Datum bis"] + " " + df["Uhrzeit bis"] + " " + df["Zeitzone bis"],
-                format=_nrvsaldo_date_format,
-                utc=True
-            )
-            # The end of timeframes may be 00:00 of the next day witch is not correctly represented in timestamps
-            df["bis"] = df["bis"].where(
-                df["bis"].dt.time != dt.time(0, 0), df["bis"] + dt.timedelta(days=1)
-            )
-            df = df.drop(
-                [
-                    "Datum von",
-                    "Uhrzeit von",
-                    "Zeitzone von",
-                    "Datum bis",
-                    "Uhrzeit bis",
-                    "Zeitzone bis",
-                ],
-                axis=1,
-            ).set_index("von")
-        return df
-
     def nrvsaldo_difference_betrieblich(
-        self, dt_begin: dt.datetime, dt_end: dt.datetime, transform_dates=False
+        self,
+        dt_begin: dt.datetime,
+        dt_end: dt.datetime,
+        transform_dates=False,
+        columns: list[str] | None = None,
+        backend: str | None = None,
     ):
         """
         Return a pandas Dataframe with data of the endpoint /NrvSaldo/Difference/Betrieblich/.
@@ -464,13 +494,25 @@ class NrvSaldoClient(BaseNtClient):
             transform_dates -- The data contains times with date, time and timezone in separate columns
                                if this option resolves to "True" the times will be transformed into two
                                columns "von" and "bis" that contain fully qualified timestamps. (default: False)
+            columns -- only return these columns, see constants.endpoints for their names (default: all columns)
+            backend -- "pandas", "arrow" or "polars", the type of the result (default: the backend of the client)
         """
-        return self._basic_read_nrvsaldo(
-            "NrvSaldo/Difference/Betrieblich", dt_begin, dt_end, transform_dates
+        return self._read_endpoint(
+            "NrvSaldo/Difference/Betrieblich",
+            dt_begin,
+            dt_end,
+            transform_dates,
+            columns=columns,
+            backend=backend,
         )
 
     def nrvsaldo_difference_qualitaetsgesichert(
-        self, dt_begin: dt.datetime, dt_end: dt.datetime, transform_dates=False
+        self,
+        dt_begin: dt.datetime,
+        dt_end: dt.datetime,
+        transform_dates=False,
+        columns: list[str] | None = None,
+        backend: str | None = None,
     ):
         """
         Return a pandas Dataframe with data of the endpoint /NrvSaldo/Difference/Qualitaetsgesichert/.
@@ -480,13 +522,25 @@ class NrvSaldoClient(BaseNtClient):
             transform_dates -- The data contains times with date, time and timezone in separate columns
                                if this option resolves to "True" the times will be transformed into two
                                columns "von" and "bis" that contain fully qualified timestamps. (default: False)
+            columns -- only return these columns, see constants.endpoints for their names (default: all columns)
+            backend -- "pandas", "arrow" or "polars", the type of the result (default: the backend of the client)
         """
-        return self._basic_read_nrvsaldo(
-            "NrvSaldo/Difference/Qualitaetsgesichert", dt_begin, dt_end, transform_dates
+        return self._read_endpoint(
+            "NrvSaldo/Difference/Qualitaetsgesichert",
+            dt_begin,
+            dt_end,
+            transform_dates,
+            columns=columns,
+            backend=backend,
         )
 
     def nrvsaldo_abschaltbare_lasten_betrieblich(
-        self, dt_begin: dt.datetime, dt_end: dt.datetime, transform_dates=False
+        self,
+        dt_begin: dt.datetime,
+        dt_end: dt.datetime,
+        transform_dates=False,
+        columns: list[str] | None = None,
+        backend: str | None = None,
     ):
         """
         Return a pandas Dataframe with data of the endpoint /NrvSaldo/AbschaltbareLasten/Betrieblich/.
@@ -496,13 +550,25 @@ class NrvSaldoClient(BaseNtClient):
             transform_dates -- The data contains times with date, time and timezone in separate columns
                                if this option resolves to "True" the times will be transformed into two
                                columns "von" and "bis" that contain fully qualified timestamps. (default: False)
+            columns -- only return these columns, see constants.endpoints for their names (default: all columns)
+            backend -- "pandas", "arrow" or "polars", the type of the result (default: the backend of the client)
         """
-        return self._basic_read_nrvsaldo(
-            "NrvSaldo/AbschaltbareLasten/Betrieblich", dt_begin, dt_end, transform_dates
+        return self._read_endpoint(
+            "NrvSaldo/AbschaltbareLasten/Betrieblich",
+            dt_begin,
+            dt_end,
+            transform_dates,
+            columns=columns,
+            backend=backend,
         )
 
     def nrvsaldo_abschaltbare_lasten_qualitaetsgesichert(
-        self, dt_begin: dt.datetime, dt_end: dt.datetime, transform_dates=False
+        self,
+        dt_begin: dt.datetime,
+        dt_end: dt.datetime,
+        transform_dates=False,
+        columns: list[str] | None = None,
+        backend: str | None = None,
     ):
         """
         Return a pandas Dataframe with data of the endpoint /NrvSaldo/AbschaltbareLasten/Qualitaetsgesichert/.
@@ -512,16 +578,25 @@ class NrvSaldoClient(BaseNtClient):
             transform_dates -- The data contains times with date, time and timezone in separate columns
                                if this option resolves to "True" the times will be transformed into two
                                columns "von" and "bis" that contain fully qualified timestamps. (default: False)
+            columns -- only return these columns, see constants.endpoints for their names (default: all columns)
+            backend -- "pandas", "arrow" or "polars", the type of the result (default: the backend of the client)
         """
-        return self._basic_read_nrvsaldo(
+        return self._read_endpoint(
             "NrvSaldo/AbschaltbareLasten/Qualitaetsgesichert",
             dt_begin,
             dt_end,
             transform_dates,
+            columns=columns,
+            backend=backend,
         )
 
     def nrvsaldo_zusatzmassnahmen_betrieblich(
-        self, dt_begin: dt.datetime, dt_end: dt.datetime, transform_dates=False
+        self,
+        dt_begin: dt.datetime,
+        dt_end: dt.datetime,
+        transform_dates=False,
+        columns: list[str] | None = None,
+        backend: str | None = None,
     ):
         """
         Return a pandas Dataframe with data of the endpoint /NrvSaldo/Zusatzmassnahmen/Betrieblich/.
@@ -531,13 +606,25 @@ class NrvSaldoClient(BaseNtClient):
             transform_dates -- The data contains times with date, time and timezone in separate columns
                                if this option resolves to "True" the times will be transformed into two
                                columns "von" and "bis" that contain fully qualified timestamps. (default: False)
+            columns -- only return these columns, see constants.endpoints for their names (default: all columns)
+            backend -- "pandas", "arrow" or "polars", the type of the result (default: the backend of the client)
         """
-        return self._basic_read_nrvsaldo(
-            "NrvSaldo/Zusatzmassnahmen/Betrieblich", dt_begin, dt_end, transform_dates
+        return self._read_endpoint(
+            "NrvSaldo/Zusatzmassnahmen/Betrieblich",
+            dt_begin,
+            dt_end,
+            transform_dates,
+            columns=columns,
+            backend=backend,
         )
 
     def nrvsaldo_zusatzmassnahmen_qualitaetsgesichert(
-        self, dt_begin: dt.datetime, dt_end: dt.datetime, transform_dates=False
+        self,
+        dt_begin: dt.datetime,
+        dt_end: dt.datetime,
+        transform_dates=False,
+        columns: list[str] | None = None,
+        backend: str | None = None,
     ):
         """
         Return a pandas Dataframe with data of the endpoint /NrvSaldo/Zusatzmassnahmen/Qualitaetsgesichert/.
@@ -547,16 +634,25 @@ class NrvSaldoClient(BaseNtClient):
             transform_dates -- The data contains times with date, time and timezone in separate columns
                                if this option resolves to "True" the times will be transformed into two
                                columns "von" and "bis" that contain fully qualified timestamps. (default: False)
+            columns -- only return these columns, see constants.endpoints for their names (default: all columns)
+            backend -- "pandas", "arrow" or "polars", the type of the result (default: the backend of the client)
         """
-        return self._basic_read_nrvsaldo(
+        return self._read_endpoint(
             "NrvSaldo/Zusatzmassnahmen/Qualitaetsgesichert",
             dt_begin,
             dt_end,
             transform_dates,
+            columns=columns,
+            backend=backend,
         )
 
     def nrvsaldo_nothilfe_betrieblich(
-        self, dt_begin: dt.datetime, dt_end: dt.datetime, transform_dates=False
+        self,
+        dt_begin: dt.datetime,
+        dt_end: dt.datetime,
+        transform_dates=False,
+        columns: list[str] | None = None,
+        backend: str | None = None,
     ):
         """
         Return a pandas Dataframe with data of the endpoint /NrvSaldo/Nothilfe/Betrieblich/.
@@ -566,13 +662,25 @@ class NrvSaldoClient(BaseNtClient):
             transform_dates -- The data contains times with date, time and timezone in separate columns
                                if this option resolves to "True" the times will be transformed into two
                                columns "von" and "bis" that contain fully qualified timestamps. (default: False)
+            columns -- only return these columns, see constants.endpoints for their names (default: all columns)
+            backend -- "pandas", "arrow" or "polars", the type of the result (default: the backend of the client)
         """
-        return self._basic_read_nrvsaldo(
-            "NrvSaldo/Nothilfe/Betrieblich", dt_begin, dt_end, transform_dates
+        return self._read_endpoint(
+            "NrvSaldo/Nothilfe/Betrieblich",
+            dt_begin,
+            dt_end,
+            transform_dates,
+            columns=columns,
+            backend=backend,
         )
 
     def nrvsaldo_nothilfe_qualitaetsgesichert(
-        self, dt_begin: dt.datetime, dt_end: dt.datetime, transform_dates=False
+        self,
+        dt_begin: dt.datetime,
+        dt_end: dt.datetime,
+        transform_dates=False,
+        columns: list[str] | None = None,
+        backend: str | None = None,
     ):
         """
         Return a pandas Dataframe with data of the endpoint /NrvSaldo/Nothilfe/Qualitaetsgesichert/.
@@ -582,13 +690,25 @@ class NrvSaldoClient(BaseNtClient):
             transform_dates -- The data contains times with date, time and timezone in separate columns
                                if this option resolves to "True" the times will be transformed into two
                                columns "von" and "bis" that contain fully qualified timestamps. (default: False)
+            columns -- only return these columns, see constants.endpoints for their names (default: all columns)
+            backend -- "pandas", "arrow" or "polars", the type of the result (default: the backend of the client)
         """
-        return self._basic_read_nrvsaldo(
-            "NrvSaldo/Nothilfe/Qualitaetsgesichert", dt_begin, dt_end, transform_dates
+        return self._read_endpoint(
+            "NrvSaldo/Nothilfe/Qualitaetsgesichert",
+            dt_begin,
+            dt_end,
+            transform_dates,
+            columns=columns,
+            backend=backend,
         )
 
     def nrvsaldo_rebap_qualitaetsgesichert(
-        self, dt_begin: dt.datetime, dt_end: dt.datetime, transform_dates=False
+        self,
+        dt_begin: dt.datetime,
+        dt_end: dt.datetime,
+        transform_dates=False,
+        columns: list[str] | None = None,
+        backend: str | None = None,
     ):
         """
         Return a pandas Dataframe with data of the endpoint /NrvSaldo/reBAP/Qualitaetsgesichert/.
@@ -598,13 +718,25 @@ class NrvSaldoClient(BaseNtClient):
             transform_dates -- The data contains times with date, time and timezone in separate columns
                                if this option resolves to "True" the times will be transformed into two
                                columns "von" and "bis" that contain fully qualified timestamps. (default: False)
+            columns -- only return these columns, see constants.endpoints for their names (default: all columns)
+            backend -- "pandas", "arrow" or "polars", the type of the result (default: the backend of the client)
         """
-        return self._basic_read_nrvsaldo(
-            "NrvSaldo/reBAP/Qualitaetsgesichert", dt_begin, dt_end, transform_dates
+        return self._read_endpoint(
+            "NrvSaldo/reBAP/Qualitaetsgesichert",
+            dt_begin,
+            dt_end,
+            transform_dates,
+            columns=columns,
+            backend=backend,
         )
 
     def nrvsaldo_aep_module_qualitaetsgesichert(
-        self, dt_begin: dt.datetime, dt_end: dt.datetime, transform_dates=False
+        self,
+        dt_begin: dt.datetime,
+        dt_end: dt.datetime,
+        transform_dates=False,
+        columns: list[str] | None = None,
+        backend: str | None = None,
     ):
         """
         Return a pandas Dataframe with data of the endpoint /NrvSaldo/AEPModule/Qualitaetsgesichert/.
@@ -614,13 +746,25 @@ class NrvSaldoClient(BaseNtClient):
             transform_dates -- The data contains times with date, time and timezone in separate columns
                                if this option resolves to "True" the times will be transformed into two
                                columns "von" and "bis" that contain fully qualified timestamps. (default: False)
+            columns -- only return these columns, see constants.endpoints for their names (default: all columns)
+            backend -- "pandas", "arrow" or "polars", the type of the result (default: the backend of the client)
         """
-        return self._basic_read_nrvsaldo(
-            "NrvSaldo/AEPModule/Qualitaetsgesichert", dt_begin, dt_end, transform_dates
+        return self._read_endpoint(
+            "NrvSaldo/AEPModule/Qualitaetsgesichert",
+            dt_begin,
+            dt_end,
+            transform_dates,
+            columns=columns,
+            backend=backend,
         )
 
     def nrvsaldo_aep_schaetzer_betrieblich(
-        self, dt_begin: dt.datetime, dt_end: dt.datetime, transform_dates=False
+        self,
+        dt_begin: dt.datetime,
+        dt_end: dt.datetime,
+        transform_dates=False,
+        columns: list[str] | None = None,
+        backend: str | None = None,
     ):
         """
         Return a pandas Dataframe with data of the endpoint /NrvSaldo/AepSchaetzer/Betrieblich/.
@@ -630,13 +774,25 @@ class NrvSaldoClient(BaseNtClient):
             transform_dates -- The data contains times with date, time and timezone in separate columns
                                if this option resolves to "True" the times will be transformed into two
                                columns "von" and "bis" that contain fully qualified timestamps. (default: False)
+            columns -- only return these columns, see constants.endpoints for their names (default: all columns)
+            backend -- "pandas", "arrow" or "polars", the type of the result (default: the backend of the client)
         """
-        return self._basic_read_nrvsaldo(
-            "NrvSaldo/AepSchaetzer/Betrieblich", dt_begin, dt_end, transform_dates
+        return self._read_endpoint(
+            "NrvSaldo/AepSchaetzer/Betrieblich",
+            dt_begin,
+            dt_end,
+            transform_dates,
+            columns=columns,
+            backend=backend,
         )
 
     def nrvsaldo_finanzielle_wirkung_aep_module_qualitaetsgesichert(
-        self, dt_begin: dt.datetime, dt_end: dt.datetime, transform_dates=False
+        self,
+        dt_begin: dt.datetime,
+        dt_end: dt.datetime,
+        transform_dates=False,
+        columns: list[str] | None = None,
+        backend: str | None = None,
     ):
         """
         Return a pandas Dataframe with data of the endpoint /NrvSaldo/FinanzielleWirkungAEPModule/Qualitaetsgesichert/.
@@ -646,16 +802,25 @@ class NrvSaldoClient(BaseNtClient):
             transform_dates -- The data contains times with date, time and timezone in separate columns
                                if this option resolves to "True" the times will be transformed into two
                                columns "von" and "bis" that contain fully qualified timestamps. (default: False)
+            columns -- only return these columns, see constants.endpoints for their names (default: all columns)
+            backend -- "pandas", "arrow" or "polars", the type of the result (default: the backend of the client)
         """
-        return self._basic_read_nrvsaldo(
+        return self._read_endpoint(
             "NrvSaldo/FinanzielleWirkungAEPModule/Qualitaetsgesichert",
             dt_begin,
             dt_end,
             transform_dates,
+            columns=columns,
+            backend=backend,
         )
 
     def nrvsaldo_voaa_qualitaetsgesichert(
-        self, dt_begin: dt.datetime, dt_end: dt.datetime, transform_dates=False
+        self,
+        dt_begin: dt.datetime,
+        dt_end: dt.datetime,
+        transform_dates=False,
+        columns: list[str] | None = None,
+        backend: str | None = None,
     ):
         """
         Return a pandas Dataframe with data of the endpoint /NrvSaldo/VoAA/Qualitaetsgesichert/.
@@ -665,7 +830,14 @@ class NrvSaldoClient(BaseNtClient):
             transform_dates -- The data contains times with date, time and timezone in separate columns
                                if this option resolves to "True" the times will be transformed into two
                                columns "von" and "bis" that contain fully qualified timestamps. (default: False)
+            columns -- only return these columns, see constants.endpoints for their names (default: all columns)
+            backend -- "pandas", "arrow" or "polars", the type of the result (default: the backend of the client)
         """
-        return self._basic_read_nrvsaldo(
-            "NrvSaldo/VoAA/Qualitaetsgesichert", dt_begin, dt_end, transform_dates
+        return self._read_endpoint(
+            "NrvSaldo/VoAA/Qualitaetsgesichert",
+            dt_begin,
+            dt_end,
+            transform_dates,
+            columns=columns,
+            backend=backend,
         )
@@ -0,0 +1,771 @@
+"""
+Parsing of API responses into pandas Dataframes or pyarrow Tables.
+Shared by the synchronous and the asynchronous clients.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import datetime as dt
+import functools
+import io
+import re
+from typing import BinaryIO
+
+from netztransparenz import _lazy
+
+np = _lazy.load("numpy")
+pd = _lazy.load("pandas")
+pyarrow = _lazy.load("pyarrow", "csv", "compute", optional=True)
+polars = _lazy.load("polars", optional=True)
+
+csv_date_format = "%Y-%m-%d %H:%M %Z"
+nrvsaldo_date_format = "%d.%m.%Y %H:%M %Z"
+CSV_ENGINES = ("c", "pyarrow")
+BACKENDS = ("pandas", "arrow", "polars")
+# strings pandas treats as missing values in addition to the na_values of an endpoint
+_DEFAULT_NA_VALUES = [
+    "",
+    "#N/A",
+    "#N/A N/A",
+    "#NA",
+    "-1.#IND",
+    "-1.#QNAN",
+    "-NaN",
+    "-nan",
+    "1.#IND",
+    "1.#QNAN",
+    "<NA>",
+    "N/A",
+    "NA",
+    "NULL",
+    "NaN",
+    "None",
+    "n/a",
+    "nan",
+    "null",
+]
+# a number with "." as thousands separator, which some responses contain although the endpoint uses none
+_GROUPED_NUMBER = r"^[+-]?\d{1,3}(?:\.\d{3})+(?:,\d*)?$"
+_FLOAT_DTYPES = ("float32", "float64")
+
+
+def _open(body: str | bytes | BinaryIO) -> io.BufferedIOBase:
+    """
+    Return the response body as a buffered binary stream. The parsers read bytes,
+    so a body that is streamed from the connection is never decoded into a str as a whole.
+    """
+    if isinstance(body, str):
+        body = body.encode()
+    if isinstance(body, bytes):
+        return io.BufferedReader(io.BytesIO(body))
+    return body if hasattr(body, "peek") else io.BufferedReader(body)
+
+
+def _unique(names: list[str]) -> list[str]:
+    # duplicate column names get a suffix like with pd.read_csv, e.g. "Zeitzone" and "Zeitzone.1"
+    seen = {}
+    result = []
+    for name in names:
+        if name in seen:
+            seen[name] += 1
+            name = f"{name}.{seen[name]}"
+        else:
+            seen[name] = 0
+        result.append(name)
+    return result
+
+
+def read_csv(
+    body: str | bytes | BinaryIO,
+    na_values: list[str],
+    thousands: str | None = None,
+    engine: str = "c",
+    arrow_dtypes: bool = False,
+    dtypes: dict[str, object] | None = None,
+    usecols: set[str] | None = None,
+) -> pd.DataFrame:
+    """
+    Parse the CSV format used by all csv endpoints of the API.
+    Values are separated by ";" and use "," as decimal separator.
+
+        body -- response body as str, bytes or a binary file object that is read incrementally
+        na_values -- strings that mark missing values
+        thousands -- thousands separator, if the endpoint uses one
+        engine -- "c" parses with pandas, "pyarrow" with the multithreaded reader of pyarrow
+        arrow_dtypes -- if True, the columns use pyarrow backed dtypes
+        dtypes -- dtypes of columns that are not inferred, see Schema.dtypes
+        usecols -- only these columns are parsed, None parses all columns
+    """
+    if engine == "pyarrow":
+        table = read_arrow(body, na_values, thousands, dtypes, usecols)
+        return table.to_pandas(types_mapper=pd.ArrowDtype if arrow_dtypes else None)
+    options = {"dtype_backend": "pyarrow"} if arrow_dtypes else {}
+    dtypes = dtypes or {}
+    # floats are inferred and converted afterwards, a forced float dtype fails at the first value that is no number
+    floats = {
+        column: dtype for column, dtype in dtypes.items() if dtype in _FLOAT_DTYPES
+    }
+    dtypes = {column: dtype for column, dtype in dtypes.items() if column not in floats}
+    if dtypes:
+        options["dtype"] = dtypes
+    if usecols is not None:
+        # a callable does not fail for columns that are missing in the response
+        options["usecols"] = usecols.__contains__
+    df = pd.read_csv(
+        _open(body),
+        encoding="utf-8",
+        sep=";",
+        header=0,
+        decimal=",",
+        thousands=thousands,
+        na_values=na_values,
+        **options,
+    )
+    for column, dtype in floats.items():
+        if column in df.columns:
+            if arrow_dtypes:
+                dtype = pd.ArrowDtype(pyarrow.from_numpy_dtype(np.dtype(dtype)))
+            values = df[column]
+            if not pd.api.types.is_numeric_dtype(values.dtype):
+                values = to_float(values, thousands)
+            if values.dtype != dtype:
+                df[column] = values.astype(dtype)
+    return df
+
+
+def to_float(values: pd.Series, thousands: str | None = None) -> pd.Series:
+    """
+    Convert a column of numbers with "," as decimal separator to float64.
+    Values that are no number, like "N.E." of endpoints that do not list it as missing value, become NaN.
+    """
+    values = values.astype("string")
+    if thousands is not None:
+        values = values.str.replace(thousands, "", regex=False)
+    else:
+        grouped = values.str.fullmatch(_GROUPED_NUMBER).fillna(False)
+        values = values.where(~grouped, values.str.replace(".", "", regex=False))
+    values = values.str.replace(",", ".", regex=False)
+    return pd.to_numeric(values, errors="coerce").astype("float64")
+
+
+def read_arrow(
+    body: str | bytes | BinaryIO,
+    na_values: list[str],
+    thousands: str | None = None,
+    dtypes: dict[str, object] | None = None,
+    usecols: set[str] | None = None,
+) -> pyarrow.Table:
+    """
+    Parse the CSV format used by all csv endpoints of the API into a pyarrow Table with the
+    multithreaded reader of pyarrow. Columns are typed like pd.read_csv would type them.
+
+        body -- response body as str, bytes or a binary file object that is read incrementally
+        na_values -- strings that mark missing values
+        thousands -- thousands separator, if the endpoint uses one
+        dtypes -- dtypes of columns that are not inferred, see Schema.dtypes
+        usecols -- only these columns are parsed, None parses all columns
+    """
+    stream = _open(body)
+    header = stream.readline().decode().rstrip("\r\n")
+    if not header.strip():
+        raise pd.errors.EmptyDataError("No columns to parse from file")
+    names = _unique(header.split(";"))
+    include = (
+        [name for name in names if name in usecols] if usecols is not None else None
+    )
+    if not stream.peek(1):
+        # pyarrow cannot read a response without rows
+        selected = include if include is not None else names
+        table = pyarrow.table(
+            {name: pyarrow.array([], pyarrow.string()) for name in selected}
+        )
+    else:
+        # every column is read as string, the type inference of pyarrow would turn dates and times into
+        # temporal types while the transformations expect the strings of the response
+        table = pyarrow.csv.read_csv(
+            stream,
+            read_options=pyarrow.csv.ReadOptions(use_threads=True, column_names=names),
+            parse_options=pyarrow.csv.ParseOptions(delimiter=";"),
+            convert_options=pyarrow.csv.ConvertOptions(
+                column_types={name: pyarrow.string() for name in names},
+                include_columns=include,
+                null_values=_DEFAULT_NA_VALUES + list(na_values),
+                strings_can_be_null=True,
+            ),
+        )
+    dtypes = dtypes or {}
+    return pyarrow.Table.from_arrays(
+        [
+            _convert(column, thousands, dtypes[name])
+            if name in dtypes
+            else _to_number(column, thousands)
+            for name, column in zip(table.column_names, table.columns)
+        ],
+        names=table.column_names,
+    )
+
+
+def _convert(column: pyarrow.ChunkedArray, thousands: str | None, dtype: object):
+    # convert a column of strings to the dtype of the schema
+    if dtype == "category":
+        return pyarrow.compute.dictionary_encode(column)
+    if dtype in _FLOAT_DTYPES:
+        type = pyarrow.from_numpy_dtype(np.dtype(dtype))
+        if thousands is not None:
+            column = pyarrow.compute.replace_substring(column, thousands, "")
+        numbers = pyarrow.compute.replace_substring(column, ",", ".")
+        try:
+            return numbers.cast(type)
+        except pyarrow.ArrowInvalid:
+            # values that are no number become null, see to_float
+            values = to_float(column.to_pandas(), thousands)
+            return pyarrow.chunked_array(
+                [pyarrow.array(values, type=type, from_pandas=True)]
+            )
+    return column
+
+
+def _number_pattern(thousands: str | None) -> re.Pattern:
+    digits = rf"[\d{re.escape(thousands)}]+" if thousands is not None else r"\d+"
+    return re.compile(rf"[+-]?{digits}(?:,\d*)?(?:[eE][+-]?\d+)?")
+
+
+def _first_value(column: pyarrow.ChunkedArray) -> str:
+    values = column.slice(0, 100).drop_null()
+    if len(values) == 0:
+        values = column.drop_null()
+    return values[0].as_py()
+
+
+def _to_number(column: pyarrow.ChunkedArray, thousands: str | None):
+    # convert a column of strings to int64 or float64 if every value is a number with "," as decimal separator
+    if len(column) == 0:
+        return column
+    if column.null_count == len(column):
+        return column.cast(pyarrow.float64())
+    # most columns with text are recognized by their first value without looking at the whole column
+    if _number_pattern(thousands).fullmatch(_first_value(column)) is None:
+        return column
+    if thousands is not None:
+        column = pyarrow.compute.replace_substring(column, thousands, "")
+    elif pyarrow.compute.any(pyarrow.compute.match_substring(column, ".")).as_py():
+        return column
+    # casts fail at the first value that is not a number
+    if column.null_count == 0:
+        with contextlib.suppress(pyarrow.ArrowInvalid):
+            return column.cast(pyarrow.int64())
+    try:
+        return pyarrow.compute.replace_substring(column, ",", ".").cast(
+            pyarrow.float64()
+        )
+    except pyarrow.ArrowInvalid:
+        return column
+
+
+def arrow_backed(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Return df with pyarrow backed dtypes, like read_csv returns with arrow_dtypes.
+    """
+    if all(isinstance(dtype, pd.ArrowDtype) for dtype in df.dtypes):
+        return df
+    return pyarrow.Table.from_pandas(df).to_pandas(types_mapper=pd.ArrowDtype)
+
+
+def read_json(body: str | bytes | BinaryIO) -> pd.DataFrame:
+    return pd.read_json(_open(body))
+
+
+def _timestamps(
+    date: pd.Series,
+    time: pd.Series,
+    zone: pd.Series,
+    date_format: str,
+    end: bool = False,
+) -> pd.Series:
+    """
+    Combine separate date, time and timezone columns into UTC timestamps.
+    Every distinct date, time and timezone is parsed only once, the rows are combined with integer arithmetic.
+
+        date_format -- format of date, time and timezone separated by spaces, e.g. "%d.%m.%Y %H:%M %Z"
+        end -- if True, the timestamps are the end of timeframes. An end at 00:00 belongs to the next day.
+    """
+    values = _combine(
+        *pd.factorize(date), *pd.factorize(time), *pd.factorize(zone), date_format, end
+    )
+    if values is None:
+        return _timestamps_from_strings(date, time, zone, date_format, end)
+    return pd.Series(pd.DatetimeIndex(values).tz_localize("UTC"), index=date.index)
+
+
+def _combine(
+    date_codes: np.ndarray,
+    dates,
+    time_codes: np.ndarray,
+    times,
+    zone_codes: np.ndarray,
+    zones,
+    date_format: str,
+    end: bool,
+) -> np.ndarray | None:
+    """
+    Return the UTC timestamps of factorized date, time and timezone columns, see _timestamps.
+    Returns None for formats and timezones the arithmetic does not support.
+    """
+    date_format, time_format, zone_format = date_format.split(" ")
+    offsets = [_zone_offset(zone) for zone in zones] if zone_format == "%Z" else []
+    if time_format != "%H:%M" or zone_format != "%Z" or None in offsets:
+        return None
+    # missing values have the code -1, so they select the NaT appended to every lookup table
+    days = np.append(
+        pd.to_datetime(dates, format=date_format).to_numpy(), np.datetime64("NaT", "s")
+    )
+    minutes = np.array(
+        [_minutes(value) for value in times] + ["NaT"], dtype="timedelta64[m]"
+    )
+    offsets = np.array(offsets + ["NaT"], dtype="timedelta64[m]")
+    values = days[date_codes] + minutes[time_codes] - offsets[zone_codes]
+    if end:
+        midnight = values == values.astype("datetime64[D]")
+        values = values + np.where(
+            midnight, np.timedelta64(1, "D"), np.timedelta64(0, "D")
+        )
+    return values
+
+
+def _minutes(value: str) -> int:
+    moment = dt.datetime.strptime(value, "%H:%M")
+    return moment.hour * 60 + moment.minute
+
+
+@functools.cache
+def _zone_offset(zone: str) -> int | None:
+    # offset of the timezone to UTC in minutes, None if it changes during the year like CET
+    moments = pd.to_datetime(
+        [f"2000-01-01 00:00 {zone}", f"2000-07-01 00:00 {zone}"],
+        format="%Y-%m-%d %H:%M %Z",
+        utc=True,
+    )
+    offsets = {
+        (local - moment.tz_localize(None)) // pd.Timedelta(minutes=1)
+        for local, moment in zip(
+            (pd.Timestamp(2000, 1, 1), pd.Timestamp(2000, 7, 1)), moments
+        )
+    }
+    return offsets.pop() if len(offsets) == 1 else None
+
+
+def _timestamps_from_strings(
+    date: pd.Series, time: pd.Series, zone: pd.Series, date_format: str, end: bool
+) -> pd.Series:
+    date, time, zone = (_strings(values) for values in (date, time, zone))
+    timestamps = pd.to_datetime(
+        date + " " + time + " " + zone, format=date_format, utc=True
+    )
+    if end:
+        # The end of timeframes may be 00:00 of the next day which is not correctly represented in timestamps
+        timestamps = timestamps.where(
+            timestamps.dt.time != dt.time(0, 0), timestamps + dt.timedelta(days=1)
+        )
+    return timestamps
+
+
+def _strings(values: pd.Series) -> pd.Series:
+    # categorical columns cannot be concatenated, they are converted back to the type of their values
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        return values.astype(values.cat.categories.dtype)
+    return values
+
+
+def transform_nt(df: pd.DataFrame, date_format: str = csv_date_format) -> pd.DataFrame:
+    """
+    Transform the columns "Datum", "von", "Zeitzone von", "bis", "Zeitzone bis" into the
+    timestamps "von" and "bis". "von" becomes the index.
+    """
+    df["von"] = _timestamps(df["Datum"], df["von"], df["Zeitzone von"], date_format)
+    df["bis"] = _timestamps(
+        df["Datum"], df["bis"], df["Zeitzone bis"], date_format, end=True
+    )
+    return df.drop(["Datum", "Zeitzone von", "Zeitzone bis"], axis=1).set_index("von")
+
+
+def transform_id_aep(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Transform the columns "Datum von", "(Uhrzeit) von", "Zeitzone von", "(Uhrzeit) bis", "Zeitzone bis"
+    into the timestamps "von" and "bis". "von" becomes the index.
+    """
+    df["von"] = _timestamps(
+        df["Datum von"], df["(Uhrzeit) von"], df["Zeitzone von"], csv_date_format
+    )
+    df["bis"] = _timestamps(
+        df["Datum von"],
+        df["(Uhrzeit) bis"],
+        df["Zeitzone bis"],
+        csv_date_format,
+        end=True,
+    )
+    return df.drop(["Datum von", "Zeitzone von", "Zeitzone bis"], axis=1).set_index(
+        "von"
+    )
+
+
+def transform_nrvsaldo(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Transform the columns "Datum", "von", "bis", "Zeitzone" into the timestamps "von" and "bis".
+    "von" becomes the index.
+    """
+    df["von"] = _timestamps(
+        df["Datum"], df["von"], df["Zeitzone"], nrvsaldo_date_format
+    )
+    df["bis"] = _timestamps(
+        df["Datum"], df["bis"], df["Zeitzone"], nrvsaldo_date_format, end=True
+    )
+    return df.drop(["Datum", "Zeitzone"], axis=1).set_index("von")
+
+
+def transform_srl_mol_abweichungen(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Transform the columns "Datum von", "Uhrzeit von", "Zeitzone von", "Datum bis", "Uhrzeit bis",
+    "Zeitzone bis" into the timestamps "von" and "bis". "von" becomes the index.
+    """
+    df["von"] = _timestamps(
+        df["Datum von"], df["Uhrzeit von"], df["Zeitzone von"], nrvsaldo_date_format
+    )
+    df["bis"] = _timestamps(
+        df["Datum bis"],
+        df["Uhrzeit bis"],
+        df["Zeitzone bis"],
+        nrvsaldo_date_format,
+        end=True,
+    )
+    return df.drop(
+        [
+            "Datum von",
+            "Uhrzeit von",
+            "Zeitzone von",
+            "Datum bis",
+            "Uhrzeit bis",
+            "Zeitzone bis",
+        ],
+        axis=1,
+    ).set_index("von")
+
+
+def transform_systemdienstleistungen(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Transform the columns "BEGINN_DATUM", "BEGINN_UHRZEIT", "ENDE_DATUM", "ENDE_UHRZEIT",
+    "ZEITZONE_VON", "ZEITZONE_BIS" into the timestamps "BEGINN" and "ENDE" (UTC without timezone).
+    """
+    df["BEGINN"] = _timestamps(
+        df["BEGINN_DATUM"],
+        df["BEGINN_UHRZEIT"],
+        df["ZEITZONE_VON"],
+        nrvsaldo_date_format,
+    ).dt.tz_localize(None)
+    df["ENDE"] = _timestamps(
+        df["ENDE_DATUM"], df["ENDE_UHRZEIT"], df["ZEITZONE_BIS"], nrvsaldo_date_format
+    ).dt.tz_localize(None)
+    return df.drop(
+        [
+            "BEGINN_DATUM",
+            "BEGINN_UHRZEIT",
+            "ENDE_DATUM",
+            "ENDE_UHRZEIT",
+            "ZEITZONE_VON",
+            "ZEITZONE_BIS",
+        ],
+        axis=1,
+    )
+
+
+def transform_abregelung(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Transform the columns "Datum", "Zeitzone", "von", "bis" into the timestamps "von" and "bis"
+    (UTC without timezone).
+    """
+    df["von"] = _timestamps(
+        df["Datum"], df["von"], df["Zeitzone"], nrvsaldo_date_format
+    ).dt.tz_localize(None)
+    df["bis"] = _timestamps(
+        df["Datum"], df["bis"], df["Zeitzone"], nrvsaldo_date_format
+    ).dt.tz_localize(None)
+    return df.drop(["Datum", "Zeitzone"], axis=1)
+
+
+def transform_negative_preise(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Transform the column "Datum" into a timestamp.
+    """
+    df["Datum"] = pd.to_datetime(df["Datum"], format="%Y-%m-%d %H:%M")
+    return df
+
+
+def rename(df, columns: dict[str, str]):
+    """
+    Rename the columns of a pandas Dataframe or a pyarrow Table.
+    """
+    if isinstance(df, pd.DataFrame):
+        return df.rename(columns=columns)
+    return df.rename_columns([columns.get(name, name) for name in df.column_names])
+
+
+def to_arrow(df: pd.DataFrame) -> pyarrow.Table:
+    """
+    Return df as a pyarrow Table. A named index, e.g. "von", becomes the first column.
+    """
+    if df.index.name is not None:
+        df = df.reset_index()
+    table = pyarrow.Table.from_pandas(
+        df, preserve_index=False
+    ).replace_schema_metadata()
+    # the same types as read_arrow, e.g. string instead of the large_string of pandas
+    return table.cast(
+        pyarrow.schema(
+            [field.with_type(_arrow_type(field.type)) for field in table.schema]
+        )
+    )
+
+
+def _arrow_type(type: pyarrow.DataType) -> pyarrow.DataType:
+    if pyarrow.types.is_large_string(type):
+        return pyarrow.string()
+    if pyarrow.types.is_dictionary(type):
+        return pyarrow.dictionary(pyarrow.int32(), _arrow_type(type.value_type))
+    return type
+
+
+def _arrow_factorize(column: pyarrow.ChunkedArray) -> tuple[np.ndarray, list]:
+    # codes and distinct values like pd.factorize, missing values have the code -1
+    if pyarrow.types.is_dictionary(column.type):
+        column = column.cast(column.type.value_type)
+    encoded = pyarrow.compute.dictionary_encode(column.combine_chunks())
+    codes = encoded.indices.fill_null(-1).to_numpy(zero_copy_only=False)
+    return codes, encoded.dictionary.to_pylist()
+
+
+def _arrow_timestamps(
+    table: pyarrow.Table,
+    date: str,
+    time: str,
+    zone: str,
+    date_format: str,
+    end: bool = False,
+    utc: bool = True,
+) -> pyarrow.Array:
+    """
+    Combine the date, time and timezone columns of table into UTC timestamps, see _timestamps.
+
+        utc -- if False, the timestamps have no timezone
+    """
+    values = _combine(
+        *_arrow_factorize(table[date]),
+        *_arrow_factorize(table[time]),
+        *_arrow_factorize(table[zone]),
+        date_format,
+        end,
+    )
+    if values is None:
+        # timezones like CET are parsed from the strings of the rows
+        values = _timestamps_from_strings(
+            *(table[name].to_pandas() for name in (date, time, zone)),
+            date_format,
+            end,
+        ).dt.tz_localize(None)
+        values = values.to_numpy()
+    timestamps = pyarrow.array(values, mask=np.isnat(values))
+    return (
+        timestamps.cast(pyarrow.timestamp(timestamps.type.unit, "UTC"))
+        if utc
+        else timestamps
+    )
+
+
+def _transform_table(
+    table: pyarrow.Table,
+    timestamps: dict[str, tuple],
+    drop: list[str],
+    index: str | None = None,
+    utc: bool = True,
+) -> pyarrow.Table:
+    """
+    Replace or add the timestamp columns of a pyarrow Table like the pandas transformations do.
+    Tables have no index, the column that is the index of the Dataframe becomes the first column.
+
+        timestamps -- name of every timestamp and the arguments of _arrow_timestamps to compute it
+    """
+    columns = {
+        name: _arrow_timestamps(table, *arguments, utc=utc)
+        for name, arguments in timestamps.items()
+    }
+    for name, values in columns.items():
+        if name in table.column_names:
+            table = table.set_column(table.column_names.index(name), name, values)
+        else:
+            table = table.append_column(name, values)
+    table = table.drop_columns(drop)
+    if index is not None:
+        names = table.column_names
+        table = table.select([index, *(name for name in names if name != index)])
+    return table
+
+
+def arrow_transform_nt(
+    table: pyarrow.Table, date_format: str = csv_date_format
+) -> pyarrow.Table:
+    """
+    transform_nt for pyarrow Tables.
+    """
+    return _transform_table(
+        table,
+        {
+            "von": ("Datum", "von", "Zeitzone von", date_format),
+            "bis": ("Datum", "bis", "Zeitzone bis", date_format, True),
+        },
+        ["Datum", "Zeitzone von", "Zeitzone bis"],
+        "von",
+    )
+
+
+def arrow_transform_id_aep(table: pyarrow.Table) -> pyarrow.Table:
+    """
+    transform_id_aep for pyarrow Tables.
+    """
+    return _transform_table(
+        table,
+        {
+            "von": ("Datum von", "(Uhrzeit) von", "Zeitzone von", csv_date_format),
+            "bis": (
+                "Datum von",
+                "(Uhrzeit) bis",
+                "Zeitzone bis",
+                csv_date_format,
+                True,
+            ),
+        },
+        ["Datum von", "Zeitzone von", "Zeitzone bis"],
+        "von",
+    )
+
+
+def arrow_transform_nrvsaldo(table: pyarrow.Table) -> pyarrow.Table:
+    """
+    transform_nrvsaldo for pyarrow Tables.
+    """
+    return _transform_table(
+        table,
+        {
+            "von": ("Datum", "von", "Zeitzone", nrvsaldo_date_format),
+            "bis": ("Datum", "bis", "Zeitzone", nrvsaldo_date_format, True),
+        },
+        ["Datum", "Zeitzone"],
+        "von",
+    )
+
+
+def arrow_transform_srl_mol_abweichungen(table: pyarrow.Table) -> pyarrow.Table:
+    """
+    transform_srl_mol_abweichungen for pyarrow Tables.
+    """
+    return _transform_table(
+        table,
+        {
+            "von": ("Datum von", "Uhrzeit von", "Zeitzone von", nrvsaldo_date_format),
+            "bis": (
+                "Datum bis",
+                "Uhrzeit bis",
+                "Zeitzone bis",
+                nrvsaldo_date_format,
+                True,
+            ),
+        },
+        [
+            "Datum von",
+            "Uhrzeit von",
+            "Zeitzone von",
+            "Datum bis",
+            "Uhrzeit bis",
+            "Zeitzone bis",
+        ],
+        "von",
+    )
+
+
+def arrow_transform_systemdienstleistungen(table: pyarrow.Table) -> pyarrow.Table:
+    """
+    transform_systemdienstleistungen for pyarrow Tables.
+    """
+    return _transform_table(
+        table,
+        {
+            "BEGINN": (
+                "BEGINN_DATUM",
+                "BEGINN_UHRZEIT",
+                "ZEITZONE_VON",
+                nrvsaldo_date_format,
+            ),
+            "ENDE": (
+                "ENDE_DATUM",
+                "ENDE_UHRZEIT",
+                "ZEITZONE_BIS",
+                nrvsaldo_date_format,
+            ),
+        },
+        [
+            "BEGINN_DATUM",
+            "BEGINN_UHRZEIT",
+            "ENDE_DATUM",
+            "ENDE_UHRZEIT",
+            "ZEITZONE_VON",
+            "ZEITZONE_BIS",
+        ],
+        utc=False,
+    )
+
+
+def arrow_transform_abregelung(table: pyarrow.Table) -> pyarrow.Table:
+    """
+    transform_abregelung for pyarrow Tables.
+    """
+    return _transform_table(
+        table,
+        {
+            "von": ("Datum", "von", "Zeitzone", nrvsaldo_date_format),
+            "bis": ("Datum", "bis", "Zeitzone", nrvsaldo_date_format),
+        },
+        ["Datum", "Zeitzone"],
+        utc=False,
+    )
+
+
+def arrow_transform_negative_preise(table: pyarrow.Table) -> pyarrow.Table:
+    """
+    transform_negative_preise for pyarrow Tables.
+    """
+    timestamps = pyarrow.compute.strptime(
+        table["Datum"], format="%Y-%m-%d %H:%M", unit="us"
+    )
+    return table.set_column(table.column_names.index("Datum"), "Datum", timestamps)
+
+
+_ARROW_TRANSFORMS = {
+    transform_nt: arrow_transform_nt,
+    transform_id_aep: arrow_transform_id_aep,
+    transform_nrvsaldo: arrow_transform_nrvsaldo,
+    transform_srl_mol_abweichungen: arrow_transform_srl_mol_abweichungen,
+    transform_systemdienstleistungen: arrow_transform_systemdienstleistungen,
+    transform_abregelung: arrow_transform_abregelung,
+    transform_negative_preise: arrow_transform_negative_preise,
+}
+
+
+def arrow_transform(transform) -> object | None:
+    """
+    Return the transformation for pyarrow Tables that does the same as the pandas transformation,
+    or None if there is none. Transformations with arguments are given as functools.partial.
+    """
+    if isinstance(transform, functools.partial):
+        function = _ARROW_TRANSFORMS.get(transform.func)
+        if function is None:
+            return None
+        return functools.partial(function, *transform.args, **transform.keywords)
+    return _ARROW_TRANSFORMS.get(transform)
@@ -0,0 +1,103 @@
+"""
+Client-side token bucket rate limiting, shared by threads or by several processes.
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from pathlib import Path
+
+from netztransparenz._filelock import locked
+from netztransparenz.token_cache import _cache_home
+
+
+class RateLimiter:
+    def __init__(self, rate: float, burst: int | None = None):
+        """
+        Creates a token bucket that allows rate requests per second on average and up to burst requests at once.
+        All clients and threads using the same RateLimiter share one budget.
+
+            rate -- requests per second
+            burst -- size of the bucket (default: max(1, rate))
+        """
+        if rate <= 0:
+            raise ValueError("rate has to be positive")
+        self.rate = rate
+        self.burst = burst if burst is not None else max(1, int(rate))
+        if self.burst < 1:
+            raise ValueError("burst has to be at least 1")
+        self._lock = threading.Lock()
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+
+    def _take(self, tokens: float, updated: float, now: float) -> tuple[float, float]:
+        # Refill the bucket for the time since the last request and take one token.
+        # The balance may become negative, it is then the number of requests queued before this one.
+        tokens = min(self.burst, tokens + (now - updated) * self.rate) - 1
+        return tokens, max(0.0, -tokens / self.rate)
+
+    def reserve(self, client_id: str) -> float:
+        """
+        Reserve one request and return the seconds the caller has to wait before sending it.
+
+            client_id -- id of the client sending the request, only used by FileRateLimiter
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens, wait = self._take(self._tokens, self._updated, now)
+            self._updated = now
+        return wait
+
+    def acquire(self, client_id: str) -> None:
+        """
+        Block until one request may be sent.
+        """
+        wait = self.reserve(client_id)
+        if wait > 0:
+            time.sleep(wait)
+
+
+class FileRateLimiter(RateLimiter):
+    def __init__(
+        self,
+        rate: float,
+        burst: int | None = None,
+        directory: str | os.PathLike | None = None,
+    ):
+        """
+        Creates a token bucket that is stored on disk, so all processes using the same client id
+        stay within one budget of rate requests per second and up to burst requests at once.
+
+            rate -- requests per second
+            burst -- size of the bucket (default: max(1, rate))
+            directory -- where the buckets are stored (default: ~/.cache/netztransparenz/rate_limits)
+        """
+        super().__init__(rate, burst)
+        self.directory = (
+            Path(directory) if directory is not None else _cache_home() / "rate_limits"
+        )
+        self.directory.mkdir(mode=0o700, parents=True, exist_ok=True)
+
+    def _path(self, client_id: str, suffix: str) -> Path:
+        key = hashlib.sha256(client_id.encode()).hexdigest()[:32]
+        return self.directory / f"{key}{suffix}"
+
+    def reserve(self, client_id: str) -> float:
+        path = self._path(client_id, ".json")
+        # the lock is held by other threads of this process as well as by other processes
+        with self._lock, locked(self._path(client_id, ".lock")):
+            # wall clock time, monotonic clocks are not comparable between processes
+            now = time.time()
+            try:
+                with open(path) as file:
+                    content = json.load(file)
+                tokens, updated = content["tokens"], content["updated"]
+            except (OSError, ValueError, KeyError):
+                tokens, updated = float(self.burst), now
+            tokens, wait = self._take(tokens, min(updated, now), now)
+            fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, "w") as file:
+                json.dump({"tokens": tokens, "updated": now}, file)
+        return wait
@@ -0,0 +1,116 @@
+"""
+Description of every endpoint, compiled once from constants.endpoints.
+All readers hand their endpoint to BaseNtClient._read_endpoint, which requests, parses and transforms it as described here.
+"""
+
+from __future__ import annotations
+
+import datetime as dt
+import functools
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from netztransparenz import parsing, schema
+from netztransparenz.constants import endpoints
+
+
+def _transpose_jahresmarktpraemie(df):
+    return df.set_index(["Alle Werte in ct/kWh"]).transpose()
+
+
+@dataclass(frozen=True)
+class Layout:
+    """
+    How the responses of a group of endpoints are parsed and how their dates are transformed.
+
+        na_values -- strings that stand for missing values
+        transform -- applied if transform_dates is True, see parsing.transform_nt
+        thousands -- thousands separator of the numbers
+        rename -- new names of duplicate columns, which the parser suffixes with ".1"
+        usecols -- if False, responses are always parsed with all columns
+        table -- if False, responses are always parsed into pandas Dataframes
+        json -- if True, responses are JSON instead of CSV
+    """
+
+    na_values: tuple[str, ...] = ("N.A.",)
+    transform: Callable | None = None
+    thousands: str | None = None
+    rename: tuple[tuple[str, str], ...] = ()
+    usecols: bool = True
+    table: bool = True
+    json: bool = False
+
+
+layouts = {
+    "nt": Layout(("N.A.", "N.E."), parsing.transform_nt, thousands="."),
+    "vermarktung": Layout(transform=parsing.transform_nt),
+    "spotmarktpreise": Layout(
+        transform=functools.partial(
+            parsing.transform_nt, date_format=parsing.nrvsaldo_date_format
+        )
+    ),
+    "negative_preise": Layout(("N.A.", "-"), parsing.transform_negative_preise),
+    # the raw data has two columns "Zeitzone", so the header can not select columns
+    "id_aep": Layout(
+        transform=parsing.transform_id_aep,
+        rename=(("Zeitzone", "Zeitzone von"), ("Zeitzone.1", "Zeitzone bis")),
+        usecols=False,
+    ),
+    "marktpraemie": Layout(("N.A.", "")),
+    # the columns are years, which are only known after the data is transposed
+    "jahresmarktpraemie": Layout(
+        transform=_transpose_jahresmarktpraemie, usecols=False, table=False
+    ),
+    "nrvsaldo": Layout(("N.A.", "N.E.", ""), parsing.transform_nrvsaldo),
+    "srl_mol_abweichungen": Layout(
+        ("N.A.", ""), parsing.transform_srl_mol_abweichungen
+    ),
+    "systemdienstleistungen": Layout(
+        transform=parsing.transform_systemdienstleistungen
+    ),
+    "abregelung": Layout(transform=parsing.transform_abregelung),
+    "json": Layout((), json=True),
+}
+
+
+@dataclass(frozen=True)
+class Endpoint:
+    """
+    Everything the read engine needs to know about one endpoint.
+
+        resource_url -- url of the endpoint without the base url and without leading or trailing "/"
+        first_data -- first datapoint of the endpoint
+        layout -- how responses are parsed and their dates transformed
+        path -- url of endpoints that do not take the timeframe as path parameters, see url
+    """
+
+    resource_url: str
+    first_data: dt.datetime
+    layout: Layout
+    path: str | None = None
+
+    @property
+    def schema(self) -> schema.Schema:
+        return schema.schema(self.resource_url)
+
+    def url(self, base_url: str, **arguments) -> str | None:
+        """
+        Return the full request url formatted with arguments, or None if the timeframe is part of the path.
+        """
+        if self.path is None:
+            return None
+        return f"{base_url}/data/{self.path.format(**arguments)}"
+
+
+@functools.cache
+def endpoint(resource_url: str) -> Endpoint:
+    """
+    Return the description of the endpoint, e.g. endpoint("hochrechnung/Solar").
+    """
+    metadata = endpoints[f"/{resource_url}"]
+    return Endpoint(
+        resource_url,
+        metadata["first_data"],
+        layouts[metadata["layout"]],
+        metadata.get("path"),
+    )
@@ -0,0 +1,109 @@
+"""
+Retrying of requests that failed for transient reasons.
+"""
+
+import datetime as dt
+import email.utils
+import random
+import threading
+from dataclasses import dataclass, field
+
+
+@dataclass
+class RetryPolicy:
+    """
+    Describes which failed requests are repeated and how long the client waits in between.
+
+        max_attempts -- number of attempts per request including the first one, 1 disables retrying
+        backoff_base -- upper bound of the first wait in seconds, doubled with every further attempt
+        backoff_cap -- upper bound of every wait in seconds
+        retry_statuses -- HTTP status codes that are retried
+        retry_exceptions -- exceptions that are retried. None retries connection errors and timeouts
+                            of the HTTP library the client uses, also when the connection breaks
+                            while the body of a response is read.
+        respect_retry_after -- wait as long as the Retry-After header of the response asks for
+        max_retry_after -- upper bound of the wait a Retry-After header asks for in seconds, so a
+                           misbehaving server can not block the client for hours. It is separate from
+                           backoff_cap, which would retry before the server is ready again.
+    """
+
+    max_attempts: int = 5
+    backoff_base: float = 0.5
+    backoff_cap: float = 30.0
+    retry_statuses: frozenset[int] = frozenset({429, 502, 503, 504})
+    retry_exceptions: tuple[type[BaseException], ...] | None = None
+    respect_retry_after: bool = True
+    max_retry_after: float = 300.0
+
+    def backoff(self, attempt: int) -> float:
+        """
+        Return the wait before the next attempt after attempt (starting at 0) failed.
+        Uses exponential backoff with full jitter.
+        """
+        return random.uniform(0, min(self.backoff_cap, self.backoff_base * 2**attempt))
+
+    def delay(self, attempt: int, retry_after: str | None = None) -> float | None:
+        """
+        Return the seconds to wait before the next attempt, or None if no attempts are left.
+
+            attempt -- number of the attempt that failed, starting at 0
+            retry_after -- value of the Retry-After header of the failed response
+        """
+        if attempt + 1 >= self.max_attempts:
+            return None
+        if self.respect_retry_after and retry_after is not None:
+            seconds = _parse_retry_after(retry_after)
+            if seconds is not None:
+                return min(seconds, self.max_retry_after)
+        return self.backoff(attempt)
+
+
+def _parse_retry_after(value: str) -> float | None:
+    # Retry-After is either a number of seconds or a HTTP date
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=dt.UTC)
+    return max(0.0, (retry_at - dt.datetime.now(dt.UTC)).total_seconds())
+
+
+@dataclass
+class RetryStatistics:
+    """
+    Counters of the requests a client sent.
+
+        requests -- requests that were answered or failed for good, retries not included
+        retries -- repeated attempts
+        failures -- requests that raised an error after their last attempt
+        reasons -- retries per status code or exception name
+    """
+
+    requests: int = 0
+    retries: int = 0
+    failures: int = 0
+    reasons: dict[str, int] = field(default_factory=dict)
+    _lock: threading.Lock = field(
+        default_factory=threading.Lock, repr=False, compare=False
+    )
+
+    def record_retry(self, reason: str) -> None:
+        with self._lock:
+            self.retries += 1
+            self.reasons[reason] = self.reasons.get(reason, 0) + 1
+
+    def record_request(self, failed: bool = False) -> None:
+        with self._lock:
+            self.requests += 1
+            if failed:
+                self.failures += 1
+
+    def reset(self) -> None:
+        with self._lock:
+            self.requests = self.retries = self.failures = 0
+            self.reasons = {}
@@ -0,0 +1,90 @@
+"""
+Column types of every endpoint, compiled once from the headers in constants.endpoints.
+"""
+
+from __future__ import annotations
+
+import functools
+import re
+from dataclasses import dataclass
+
+from netztransparenz import _lazy, parsing
+from netztransparenz.constants import column_types, endpoints, number_columns
+
+pd = _lazy.load("pandas")
+
+
+@dataclass(frozen=True)
+class Schema:
+    """
+    Columns of the raw data of an endpoint and the kind of each column that has a known type:
+    "string", "category" or "float".
+    """
+
+    columns: tuple[str, ...]
+    kinds: dict[str, str]
+
+    def dtypes(self, float32: bool = False) -> dict[str, object]:
+        """
+        Return the pandas dtype of every column with a known type.
+
+            float32 -- if True, measured values are stored as float32 instead of float64
+        """
+        return {
+            column: _DTYPES[kind] if kind != "float" else _float(float32)
+            for column, kind in self.kinds.items()
+        }
+
+
+# str is the default string dtype of the installed pandas version
+_DTYPES = {"string": str, "category": "category"}
+
+
+def _float(float32: bool) -> str:
+    return "float32" if float32 else "float64"
+
+
+@functools.cache
+def schema(resource_url: str) -> Schema:
+    """
+    Return the schema of the endpoint, e.g. schema("hochrechnung/Solar").
+    """
+    endpoint = endpoints.get(f"/{resource_url.strip('/')}")
+    if endpoint is None:
+        return Schema((), {})
+    columns = tuple(endpoint["header"].split(";"))
+    kinds = {}
+    for column in columns:
+        if column in column_types:
+            kinds[column] = column_types[column]
+        elif re.fullmatch(number_columns, column):
+            kinds[column] = "float"
+    return Schema(columns, kinds)
+
+
+def apply(df: pd.DataFrame, resource_url: str, float32: bool = False) -> pd.DataFrame:
+    """
+    Return df with the categories and floats of the schema of the endpoint, for data that was not
+    parsed with the schema, e.g. from a cache. Columns that are not in df are ignored.
+    """
+    dtypes = {
+        column: dtype
+        for column, dtype in schema(resource_url).dtypes(float32).items()
+        if column in df.columns
+        and dtype is not str
+        and not (
+            dtype == "category" and isinstance(df[column].dtype, pd.CategoricalDtype)
+        )
+        and df[column].dtype != dtype
+    }
+    if not dtypes:
+        return df
+    # floats that are still text, values that are no number become NaN instead of failing
+    text = [
+        column
+        for column, dtype in dtypes.items()
+        if dtype != "category" and not pd.api.types.is_numeric_dtype(df[column].dtype)
+    ]
+    if text:
+        df = df.assign(**{column: parsing.to_float(df[column]) for column in text})
+    return df.astype(dtypes)
@@ -0,0 +1,81 @@
+"""
+Local stores that keep the data of whole endpoints, see NetztransparenzClient.sync.
+Requires the optional dependency pyarrow (pip install netztransparenz[cache]).
+"""
+
+from __future__ import annotations
+
+import contextlib
+import os
+import tempfile
+from collections.abc import Iterator, MutableMapping
+from pathlib import Path
+
+from netztransparenz import _lazy
+from netztransparenz.chunk_cache import _read_table
+from netztransparenz.constants import endpoints
+
+pd = _lazy.load("pandas")
+pyarrow = _lazy.load("pyarrow", optional=True)
+
+
+class ParquetStore(MutableMapping):
+    def __init__(self, directory: str | os.PathLike):
+        """
+        Creates the store. The data of every endpoint is kept in one parquet file and can be accessed
+        like a dict: store["NrvSaldo/NRVSaldo/Betrieblich"].
+
+            directory -- where the files are stored
+        """
+        if pyarrow is None:
+            raise ImportError(
+                "ParquetStore requires pyarrow, install it with 'pip install netztransparenz[cache]'"
+            )
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def _path(self, endpoint: str) -> Path:
+        return self.directory / f"{endpoint.strip('/').replace('/', '_')}.parquet"
+
+    def __getitem__(self, endpoint: str) -> pd.DataFrame:
+        try:
+            return pd.read_parquet(self._path(endpoint))
+        except FileNotFoundError:
+            raise KeyError(endpoint) from None
+
+    def read(self, endpoint: str, columns: list[str] | None = None) -> pd.DataFrame:
+        """
+        Return the data of endpoint like store[endpoint], but only the columns and the index.
+        """
+        try:
+            return _read_table(self._path(endpoint), columns).to_pandas()
+        except FileNotFoundError:
+            raise KeyError(endpoint) from None
+
+    def __setitem__(self, endpoint: str, df: pd.DataFrame) -> None:
+        # replace the file atomically, so readers never see a partially written file
+        path = self._path(endpoint)
+        fd, temporary_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        os.close(fd)
+        try:
+            df.to_parquet(temporary_path)
+            os.replace(temporary_path, path)
+        except BaseException:
+            with contextlib.suppress(OSError):
+                os.remove(temporary_path)
+            raise
+
+    def __delitem__(self, endpoint: str) -> None:
+        try:
+            os.remove(self._path(endpoint))
+        except FileNotFoundError:
+            raise KeyError(endpoint) from None
+
+    def __iter__(self) -> Iterator[str]:
+        # file names do not keep the "/" of the endpoints, so they are looked up in the known endpoints
+        for endpoint in endpoints:
+            if self._path(endpoint).exists():
+                yield endpoint.strip("/")
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
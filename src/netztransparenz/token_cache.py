@@ -0,0 +1,81 @@
+"""
+On-disk cache that lets several processes with the same client id share one token.
+"""
+
+import contextlib
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from pathlib import Path
+
+from netztransparenz._filelock import locked
+
+log = logging.getLogger("FileTokenCache")
+
+
+def _cache_home() -> Path:
+    # directory for all files the package stores on disk
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+        os.path.expanduser("~"), ".cache"
+    )
+    return Path(cache_home) / "netztransparenz"
+
+
+class FileTokenCache:
+    def __init__(self, directory: str | os.PathLike | None = None):
+        """
+        Creates the cache. Tokens are stored in one file per client id, readable only by the current user.
+
+            directory -- where the tokens are stored (default: ~/.cache/netztransparenz/tokens)
+        """
+        self.directory = (
+            Path(directory) if directory is not None else _cache_home() / "tokens"
+        )
+        self.directory.mkdir(mode=0o700, parents=True, exist_ok=True)
+
+    def _path(self, client_id: str, suffix: str) -> Path:
+        # the client id is hashed so it does not show up in file names
+        key = hashlib.sha256(client_id.encode()).hexdigest()[:32]
+        return self.directory / f"{key}{suffix}"
+
+    @contextlib.contextmanager
+    def lock(self, client_id: str):
+        """
+        Hold an exclusive lock for client_id, so only one process retrieves a new token at a time.
+        """
+        with locked(self._path(client_id, ".lock")):
+            yield
+
+    def load(self, client_id: str) -> tuple[str, float | None] | None:
+        """
+        Return the stored token and its expiry as unix timestamp, or None if there is no token.
+        """
+        try:
+            with open(self._path(client_id, ".json")) as file:
+                content = json.load(file)
+            return content["access_token"], content["expires_at"]
+        except (OSError, ValueError, KeyError):
+            return None
+
+    def store(self, client_id: str, token: str, expires_at: float | None) -> None:
+        """
+        Store the token of client_id. The file is replaced atomically.
+        """
+        fd, temporary_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as file:
+                json.dump({"access_token": token, "expires_at": expires_at}, file)
+            os.replace(temporary_path, self._path(client_id, ".json"))
+        except OSError as e:
+            log.warning(f"Could not store token: {e}")
+            with contextlib.suppress(OSError):
+                os.remove(temporary_path)
+
+    def clear(self, client_id: str) -> None:
+        """
+        Remove the stored token of client_id.
+        """
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(self._path(client_id, ".json"))
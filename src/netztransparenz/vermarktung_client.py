@@ -3,159 +3,17 @@ Client for all /vermarktung/ Endpoints and other Endpoints with market data like
 """
 
 from netztransparenz.base_client import BaseNtClient
-from netztransparenz.constants import endpoints
-import requests
 import datetime as dt
-import io
-
-import pandas as pd
-
-_csv_date_format = "%Y-%m-%d %H:%M %Z"
 
 
 class VermarktungClient(BaseNtClient):
-    def _basic_read_vermarktung(
-        self,
-        resource_url,
-        dt_begin: dt.datetime | None = None,
-        dt_end: dt.datetime | None = None,
-        transform_dates=False,
-        dateformat=_csv_date_format,
-    ):
-        """
-        Internal method to read data in the format of most /vermarktung dataseries.
-        Target format is: Dates separated in "datum", "von", "bis", "zeitzone".
-        Return a pandas Dataframe with data of the endpoint specified with resource_url.
-        If either dt_begin or dt_end is None, all available data will be queried.
-
-            resource_url -- url of the endpoint without the base url and without leading or trailing "/"
-            earliest_data -- first datapoint in the source collection
-            dt_begin -- datetime object for start of data in UTC
-            dt_end -- datetime object for end of data in UTC
-            transform_dates -- The data contains times with date, time and timezone in separate columns
-                               if this option resolves to "True" the times will be transformed into two
-                               columns "von" and "bis" that contain fully qualified timestamps. (default: False)
-        """
-        if not self._check_preconditions(
-            dt_begin, endpoints[f"/{resource_url}"]["first_data"], dt_end
-        ):
-            return self._return_empty_frame(f"/{resource_url}", transform_dates)
-
-        url = f"{self._API_BASE_URL}/data/{resource_url}"
-        if (dt_begin is not None) and (dt_end is not None):
-            dt_begin = dt_begin.replace(tzinfo=dt.UTC)
-            dt_end = dt_end.replace(tzinfo=dt.UTC)
-            if (dt_begin + self.max_query_distance) < dt_end:
-                # split into multiple api calls
-                timeframes = self._split_timeframe(dt_begin, dt_end)
-                dataframes = []
-                for timeframe in timeframes:
-                    dataframes.append(
-                        self._basic_read_vermarktung(
-                            resource_url, timeframe[0], timeframe[1], transform_dates
-                        )
-                    )
-                return pd.concat(dataframes)
-            start_of_data = dt_begin.strftime(self._api_date_format)
-            end_of_data = dt_end.strftime(self._api_date_format)
-            url = f"{url}/{start_of_data}/{end_of_data}"
-
-        response = requests.get(
-            url, headers={"Authorization": "Bearer {}".format(self.token)}
-        )
-        response.raise_for_status()
-        df = pd.read_csv(
-            io.StringIO(response.text),
-            sep=";",
-            header=0,
-            decimal=",",
-            na_values=["N.A."],
-        )
-
-        if transform_dates:
-            df["von"] = pd.to_datetime(
-                df["Datum"] + " " + df["von"] + " " + df["Zeitzone von"],
-                format=dateformat,
-                utc=True,
-            )
-            df["bis"] = pd.to_datetime(
-                df["Datum"] + " " + df["bis"] + " " + df["Zeitzone bis"],
-                format=dateformat,
-                utc=True,
-            )
-            # The end of timeframes may be 00:00 of the next day which is not correctly represented in timestamps
-            df["bis"] = df["bis"].where(
-                df["bis"].dt.time != dt.time(0, 0), df["bis"] + dt.timedelta(days=1)
-            )
-            df = df.drop(["Datum", "Zeitzone von", "Zeitzone bis"], axis=1).set_index(
-                "von"
-            )
-
-        return df
-
-    def _basic_read_negative_preise(
-        self,
-        resource_url,
-        dt_begin: dt.datetime,
-        dt_end: dt.datetime,
-        transform_dates=False,
-    ):
-        """
-        Internal method to read data in the format of the /NegativePreise dataseries.
-        Target format is: Only two columns "Datum" and "Negativ", start and end dates not optional.
-        Return a pandas Dataframe with data of the endpoint specified with resource_url.
-
-            resource_url -- url of the endpoint without the base url and without leading or trailing "/"
-            earliest_data -- first datapoint in the source collection
-            dt_begin -- datetime object for start of data in UTC
-            dt_end -- datetime object for end of data in UTC
-            transform_dates -- The data contains times as a string in the format "%Y-%m-%d %H:%M"
-                               if this option resolves to "True" the times will be transformed into a
-                               fully qualified timestamp. (default: False)
-        """
-        if not self._check_preconditions(
-            dt_begin, endpoints[f"/{resource_url}"]["first_data"], dt_end
-        ):
-            return self._return_empty_frame(f"/{resource_url}", transform_dates)
-
-        if (dt_begin.astimezone(dt.UTC) + self.max_query_distance) < dt_end.astimezone(
-            dt.UTC
-        ):
-            # split into multiple api calls
-            timeframes = self._split_timeframe(dt_begin, dt_end)
-            dataframes = []
-            for timeframe in timeframes:
-                dataframes.append(
-                    self._basic_read_negative_preise(
-                        resource_url, timeframe[0], timeframe[1], transform_dates
-                    )
-                )
-            return pd.concat(dataframes)
-
-        url = f"{self._API_BASE_URL}/data/{resource_url}/{dt_begin.strftime(self._api_date_format)}/{dt_end.strftime(self._api_date_format)}"
-
-        response = requests.get(
-            url, headers={"Authorization": "Bearer {}".format(self.token)}
-        )
-        response.raise_for_status()
-        df = pd.read_csv(
-            io.StringIO(response.text),
-            sep=";",
-            header=0,
-            decimal=",",
-            na_values=["N.A.", "-"],
-        )
-
-        if transform_dates:
-            df["Datum"] = pd.to_datetime(df["Datum"], format="%Y-%m-%d %H:%M")
-
-        return df
-
     def vermarktung_differenz_einspeiseprognose(
         self,
         dt_begin: dt.datetime | None = None,
         dt_end: dt.datetime | None = None,
         transform_dates=False,
+        columns: list[str] | None = None,
+        backend: str | None = None,
     ):
         """
         Return a pandas Dataframe with data of the endpoint /vermarktung/DifferenzEinspeiseprognose.
@@ -166,12 +24,16 @@ class VermarktungClient(BaseNtClient):
             transform_dates -- The data contains times with date, time and timezone in separate columns
                                if this option resolves to "True" the times will be transformed into two
                                columns "von" and "bis" that contain fully qualified timestamps. (default: False)
+            columns -- only return these columns, see constants.endpoints for their names (default: all columns)
+            backend -- "pandas", "arrow" or "polars", the type of the result (default: the backend of the client)
         """
-        return self._basic_read_vermarktung(
+        return self._read_endpoint(
             "vermarktung/DifferenzEinspeiseprognose",
             dt_begin,
             dt_end,
             transform_dates,
+            columns=columns,
+            backend=backend,
         )
 
     def vermarktung_inanspruchnahme_ausgleichsenergie(
@@ -179,6 +41,8 @@ class VermarktungClient(BaseNtClient):
         dt_begin: dt.datetime | None = None,
         dt_end: dt.datetime | None = None,
         transform_dates=False,
+        columns: list[str] | None = None,
+        backend: str | None = None,
     ):
         """
         Return a pandas Dataframe with data of the endpoint /vermarktung/InanspruchnahmeAusgleichsenergie.
@@ -189,12 +53,16 @@ class VermarktungClient(BaseNtClient):
             transform_dates -- The data contains times with date, time and timezone in separate columns
                                if this option resolves to "True" the times will be transformed into two
                                columns "von" and "bis" that contain fully qualified timestamps. (default: False)
+            columns -- only return these columns, see constants.endpoints for their names (default: all columns)
+            backend -- "pandas", "arrow" or "polars", the type of the result (default: the backend of the client)
         """
-        return self._basic_read_vermarktung(
+        return self._read_endpoint(
             "vermarktung/InanspruchnahmeAusgleichsenergie",
             dt_begin,
             dt_end,
             transform_dates,
+            columns=columns,
+            backend=backend,
         )
 
     def vermarktung_untertaegige_strommengen(
@@ -202,6 +70,8 @@ class VermarktungClient(BaseNtClient):
         dt_begin: dt.datetime | None = None,
         dt_end: dt.datetime | None = None,
         transform_dates=False,
+        columns: list[str] | None = None,
+        backend: str | None = None,
     ):
         """
         Return a pandas Dataframe with data of the endpoint /vermarktung/UntertaegigeStrommengen.
@@ -212,12 +82,16 @@ class VermarktungClient(BaseNtClient):
             transform_dates -- The data contains times with date, time and timezone in separate columns
                                if this option resolves to "True" the times will be transformed into two
                                columns "von" and "bis" that contain fully qualified timestamps. (default: False)
+            columns -- only return these columns, see constants.endpoints for their names (default: all columns)
+            backend -- "pandas", "arrow" or "polars", the type of the result (default: the backend of the client)
         """
-        return self._basic_read_vermarktung(
+        return self._read_endpoint(
             "vermarktung/UntertaegigeStrommengen",
             dt_begin,
             dt_end,
             transform_dates,
+            columns=columns,
+            backend=backend,
         )
 
     def vermarktung_epex(
@@ -225,6 +99,8 @@ class VermarktungClient(BaseNtClient):
         dt_begin: dt.datetime | None = None,
         dt_end: dt.datetime | None = None,
         transform_dates=False,
+        columns: list[str] | None = None,
+        backend: str | None = None,
     ):
         """
         Return a pandas Dataframe with data of the endpoint /vermarktung/VermarktungEpex.
@@ -235,9 +111,16 @@ class VermarktungClient(BaseNtClient):
             transform_dates -- The data contains times with date, time and timezone in separate columns
                                if this option resolves to "True" the times will be transformed into two
                                columns "von" and "bis" that contain fully qualified timestamps. (default: False)
+            columns -- only return these columns, see constants.endpoints for their names (default: all columns)
+            backend -- "pandas", "arrow" or "polars", the type of the result (default: the backend of the client)
         """
-        return self._basic_read_vermarktung(
-            "vermarktung/VermarktungEpex", dt_begin, dt_end, transform_dates
+        return self._read_endpoint(
+            "vermarktung/VermarktungEpex",
+            dt_begin,
+            dt_end,
+            transform_dates,
+            columns=columns,
+            backend=backend,
         )
 
     def vermarktung_exaa(
@@ -245,6 +128,8 @@ class VermarktungClient(BaseNtClient):
         dt_begin: dt.datetime | None = None,
         dt_end: dt.datetime | None = None,
         transform_dates=False,
+        columns: list[str] | None = None,
+        backend: str | None = None,
     ):
         """
         Return a pandas Dataframe with data of the endpoint /vermarktung/VermarktungExaa.
@@ -255,9 +140,16 @@ class VermarktungClient(BaseNtClient):
             transform_dates -- The data contains times with date, time and timezone in separate columns
                                if this option resolves to "True" the times will be transformed into two
                                columns "von" and "bis" that contain fully qualified timestamps. (default: False)
+            columns -- only return these columns, see constants.endpoints for their names (default: all columns)
+            backend -- "pandas", "arrow" or "polars", the type of the result (default: the backend of the client)
         """
-        return self._basic_read_vermarktung(
-            "vermarktung/VermarktungExaa", dt_begin, dt_end, transform_dates
+        return self._read_endpoint(
+            "vermarktung/VermarktungExaa",
+            dt_begin,
+            dt_end,
+            transform_dates,
+            columns=columns,
+            backend=backend,
         )
 
     def vermarktung_solar(
@@ -265,6 +157,8 @@ class VermarktungClient(BaseNtClient):
         dt_begin: dt.datetime | None = None,
         dt_end: dt.datetime | None = None,
         transform_dates=False,
+        columns: list[str] | None = None,
+        backend: str | None = None,
     ):
         """
         Return a pandas Dataframe with data of the endpoint /vermarktung/VermarktungsSolar.
@@ -275,9 +169,16 @@ class VermarktungClient(BaseNtClient):
             transform_dates -- The data contains times with date, time and timezone in separate columns
                                if this option resolves to "True" the times will be transformed into two
                                columns "von" and "bis" that contain fully qualified timestamps. (default: False)
+            columns -- only return these columns, see constants.endpoints for their names (default: all columns)
+            backend -- "pandas", "arrow" or "polars", the type of the result (default: the backend of the client)
         """
-        return self._basic_read_vermarktung(
-            "vermarktung/VermarktungsSolar", dt_begin, dt_end, transform_dates
+        return self._read_endpoint(
+            "vermarktung/VermarktungsSolar",
+            dt_begin,
+            dt_end,
+            transform_dates,
+            columns=columns,
+            backend=backend,
         )
 
     def vermarktung_wind(
@@ -285,6 +186,8 @@ class VermarktungClient(BaseNtClient):
         dt_begin: dt.datetime | None = None,
         dt_end: dt.datetime | None = None,
         transform_dates=False,
+        columns: list[str] | None = None,
+        backend: str | None = None,
     ):
         """
         Return a pandas Dataframe with data of the endpoint /vermarktung/VermarktungsWind.
@@ -295,9 +198,16 @@ class VermarktungClient(BaseNtClient):
             transform_dates -- The data contains times with date, time and timezone in separate columns
                                if this option resolves to "True" the times will be transformed into two
                                columns "von" and "bis" that contain fully qualified timestamps. (default: False)
+            columns -- only return these columns, see constants.endpoints for their names (default: all columns)
+            backend -- "pandas", "arrow" or "polars", the type of the result (default: the backend of the client)
         """
-        return self._basic_read_vermarktung(
-            "vermarktung/VermarktungsWind", dt_begin, dt_end, transform_dates
+        return self._read_endpoint(
+            "vermarktung/VermarktungsWind",
+            dt_begin,
+            dt_end,
+            transform_dates,
+            columns=columns,
+            backend=backend,
         )
 
     def vermarktung_sonstige(
@@ -305,6 +215,8 @@ class VermarktungClient(BaseNtClient):
         dt_begin: dt.datetime | None = None,
         dt_end: dt.datetime | None = None,
         transform_dates=False,
+        columns: list[str] | None = None,
+        backend: str | None = None,
     ):
         """
         Return a pandas Dataframe with data of the endpoint /vermarktung/VermarktungsSonstige.
@@ -315,9 +227,16 @@ class VermarktungClient(BaseNtClient):
             transform_dates -- The data contains times with date, time and timezone in separate columns
                                if this option resolves to "True" the times will be transformed into two
                                columns "von" and "bis" that contain fully qualified timestamps. (default: False)
+            columns -- only return these columns, see constants.endpoints for their names (default: all columns)
+            backend -- "pandas", "arrow" or "polars", the type of the result (default: the backend of the client)
         """
-        return self._basic_read_vermarktung(
-            "vermarktung/VermarktungsSonstige", dt_begin, dt_end, transform_dates
+        return self._read_endpoint(
+            "vermarktung/VermarktungsSonstige",
+            dt_begin,
+            dt_end,
+            transform_dates,
+            columns=columns,
+            backend=backend,
         )
 
     def spotmarktpreise(
@@ -325,6 +244,8 @@ class VermarktungClient(BaseNtClient):
         dt_begin: dt.datetime | None = None,
         dt_end: dt.datetime | None = None,
         transform_dates=False,
+        columns: list[str] | None = None,
+        backend: str | None = None,
     ):
         """
         Return a pandas Dataframe with data of the endpoint /Spotmarktpreise.
@@ -335,17 +256,25 @@ class VermarktungClient(BaseNtClient):
             transform_dates -- The data contains times with date, time and timezone in separate columns
                                if this option resolves to "True" the times will be transformed into two
                                columns "von" and "bis" that contain fully qualified timestamps. (default: False)
+            columns -- only return these columns, see constants.endpoints for their names (default: all columns)
+            backend -- "pandas", "arrow" or "polars", the type of the result (default: the backend of the client)
         """
-        return self._basic_read_vermarktung(
+        return self._read_endpoint(
             "Spotmarktpreise",
             dt_begin,
             dt_end,
-            transform_dates=transform_dates,
-            dateformat="%d.%m.%Y %H:%M %Z",
+            transform_dates,
+            columns=columns,
+            backend=backend,
         )
 
     def negative_preise(
-        self, dt_begin: dt.datetime, dt_end: dt.datetime, transform_dates=False
+        self,
+        dt_begin: dt.datetime,
+        dt_end: dt.datetime,
+        transform_dates=False,
+        columns: list[str] | None = None,
+        backend: str | None = None,
     ):
         """
         Return a pandas Dataframe with data of the endpoint /NegativePreise.
@@ -355,13 +284,25 @@ class VermarktungClient(BaseNtClient):
             transform_dates -- The data contains times as a string in the format "%Y-%m-%d %H:%M"
                                if this option resolves to "True" the times will be transformed into a
                                fully qualified timestamp. (default: False)
+            columns -- only return these columns, see constants.endpoints for their names (default: all columns)
+            backend -- "pandas", "arrow" or "polars", the type of the result (default: the backend of the client)
         """
-        return self._basic_read_negative_preise(
-            "NegativePreise", dt_begin, dt_end, transform_dates
+        return self._read_endpoint(
+            "NegativePreise",
+            dt_begin,
+            dt_end,
+            transform_dates,
+            columns=columns,
+            backend=backend,
         )
 
     def negative_preise_1h(
-        self, dt_begin: dt.datetime, dt_end: dt.datetime, transform_dates=False
+        self,
+        dt_begin: dt.datetime,
+        dt_end: dt.datetime,
+        transform_dates=False,
+        columns: list[str] | None = None,
+        backend: str | None = None,
     ):
         """
         Return a pandas Dataframe with data of the endpoint /NegativePreise/1.
@@ -371,13 +312,25 @@ class VermarktungClient(BaseNtClient):
             transform_dates -- The data contains times as a string in the format "%Y-%m-%d %H:%M"
                                if this option resolves to "True" the times will be transformed into a
                                fully qualified timestamp. (default: False)
+            columns -- only return these columns, see constants.endpoints for their names (default: all columns)
+            backend -- "pandas", "arrow" or "polars", the type of the result (default: the backend of the client)
         """
-        return self._basic_read_negative_preise(
-            "NegativePreise/1", dt_begin, dt_end, transform_dates
+        return self._read_endpoint(
+            "NegativePreise/1",
+            dt_begin,
+            dt_end,
+            transform_dates,
+            columns=columns,
+            backend=backend,
         )
 
     def negative_preise_3h(
-        self, dt_begin: dt.datetime, dt_end: dt.datetime, transform_dates=False
+        self,
+        dt_begin: dt.datetime,
+        dt_end: dt.datetime,
+        transform_dates=False,
+        columns: list[str] | None = None,
+        backend: str | None = None,
     ):
         """
         Return a pandas Dataframe with data of the endpoint /NegativePreise/3.
@@ -387,13 +340,25 @@ class VermarktungClient(BaseNtClient):
             transform_dates -- The data contains times as a string in the format "%Y-%m-%d %H:%M"
                                if this option resolves to "True" the times will be transformed into a
                                fully qualified timestamp. (default: False)
+            columns -- only return these columns, see constants.endpoints for their names (default: all columns)
+            backend -- "pandas", "arrow" or "polars", the type of the result (default: the backend of the client)
         """
-        return self._basic_read_negative_preise(
-            "NegativePreise/3", dt_begin, dt_end, transform_dates
+        return self._read_endpoint(
+            "NegativePreise/3",
+            dt_begin,
+            dt_end,
+            transform_dates,
+            columns=columns,
+            backend=backend,
         )
 
     def negative_preise_4h(
-        self, dt_begin: dt.datetime, dt_end: dt.datetime, transform_dates=False
+        self,
+        dt_begin: dt.datetime,
+        dt_end: dt.datetime,
+        transform_dates=False,
+        columns: list[str] | None = None,
+        backend: str | None = None,
     ):
         """
         Return a pandas Dataframe with data of the endpoint /NegativePreise/4.
@@ -403,13 +368,25 @@ class VermarktungClient(BaseNtClient):
             transform_dates -- The data contains times as a string in the format "%Y-%m-%d %H:%M"
                                if this option resolves to "True" the times will be transformed into a
                                fully qualified timestamp. (default: False)
+            columns -- only return these columns, see constants.endpoints for their names (default: all columns)
+            backend -- "pandas", "arrow" or "polars", the type of the result (default: the backend of the client)
         """
-        return self._basic_read_negative_preise(
-            "NegativePreise/4", dt_begin, dt_end, transform_dates
+        return self._read_endpoint(
+            "NegativePreise/4",
+            dt_begin,
+            dt_end,
+            transform_dates,
+            columns=columns,
+            backend=backend,
         )
 
     def negative_preise_6h(
-        self, dt_begin: dt.datetime, dt_end: dt.datetime, transform_dates=False
+        self,
+        dt_begin: dt.datetime,
+        dt_end: dt.datetime,
+        transform_dates=False,
+        columns: list[str] | None = None,
+        backend: str | None = None,
     ):
         """
         Return a pandas Dataframe with data of the endpoint /NegativePreise/6.
@@ -419,13 +396,25 @@ class VermarktungClient(BaseNtClient):
             transform_dates -- The data contains times as a string in the format "%Y-%m-%d %H:%M"
                                if this option resolves to "True" the times will be transformed into a
                                fully qualified timestamp. (default: False)
+            columns -- only return these columns, see constants.endpoints for their names (default: all columns)
+            backend -- "pandas", "arrow" or "polars", the type of the result (default: the backend of the client)
         """
-        return self._basic_read_negative_preise(
-            "NegativePreise/6", dt_begin, dt_end, transform_dates
+        return self._read_endpoint(
+            "NegativePreise/6",
+            dt_begin,
+            dt_end,
+            transform_dates,
+            columns=columns,
+            backend=backend,
         )
 
     def negative_preise_15m(
-        self, dt_begin: dt.datetime, dt_end: dt.datetime, transform_dates=False
+        self,
+        dt_begin: dt.datetime,
+        dt_end: dt.datetime,
+        transform_dates=False,
+        columns: list[str] | None = None,
+        backend: str | None = None,
     ):
         """
         Return a pandas Dataframe with data of the endpoint /NegativePreise/15.
@@ -435,12 +424,25 @@ class VermarktungClient(BaseNtClient):
             transform_dates -- The data contains times as a string in the format "%Y-%m-%d %H:%M"
                                if this option resolves to "True" the times will be transformed into a
                                fully qualified timestamp. (default: False)
+            columns -- only return these columns, see constants.endpoints for their names (default: all columns)
+            backend -- "pandas", "arrow" or "polars", the type of the result (default: the backend of the client)
         """
-        return self._basic_read_negative_preise(
-            "NegativePreise/15", dt_begin, dt_end, transform_dates
+        return self._read_endpoint(
+            "NegativePreise/15",
+            dt_begin,
+            dt_end,
+            transform_dates,
+            columns=columns,
+            backend=backend,
         )
 
-    def jahresmarktpraemie(self, year: int | None = None, transpose: bool = False):
+    def jahresmarktpraemie(
+        self,
+        year: int | None = None,
+        transpose: bool = False,
+        columns: list[str] | None = None,
+        backend: str | None = None,
+    ):
         """
         Return a pandas Dataframe with data of the endpoint /Jahresmarktpraemie.
         If no year is given, all available data will be queried.
@@ -448,28 +450,25 @@ class VermarktungClient(BaseNtClient):
             year -- int representation of the year to get the data for (earliest data: 2020)
             transpose -- The raw data has each year as a column insted of a row.
                          If this parameter is set to True the dataframe will be transposed
-        """
-        url = f"{self._API_BASE_URL}/data/Jahresmarktpraemie/"
-        if year is not None:
-            url = url + str(year)
-
-        response = requests.get(
-            url, headers={"Authorization": "Bearer {}".format(self.token)}
-        )
-        response.raise_for_status()
-        df = pd.read_csv(
-            io.StringIO(response.text),
-            sep=";",
-            header=0,
-            decimal=",",
-            na_values=["N.A."],
+            columns -- only return these columns, see constants.endpoints for their names (default: all columns)
+            backend -- "pandas", "arrow" or "polars", the type of the result (default: the backend of the client)
+        """
+        return self._read_endpoint(
+            "Jahresmarktpraemie",
+            transform_dates=transpose,
+            columns=columns,
+            backend=backend,
+            year=year if year is not None else "",
         )
-        if transpose:
-            df = df.set_index(["Alle Werte in ct/kWh"])
-            df = df.transpose()
-        return df
 
-    def marktpraemie(self, dt_begin: dt.date, dt_end: dt.date, transform_dates=False):
+    def marktpraemie(
+        self,
+        dt_begin: dt.date,
+        dt_end: dt.date,
+        transform_dates=False,
+        columns: list[str] | None = None,
+        backend: str | None = None,
+    ):
         """
         Return a pandas Dataframe with data of the endpoint /marktpraemie.
         Year & month of both start and end are extracted from dt_begin and dt_end.
@@ -477,29 +476,28 @@ class VermarktungClient(BaseNtClient):
             dt_begin -- date object for start of data (day will be ignored)
             dt_end -- date object for end of data (day will be ignored)
             transform_dates -- data contains months in th format "1/2012"
+            columns -- only return these columns, see constants.endpoints for their names (default: all columns)
+            backend -- "pandas", "arrow" or "polars", the type of the result (default: the backend of the client)
         """
-        if not self._check_preconditions(
+        return self._read_endpoint(
+            "marktpraemie",
             dt.datetime(dt_begin.year, dt_begin.month, dt_begin.day),
-            endpoints["/marktpraemie"]["first_data"],
             dt.datetime(dt_end.year, dt_end.month, dt_end.day),
-        ):
-            return self._return_empty_frame("/marktpraemie", transform_dates)
-
-        url = f"{self._API_BASE_URL}/data/marktpraemie/{dt_begin.month}/{dt_begin.year}/{dt_end.month}/{dt_end.year}"
-        response = requests.get(
-            url, headers={"Authorization": "Bearer {}".format(self.token)}
-        )
-        response.raise_for_status()
-        df = pd.read_csv(
-            io.StringIO(response.text),
-            sep=";",
-            header=0,
-            decimal=",",
-            na_values=["N.A.", ""],
+            transform_dates,
+            columns=columns,
+            backend=backend,
+            begin=dt_begin,
+            end=dt_end,
         )
-        return df
 
-    def id_aep(self, dt_begin: dt.datetime, dt_end: dt.datetime, transform_dates=False):
+    def id_aep(
+        self,
+        dt_begin: dt.datetime,
+        dt_end: dt.datetime,
+        transform_dates=False,
+        columns: list[str] | None = None,
+        backend: str | None = None,
+    ):
         """
         Return a pandas Dataframe with data of the endpoint /IdAep.
         The raw data contains the columns: "Datum von;(Uhrzeit) von;Zeitzone;(Uhrzeit) bis;Zeitzone;ID AEP in €/MWh"
@@ -510,59 +508,14 @@ class VermarktungClient(BaseNtClient):
             transform_dates -- The data contains times with date, time and timezone in separate columns
                                if this option resolves to "True" the times will be transformed into two
                                columns "von" and "bis" that contain fully qualified timestamps. (default: False)
+            columns -- only return these columns, see constants.endpoints for their names (default: all columns)
+            backend -- "pandas", "arrow" or "polars", the type of the result (default: the backend of the client)
         """
-        if not self._check_preconditions(
-            dt_begin, endpoints["/IdAep"]["first_data"], dt_end
-        ):
-            return self._return_empty_frame("/IdAep", transform_dates)
-
-        if (dt_begin.astimezone(dt.UTC) + self.max_query_distance) < dt_end.astimezone(
-            dt.UTC
-        ):
-            # split into multiple api calls
-            timeframes = self._split_timeframe(dt_begin, dt_end)
-            dataframes = []
-            for timeframe in timeframes:
-                dataframes.append(
-                    self.id_aep(timeframe[0], timeframe[1], transform_dates)
-                )
-            return pd.concat(dataframes)
-
-        url = f"{self._API_BASE_URL}/data/IdAep/{dt_begin.strftime(self._api_date_format)}/{dt_end.strftime(self._api_date_format)}"
-
-        response = requests.get(
-            url, headers={"Authorization": "Bearer {}".format(self.token)}
-        )
-        response.raise_for_status()
-        df = pd.read_csv(
-            io.StringIO(response.text),
-            sep=";",
-            header=0,
-            decimal=",",
-            na_values=["N.A."],
-        )
-        df.rename(
-            columns={"Zeitzone": "Zeitzone von", "Zeitzone.1": "Zeitzone bis"},
-            inplace=True,
+        return self._read_endpoint(
+            "IdAep",
+            dt_begin,
+            dt_end,
+            transform_dates,
+            columns=columns,
+            backend=backend,
         )
-
-        if transform_dates:
-            df["von"] = pd.to_datetime(
-                df["Datum von"] + " " + df["(Uhrzeit) von"] + " " + df["Zeitzone von"],
-                format=_csv_date_format,
-                utc=True,
-            )
-            df["bis"] = pd.to_datetime(
-                df["Datum von"] + " " + df["(Uhrzeit) bis"] + " " + df["Zeitzone bis"],
-                format=_csv_date_format,
-                utc=True,
-            )
-            # The end of timeframes may be 00:00 of the next day which is not correctly represented in timestamps
-            df["bis"] = df["bis"].where(
-                df["bis"].dt.time != dt.time(0, 0), df["bis"] + dt.timedelta(days=1)
-            )
-            df = df.drop(
-                ["Datum von", "Zeitzone von", "Zeitzone bis"], axis=1
-            ).set_index("von")
-
-        return df
@@ -0,0 +1,67 @@
+import datetime as dt
+
+import pytest
+
+import netztransparenz as nt
+
+_TOKEN_URL = "https://identity.netztransparenz.de/users/connect/token"
+_API_BASE_URL = "https://ds.netztransparenz.de/api/v1"
+BODY = """Datum;Zeitzone;von;bis;Datenkategorie;Datentyp;Einheit;Deutschland
+01.01.2024;UTC;13:00;13:15;NRV-Saldo;Betrieblich;MW;1,5"""
+
+
+@pytest.fixture
+def archive(tmp_path):
+    return nt.ResponseArchive(tmp_path / "archive")
+
+
+@pytest.fixture
+def client(archive, requests_mock):
+    requests_mock.post(_TOKEN_URL, json={"access_token": "placeholder_token"})
+    for day in (1, 2):
+        requests_mock.get(
+            f"{_API_BASE_URL}/data/NrvSaldo/NRVSaldo/Betrieblich/2024-01-0{day}T00:00:00/2024-01-0{day + 1}T00:00:00",
+            text=BODY,
+        )
+    return nt.NetztransparenzClient(
+        "PLACEHOLDER_ID", "PLACEHOLDER_SECRET", archive=archive
+    )
+
+
+def test_identical_responses_are_stored_once(client, archive):
+    client.set_max_query_distance(dt.timedelta(days=1))
+    client.nrvsaldo_nrvsaldo_betrieblich(
+        dt.datetime(2024, 1, 1), dt.datetime(2024, 1, 3)
+    )
+    entries = archive.entries("NrvSaldo/NRVSaldo/Betrieblich")
+    assert [start for _, start, _, _ in entries] == [
+        dt.datetime(2024, 1, 1, tzinfo=dt.UTC),
+        dt.datetime(2024, 1, 2, tzinfo=dt.UTC),
+    ]
+    assert entries[0][3] == entries[1][3]
+    assert len(list((archive.directory / "blobs").rglob("*.gz"))) == 1
+    assert archive.load(entries[0][0]).decode() == BODY
+    assert (
+        len(
+            archive.entries(
+                "NrvSaldo/NRVSaldo/Betrieblich",
+                dt.datetime(2024, 1, 2),
+                dt.datetime(2024, 1, 5),
+            )
+        )
+        == 1
+    )
+
+
+def test_replay_parses_archived_responses_again(client, archive, requests_mock):
+    client.nrvsaldo_nrvsaldo_betrieblich(
+        dt.datetime(2024, 1, 1), dt.datetime(2024, 1, 2)
+    )
+    requests_mock.reset_mock()
+    archive.replay = True
+    result = client.nrvsaldo_nrvsaldo_betrieblich(
+        dt.datetime(2024, 1, 1), dt.datetime(2024, 1, 2), True
+    )
+    assert result["Deutschland"].iloc[0] == 1.5
+    assert str(result.index[0]) == "2024-01-01 13:00:00+00:00"
+    assert requests_mock.call_count == 0
@@ -0,0 +1,346 @@
+import datetime as dt
+import os
+import re
+
+import pytest
+
+import netztransparenz as nt
+from netztransparenz import constants
+
+pytest.importorskip("pyarrow")
+
+_TOKEN_URL = "https://identity.netztransparenz.de/users/connect/token"
+_SOLAR_URL = re.compile(
+    r"https://ds.netztransparenz.de/api/v1/data/hochrechnung/Solar/.*"
+)
+_NRVSALDO_URL = re.compile(
+    r"https://ds.netztransparenz.de/api/v1/data/NrvSaldo/NRVSaldo/.*"
+)
+NRVSALDO_HEADER = "Datum;Zeitzone;von;bis;Datenkategorie;Datentyp;Einheit;Deutschland"
+HEADER = "Datum;von;Zeitzone von;bis;Zeitzone bis;50Hertz (MW);Amprion (MW);TenneT TSO (MW);TransnetBW (MW)"
+
+
+def solar_response(request, context):
+    # one row per requested timeframe, the value is the day of its start
+    start = dt.datetime.fromisoformat(request.path.split("/")[-2])
+    return f"{HEADER}\n{start:%Y-%m-%d};12:00;UTC;12:15;UTC;{start.day},5;1,0;2,0;3,0"
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return nt.ChunkCache(tmp_path / "chunks")
+
+
+@pytest.fixture
+def client(cache, requests_mock):
+    requests_mock.post(_TOKEN_URL, json={"access_token": "placeholder_token"})
+    requests_mock.get(_SOLAR_URL, text=solar_response)
+    return nt.NetztransparenzClient(
+        "PLACEHOLDER_ID", "PLACEHOLDER_SECRET", chunk_cache=cache
+    )
+
+
+def requested_timeframes(requests_mock):
+    return [
+        request.path.split("/")[-2:]
+        for request in requests_mock.request_history
+        if request.method == "GET"
+    ]
+
+
+def test_only_missing_timeframes_are_requested(client, requests_mock):
+    first = client.hochrechnung_solar(
+        dt.datetime(2024, 1, 1), dt.datetime(2024, 3, 1), True
+    )
+    assert list(first["50Hertz (MW)"]) == [1.5, 1.5]
+    assert len(requested_timeframes(requests_mock)) == 2
+
+    requests_mock.reset_mock()
+    second = client.hochrechnung_solar(
+        dt.datetime(2024, 2, 1), dt.datetime(2024, 4, 10), True
+    )
+    assert list(second["50Hertz (MW)"]) == [1.5, 1.5, 1.5]
+    assert str(second.index[0]) == "2024-02-01 12:00:00+00:00"
+    assert requested_timeframes(requests_mock) == [
+        ["2024-03-01t00:00:00", "2024-04-01t00:00:00"],
+        ["2024-04-01t00:00:00", "2024-04-10t00:00:00"],
+    ]
+
+
+def test_raw_and_transformed_are_cached_separately(client, requests_mock):
+    client.hochrechnung_solar(dt.datetime(2024, 1, 1), dt.datetime(2024, 2, 1), True)
+    raw = client.hochrechnung_solar(
+        dt.datetime(2024, 1, 1), dt.datetime(2024, 2, 1), False
+    )
+    assert list(raw.columns) == HEADER.split(";")
+    assert len(requested_timeframes(requests_mock)) == 2
+    client.hochrechnung_solar(dt.datetime(2024, 1, 1), dt.datetime(2024, 2, 1), False)
+    assert len(requested_timeframes(requests_mock)) == 2
+
+
+def test_current_day_is_not_cached(client, cache):
+    today = dt.datetime.now(dt.UTC).replace(
+        tzinfo=None, hour=0, minute=0, second=0, microsecond=0
+    )
+    client.set_strict(False)
+    client.set_alignment("day")
+    client.hochrechnung_solar(
+        today - dt.timedelta(days=1), today + dt.timedelta(days=1), True
+    )
+    assert [path.name[:8] for path in cache._files()] == [
+        f"{today - dt.timedelta(days=1):%Y%m%d}"
+    ]
+
+
+def test_invalidate(client, cache, requests_mock):
+    client.hochrechnung_solar(dt.datetime(2024, 1, 1), dt.datetime(2024, 4, 1), True)
+    cache.invalidate(
+        "hochrechnung/Solar", dt.datetime(2024, 2, 15), dt.datetime(2024, 3, 1)
+    )
+    assert len(cache._files("hochrechnung/Solar")) == 2
+    requests_mock.reset_mock()
+    client.hochrechnung_solar(dt.datetime(2024, 1, 1), dt.datetime(2024, 4, 1), True)
+    assert requested_timeframes(requests_mock) == [
+        ["2024-02-01t00:00:00", "2024-03-01t00:00:00"]
+    ]
+    cache.clear()
+    assert cache.size() == 0
+
+
+def test_least_recently_used_files_are_evicted(client, cache, monkeypatch):
+    client.hochrechnung_solar(dt.datetime(2024, 1, 1), dt.datetime(2024, 2, 1), True)
+    file_size = cache.size()
+    assert file_size == sum(path.stat().st_size for path in cache._files())
+    cache.max_size = int(2.5 * file_size)
+    client.hochrechnung_solar(dt.datetime(2024, 2, 1), dt.datetime(2024, 3, 1), True)
+    # reading January makes it the most recently used file
+    client.hochrechnung_solar(dt.datetime(2024, 1, 1), dt.datetime(2024, 2, 1), True)
+    # the index knows the sizes, so writing does not look at the other files
+    with monkeypatch.context() as patch:
+        patch.setattr(cache, "_files", None)
+        client.hochrechnung_solar(
+            dt.datetime(2024, 3, 1), dt.datetime(2024, 4, 1), True
+        )
+    names = sorted(path.name[:8] for path in cache._files())
+    assert names == ["20240101", "20240301"]
+    assert cache.size() == sum(path.stat().st_size for path in cache._files())
+
+
+def test_recent_operational_data_is_refreshed(client, requests_mock, monkeypatch):
+    requests_mock.get(
+        _NRVSALDO_URL,
+        text=f"{NRVSALDO_HEADER}\n01.01.2024;UTC;13:00;13:15;NRV-Saldo;Betrieblich;MW;1,5",
+    )
+    monkeypatch.setitem(constants.freshness["Betrieblich"], "ttl", dt.timedelta(0))
+    today = dt.datetime.now(dt.UTC).replace(
+        tzinfo=None, hour=0, minute=0, second=0, microsecond=0
+    )
+    client.set_alignment("day")
+    old = (dt.datetime(2024, 1, 1), dt.datetime(2024, 1, 2))
+    recent = (today - dt.timedelta(days=2), today - dt.timedelta(days=1))
+    for _ in range(2):
+        client.nrvsaldo_nrvsaldo_betrieblich(*old)
+        client.nrvsaldo_nrvsaldo_betrieblich(*recent)
+        client.nrvsaldo_nrvsaldo_qualitaetsgesichert(*recent)
+    requested = [
+        request.path.split("/")[-3:-1]
+        for request in requests_mock.request_history
+        if request.method == "GET"
+    ]
+    assert requested.count(["betrieblich", "2024-01-01t00:00:00"]) == 1
+    assert requested.count(["betrieblich", f"{recent[0]:%Y-%m-%dt%H:%M:%S}"]) == 2
+    assert (
+        requested.count(["qualitaetsgesichert", f"{recent[0]:%Y-%m-%dt%H:%M:%S}"]) == 1
+    )
+
+
+def test_missing(client, cache, tmp_path):
+    client.hochrechnung_solar(dt.datetime(2024, 1, 1), dt.datetime(2024, 3, 1), True)
+    client.hochrechnung_solar(dt.datetime(2024, 4, 1), dt.datetime(2024, 5, 1), True)
+    assert cache.missing(
+        "hochrechnung/Solar", dt.datetime(2024, 1, 15), dt.datetime(2024, 6, 1), True
+    ) == [
+        (
+            dt.datetime(2024, 3, 1, tzinfo=dt.UTC),
+            dt.datetime(2024, 4, 1, tzinfo=dt.UTC),
+        ),
+        (
+            dt.datetime(2024, 5, 1, tzinfo=dt.UTC),
+            dt.datetime(2024, 6, 1, tzinfo=dt.UTC),
+        ),
+    ]
+    assert (
+        len(
+            cache.missing(
+                "hochrechnung/Solar",
+                dt.datetime(2024, 1, 1),
+                dt.datetime(2024, 2, 1),
+                False,
+            )
+        )
+        == 1
+    )
+    cache.invalidate(
+        "hochrechnung/Solar", dt.datetime(2024, 2, 1), dt.datetime(2024, 3, 1)
+    )
+    assert cache.missing(
+        "hochrechnung/Solar", dt.datetime(2024, 1, 1), dt.datetime(2024, 3, 1), True
+    ) == [
+        (
+            dt.datetime(2024, 2, 1, tzinfo=dt.UTC),
+            dt.datetime(2024, 3, 1, tzinfo=dt.UTC),
+        ),
+    ]
+    # the index is rebuilt from the files for caches created before it existed
+    os.remove(cache.directory / "coverage.sqlite")
+    rebuilt = nt.ChunkCache(cache.directory)
+    assert rebuilt.missing(
+        "hochrechnung/Solar", dt.datetime(2024, 1, 1), dt.datetime(2024, 3, 1), True
+    ) == [
+        (
+            dt.datetime(2024, 2, 1, tzinfo=dt.UTC),
+            dt.datetime(2024, 3, 1, tzinfo=dt.UTC),
+        ),
+    ]
+
+
+def test_columns(client, requests_mock):
+    client.hochrechnung_solar(dt.datetime(2024, 1, 1), dt.datetime(2024, 3, 1), True)
+    requests_mock.reset_mock()
+    result = client.hochrechnung_solar(
+        dt.datetime(2024, 1, 1), dt.datetime(2024, 3, 1), True, columns=["Amprion (MW)"]
+    )
+    assert list(result.columns) == ["Amprion (MW)"]
+    assert str(result.index[0]) == "2024-01-01 12:00:00+00:00"
+    assert requested_timeframes(requests_mock) == []
+    # the cache keeps every column, so a later query for other columns is not requested again
+    result = client.hochrechnung_solar(
+        dt.datetime(2024, 1, 1), dt.datetime(2024, 3, 1), True
+    )
+    assert (
+        list(result.columns)
+        == constants.endpoints["/hochrechnung/Solar"]["transformed_header"].split(";")[
+            1:
+        ]
+    )
+    assert requested_timeframes(requests_mock) == []
+
+
+def nrvsaldo_response(request, context):
+    # one row at 13:00 of every day of the requested timeframe
+    start, end = (
+        dt.datetime.fromisoformat(value) for value in request.path.split("/")[-2:]
+    )
+    days = (start + dt.timedelta(days=day) for day in range((end - start).days))
+    rows = [
+        f"{day:%d.%m.%Y};UTC;13:00;13:15;NRV-Saldo;Qualitaetsgesichert;MW;{day.day},5"
+        for day in days
+    ]
+    return "\n".join([NRVSALDO_HEADER, *rows])
+
+
+def test_clipped_timeframes_are_cut_from_cached_ones(client, requests_mock):
+    requests_mock.get(_NRVSALDO_URL, text=nrvsaldo_response)
+    for transform_dates in (True, False):
+        client.nrvsaldo_nrvsaldo_qualitaetsgesichert(
+            dt.datetime(2024, 1, 1), dt.datetime(2024, 3, 15), transform_dates
+        )
+    requests_mock.reset_mock()
+    result = client.nrvsaldo_nrvsaldo_qualitaetsgesichert(
+        dt.datetime(2024, 1, 1), dt.datetime(2024, 3, 10), True
+    )
+    assert len(result) == 31 + 29 + 9
+    assert str(result.index[-1]) == "2024-03-09 13:00:00+00:00"
+    raw = client.nrvsaldo_nrvsaldo_qualitaetsgesichert(
+        dt.datetime(2024, 3, 5),
+        dt.datetime(2024, 3, 10),
+        False,
+        columns=["Deutschland"],
+    )
+    assert list(raw["Deutschland"]) == [5.5, 6.5, 7.5, 8.5, 9.5]
+    assert requested_timeframes(requests_mock) == []
+
+
+def test_covered_sub_range_is_not_requested(client, cache, requests_mock):
+    requests_mock.get(_NRVSALDO_URL, text=nrvsaldo_response)
+    client.nrvsaldo_nrvsaldo_qualitaetsgesichert(
+        dt.datetime(2024, 3, 1), dt.datetime(2024, 3, 15), True
+    )
+    requests_mock.reset_mock()
+    result = client.nrvsaldo_nrvsaldo_qualitaetsgesichert(
+        dt.datetime(2024, 3, 4), dt.datetime(2024, 3, 6), True
+    )
+    assert list(result["Deutschland"]) == [4.5, 5.5]
+    assert requests_mock.call_count == 0
+    # only the part after the cached timeframe is requested
+    result = client.nrvsaldo_nrvsaldo_qualitaetsgesichert(
+        dt.datetime(2024, 3, 10), dt.datetime(2024, 3, 20), True
+    )
+    assert list(result["Deutschland"]) == [day + 0.5 for day in range(10, 20)]
+    assert requested_timeframes(requests_mock) == [
+        ["2024-03-15t00:00:00", "2024-03-20t00:00:00"]
+    ]
+    assert (
+        cache.missing(
+            "NrvSaldo/NRVSaldo/Qualitaetsgesichert",
+            dt.datetime(2024, 3, 1),
+            dt.datetime(2024, 3, 20),
+            True,
+        )
+        == []
+    )
+
+
+def test_cached_requests_respect_max_query_distance(client, requests_mock):
+    # the cache aligns requests to months, but no request may be longer than max_query_distance
+    client.set_max_query_distance(dt.timedelta(days=7))
+    client.hochrechnung_solar(dt.datetime(2024, 1, 1), dt.datetime(2024, 3, 1), True)
+    timeframes = [
+        tuple(dt.datetime.fromisoformat(value) for value in timeframe)
+        for timeframe in requested_timeframes(requests_mock)
+    ]
+    assert all(end - start <= dt.timedelta(days=7) for start, end in timeframes)
+    assert [start for start, _ in timeframes[1:]] == [end for _, end in timeframes[:-1]]
+    assert (timeframes[0][0], timeframes[-1][1]) == (
+        dt.datetime(2024, 1, 1),
+        dt.datetime(2024, 3, 1),
+    )
+    assert len(timeframes) == 5 + 5
+
+
+def test_evicting_a_chunk_inside_another_does_not_duplicate_rows(
+    client, cache, requests_mock
+):
+    requests_mock.get(_NRVSALDO_URL, text=nrvsaldo_response)
+    resource_url = "NrvSaldo/NRVSaldo/Qualitaetsgesichert"
+    january = (
+        dt.datetime(2024, 1, 1, tzinfo=dt.UTC),
+        dt.datetime(2024, 2, 1, tzinfo=dt.UTC),
+    )
+    client.nrvsaldo_nrvsaldo_qualitaetsgesichert(*january, True)
+    # a narrow timeframe inside the cached month, e.g. from before the month was refreshed
+    narrow = (dt.datetime(2024, 1, 15, tzinfo=dt.UTC), january[1])
+    df = cache.load(resource_url, *january, True)
+    cache.store(resource_url, *narrow, True, df[df.index >= narrow[0]])
+    cache._remove(cache._path(resource_url, *narrow, True))
+    requests_mock.reset_mock()
+    result = client.nrvsaldo_nrvsaldo_qualitaetsgesichert(*january, True)
+    assert len(result) == 31
+    assert result.index.is_unique
+    assert requested_timeframes(requests_mock) == []
+
+
+def test_sizes_of_older_caches_are_recorded(client, cache):
+    client.hochrechnung_solar(dt.datetime(2024, 1, 1), dt.datetime(2024, 3, 1), True)
+    size = cache.size()
+    # an index from before sizes were recorded
+    with cache.coverage._connect() as connection:
+        connection.executescript(
+            """
+            DROP INDEX chunks_used;
+            ALTER TABLE chunks DROP COLUMN size;
+            ALTER TABLE chunks DROP COLUMN used;
+            UPDATE totals SET size = 0;
+            """
+        )
+    assert nt.ChunkCache(cache.directory).size() == size
@@ -0,0 +1,240 @@
+import asyncio
+import datetime as dt
+import threading
+
+import pytest
+
+import netztransparenz as nt
+from netztransparenz import base_client
+
+aiohttp = pytest.importorskip("aiohttp")
+web = pytest.importorskip("aiohttp.web")
+
+NRVSALDO_HEADER = "Datum;Zeitzone;von;bis;Datenkategorie;Datentyp;Einheit;Deutschland"
+
+
+class FakeServer:
+    """Serves the token endpoint and a few data endpoints on localhost."""
+
+    def __init__(self):
+        self.token_requests = 0
+        self.data_requests = []
+        self.reject_next = False
+        self.unavailable = 0
+        self.broken = 0
+        self.app = web.Application()
+        self.app.router.add_post("/token", self.token)
+        self.app.router.add_get("/health", self.health)
+        self.app.router.add_get("/data/{tail:.*}", self.data)
+
+    async def token(self, request):
+        self.token_requests += 1
+        return web.json_response({"access_token": "placeholder_token"})
+
+    async def health(self, request):
+        return web.Response(text='"OK"')
+
+    async def data(self, request):
+        if self.reject_next:
+            self.reject_next = False
+            return web.Response(status=401)
+        if self.unavailable:
+            self.unavailable -= 1
+            return web.Response(status=503, headers={"Retry-After": "0"})
+        if self.broken:
+            self.broken -= 1
+            # the connection breaks after a part of the body was sent
+            response = web.StreamResponse(headers={"Content-Length": "100"})
+            await response.prepare(request)
+            await response.write(b"Alle Werte")
+            request.transport.close()
+            return response
+        assert request.headers["Authorization"] == "Bearer placeholder_token"
+        self.data_requests.append(request.path)
+        if request.path.startswith("/data/NrvSaldo/NRVSaldo/Betrieblich/"):
+            start = dt.datetime.fromisoformat(request.path.split("/")[-2])
+            # answer later chunks first to check that the order is restored
+            await asyncio.sleep((10 - start.day) * 0.01)
+            return web.Response(
+                text=f"{NRVSALDO_HEADER}\n{start:%d.%m.%Y};UTC;13:00;13:15;NRV-Saldo;Betrieblich;MW;{start.day},5\n"
+            )
+        if request.path == "/data/Jahresmarktpraemie/2024":
+            return web.Response(
+                text="Alle Werte in ct/kWh;2024\nJW;7,946\nJW Wind an Land;6,395\n"
+            )
+        return web.Response(status=500)
+
+
+async def run_with_server(test, **options):
+    server = FakeServer()
+    runner = web.AppRunner(server.app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    base_url = f"http://127.0.0.1:{runner.addresses[0][1]}"
+    token_url = base_client._ACCESS_TOKEN_URL
+    base_client._ACCESS_TOKEN_URL = f"{base_url}/token"
+    try:
+        async with nt.AsyncNetztransparenzClient(
+            "PLACEHOLDER_ID", "PLACEHOLDER_SECRET", **options
+        ) as client:
+            client._API_BASE_URL = base_url
+            await test(client, server)
+    finally:
+        base_client._ACCESS_TOKEN_URL = token_url
+        await runner.cleanup()
+
+
+def test_split_timeframes_are_fetched_concurrently_in_order():
+    async def test(client, server):
+        client.set_max_query_distance(dt.timedelta(days=1))
+        result = await client.nrvsaldo_nrvsaldo_betrieblich(
+            dt.datetime(2025, 1, 1), dt.datetime(2025, 1, 5), True
+        )
+        assert list(result["Deutschland"]) == [1.5, 2.5, 3.5, 4.5]
+        assert str(result.index[0]) == "2025-01-01 13:00:00+00:00"
+        assert len(server.data_requests) == 4
+        assert server.token_requests == 1
+
+    asyncio.run(run_with_server(test))
+
+
+def test_stream_yields_chunks_in_order():
+    async def test(client, server):
+        chunks = [
+            df
+            async for df in client.stream(
+                "NrvSaldo/NRVSaldo/Betrieblich",
+                dt.datetime(2025, 1, 1),
+                dt.datetime(2025, 1, 5),
+                chunk="day",
+                columns=["Deutschland"],
+                read_ahead=2,
+            )
+        ]
+        assert [list(df["Deutschland"]) for df in chunks] == [
+            [1.5],
+            [2.5],
+            [3.5],
+            [4.5],
+        ]
+        assert list(chunks[0].columns) == ["Deutschland"]
+
+    asyncio.run(run_with_server(test))
+
+
+def test_one_off_reader_and_health():
+    async def test(client, server):
+        assert await client.check_health() == '"OK"'
+        result = await client.jahresmarktpraemie(2024, transpose=True)
+        assert result["JW"].iloc[0] == 7.946
+
+    asyncio.run(run_with_server(test))
+
+
+def test_error_response_raises():
+    async def test(client, server):
+        with pytest.raises(aiohttp.ClientResponseError):
+            await client.redispatch(dt.datetime(2024, 1, 1), dt.datetime(2024, 1, 2))
+
+    asyncio.run(run_with_server(test))
+
+
+def test_empty_frame_without_request():
+    async def test(client, server):
+        client.set_strict(False)
+        result = await client.nrvsaldo_nrvsaldo_betrieblich(
+            dt.datetime(2025, 1, 2), dt.datetime(2025, 1, 1)
+        )
+        assert result.empty
+        assert server.token_requests == 0
+
+    asyncio.run(run_with_server(test))
+
+
+def test_rejected_token_is_replaced_once():
+    async def test(client, server):
+        server.reject_next = True
+        result = await client.jahresmarktpraemie(2024)
+        assert result.shape == (2, 2)
+        assert server.token_requests == 2
+
+    asyncio.run(run_with_server(test))
+
+
+def test_transient_errors_are_retried():
+    async def test(client, server):
+        server.unavailable = 2
+        result = await client.jahresmarktpraemie(2024, transpose=True)
+        assert result["JW"].iloc[0] == 7.946
+        assert client.retry_statistics.retries == 2
+        assert client.retry_statistics.reasons == {"503": 2}
+
+    asyncio.run(run_with_server(test))
+
+
+def test_broken_bodies_are_retried():
+    async def test(client, server):
+        server.broken = 1
+        result = await client.jahresmarktpraemie(2024, transpose=True)
+        assert result["JW"].iloc[0] == 7.946
+        assert client.retry_statistics.retries == 1
+        assert client.retry_statistics.reasons == {"ClientPayloadError": 1}
+
+    asyncio.run(run_with_server(test))
+
+
+def test_parsing_runs_outside_of_the_event_loop():
+    async def test(client, server):
+        threads = []
+        parse = client._parse
+
+        def recording_parse(query, body):
+            threads.append(threading.current_thread())
+            return parse(query, body)
+
+        client._parse = recording_parse
+        await client.nrvsaldo_nrvsaldo_betrieblich(
+            dt.datetime(2025, 1, 1), dt.datetime(2025, 1, 2), True
+        )
+        assert threads and threading.current_thread() not in threads
+
+    asyncio.run(run_with_server(test))
+
+
+def test_token_cache_is_shared_under_its_lock(tmp_path):
+    token_cache = nt.FileTokenCache(tmp_path)
+    token_cache.store("PLACEHOLDER_ID", "placeholder_token", None)
+    locked = []
+    lock = token_cache.lock
+
+    def recording_lock(client_id):
+        locked.append(client_id)
+        return lock(client_id)
+
+    token_cache.lock = recording_lock
+
+    async def test(client, server):
+        await client.jahresmarktpraemie(2024)
+        assert server.token_requests == 0
+        assert locked == ["PLACEHOLDER_ID"]
+
+    asyncio.run(run_with_server(test, token_cache=token_cache))
+
+
+def test_covered_sub_range_is_read_from_the_chunk_cache(tmp_path):
+    pytest.importorskip("pyarrow")
+
+    async def test(client, server):
+        client.set_alignment("day")
+        await client.nrvsaldo_nrvsaldo_betrieblich(
+            dt.datetime(2025, 1, 1), dt.datetime(2025, 1, 5), True
+        )
+        assert len(server.data_requests) == 4
+        result = await client.nrvsaldo_nrvsaldo_betrieblich(
+            dt.datetime(2025, 1, 2), dt.datetime(2025, 1, 3), True
+        )
+        assert list(result["Deutschland"]) == [2.5]
+        assert len(server.data_requests) == 4
+
+    asyncio.run(run_with_server(test, chunk_cache=nt.ChunkCache(tmp_path)))
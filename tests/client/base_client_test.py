@@ -1,8 +1,15 @@
-import pytest
 import datetime as dt
+import io
+import time
+from concurrent.futures import ThreadPoolExecutor
+
 import pandas as pd
+import pytest
+import requests
+
 import netztransparenz as nt
 
+
 @pytest.fixture(autouse=True)
 def token(requests_mock):
     requests_mock.post(
@@ -17,6 +24,16 @@ def client(token):
     secret = "PLACEHOLDER_SECRET"
     return nt.DienstleistungenClient(id, secret)
 
+
+class _BrokenBody(io.RawIOBase):
+    # a response body whose connection breaks when it is read
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        raise ConnectionResetError("Connection reset by peer")
+
+
 def test_check_preconditions_strict(client):
     client.set_strict(True)
     assert client._check_preconditions(dt.datetime(2000, 1, 1), dt.datetime(2000, 1, 1), dt.datetime(2001, 1, 1))
@@ -55,4 +72,399 @@ def test_split_timeframe(client):
     assert len(result) == 2
 
     result = client._split_timeframe(dt.datetime(2001, 1, 1), dt.datetime(2002, 6 ,19))
-    assert result[1][1] == dt.datetime(2002, 6, 19)
\ No newline at end of file
+    assert result[1][1] == dt.datetime(2002, 6, 19)
+
+
+def test_split_timeframe_aligned(client):
+    result = client._split_timeframe(
+        dt.datetime(2024, 11, 15, 6), dt.datetime(2025, 2, 3), alignment="month"
+    )
+    assert result == [
+        (dt.datetime(2024, 11, 15, 6), dt.datetime(2024, 12, 1)),
+        (dt.datetime(2024, 12, 1), dt.datetime(2025, 1, 1)),
+        (dt.datetime(2025, 1, 1), dt.datetime(2025, 2, 1)),
+        (dt.datetime(2025, 2, 1), dt.datetime(2025, 2, 3)),
+    ]
+    result = client._split_timeframe(
+        dt.datetime(2023, 1, 1), dt.datetime(2025, 1, 1), alignment="year"
+    )
+    assert result == [
+        (dt.datetime(2023, 1, 1), dt.datetime(2024, 1, 1)),
+        (dt.datetime(2024, 1, 1), dt.datetime(2025, 1, 1)),
+    ]
+    result = client._split_timeframe(
+        dt.datetime(2024, 2, 28, 12), dt.datetime(2024, 3, 1, 12), alignment="day"
+    )
+    assert [end for start, end in result] == [
+        dt.datetime(2024, 2, 29),
+        dt.datetime(2024, 3, 1),
+        dt.datetime(2024, 3, 1, 12),
+    ]
+
+
+def test_aligned_timeframes_respect_max_query_distance(client):
+    client.set_alignment("year")
+    client.set_max_query_distance(dt.timedelta(days=1))
+    result = client._timeframes(
+        "hochrechnung/Solar", dt.datetime(2024, 1, 1), dt.datetime(2024, 3, 1), True
+    )
+    assert len(result) == 60
+    assert all(end - start == dt.timedelta(days=1) for start, end in result)
+    # units are split from their start, so a clipped query requests the same timeframes
+    client.set_max_query_distance(dt.timedelta(days=10))
+    result = client._timeframes(
+        "hochrechnung/Solar", dt.datetime(2024, 1, 5), dt.datetime(2024, 1, 25), True
+    )
+    assert [(start.day, end.day) for start, end in result] == [
+        (5, 11),
+        (11, 21),
+        (21, 25),
+    ]
+
+
+def test_alignment_per_endpoint(client):
+    client.set_alignment("day")
+    client.set_alignment("month", "hochrechnung/Solar")
+    start, end = dt.datetime(2024, 1, 30, 12), dt.datetime(2024, 2, 2)
+    assert len(client._timeframes("hochrechnung/Wind", start, end, True)) == 3
+    assert client._timeframes("hochrechnung/Solar", start, end, True) == [
+        (
+            dt.datetime(2024, 1, 30, 12, tzinfo=dt.UTC),
+            dt.datetime(2024, 2, 1, tzinfo=dt.UTC),
+        ),
+        (
+            dt.datetime(2024, 2, 1, tzinfo=dt.UTC),
+            dt.datetime(2024, 2, 2, tzinfo=dt.UTC),
+        ),
+    ]
+    assert len(client._timeframes("hochrechnung/Solar", start, end, False)) == 1
+    with pytest.raises(ValueError):
+        client.set_alignment("week")
+
+
+def test_session_reused_for_requests(client, requests_mock):
+    requests_mock.get("https://ds.netztransparenz.de/api/v1/health", text='"OK"')
+    session = client.session
+    assert client.check_health() == '"OK"'
+    assert client.check_health() == '"OK"'
+    assert client.session is session
+    assert (
+        requests_mock.last_request.headers["Authorization"]
+        == "Bearer placeholder_token"
+    )
+    assert requests_mock.last_request.timeout == client.timeout
+
+
+def test_get_raises_on_error(client, requests_mock):
+    requests_mock.get(
+        "https://ds.netztransparenz.de/api/v1/data/redispatch", status_code=500
+    )
+    with pytest.raises(requests.HTTPError):
+        client._get("https://ds.netztransparenz.de/api/v1/data/redispatch")
+
+
+def test_context_manager_closes_session(token, monkeypatch):
+    closed = []
+    with nt.DienstleistungenClient(
+        "PLACEHOLDER_ID", "PLACEHOLDER_SECRET", timeout=5
+    ) as client:
+        assert client.timeout == 5
+        monkeypatch.setattr(client.session, "close", lambda: closed.append(True))
+    assert closed
+
+
+def test_read_timeframes_keeps_order(client):
+    client.set_max_workers(4)
+    timeframes = [
+        (dt.datetime(2001, 1, day), dt.datetime(2001, 1, day + 1))
+        for day in range(1, 5)
+    ]
+
+    def read(start, end):
+        # later timeframes finish first
+        time.sleep((5 - start.day) * 0.01)
+        return pd.DataFrame({"day": [start.day]})
+
+    result = client._read_timeframes(read, timeframes)
+    assert list(result["day"]) == [1, 2, 3, 4]
+
+
+def test_token_retrieved_lazily(client, requests_mock):
+    assert requests_mock.call_count == 0
+    requests_mock.get("https://ds.netztransparenz.de/api/v1/health", text='"OK"')
+    client.check_health()
+    client.check_health()
+    assert [r.method for r in requests_mock.request_history] == ["POST", "GET", "GET"]
+
+
+def test_login_failure_raises_on_first_request(client, requests_mock):
+    requests_mock.post(
+        "https://identity.netztransparenz.de/users/connect/token", status_code=401
+    )
+    with pytest.raises(Exception, match="Login failed"):
+        client.check_health()
+
+
+def test_token_refreshed_before_expiry(client, requests_mock):
+    requests_mock.post(
+        "https://identity.netztransparenz.de/users/connect/token",
+        [
+            {"json": {"access_token": "first", "expires_in": 30}},
+            {"json": {"access_token": "second", "expires_in": 3600}},
+        ],
+    )
+    # expires within the refresh margin of 60 seconds
+    assert client.token == "first"
+    assert client.token == "second"
+    assert client.token == "second"
+
+
+def test_rejected_token_is_replaced_once(client, requests_mock):
+    requests_mock.post(
+        "https://identity.netztransparenz.de/users/connect/token",
+        [{"json": {"access_token": "old"}}, {"json": {"access_token": "new"}}],
+    )
+    requests_mock.get(
+        "https://ds.netztransparenz.de/api/v1/health",
+        [{"status_code": 401}, {"text": '"OK"'}],
+    )
+    assert client.check_health() == '"OK"'
+    assert requests_mock.last_request.headers["Authorization"] == "Bearer new"
+
+
+def test_concurrent_requests_share_one_login(client, requests_mock):
+    requests_mock.get("https://ds.netztransparenz.de/api/v1/health", text='"OK"')
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(lambda _: client.check_health(), range(16)))
+    assert [r.method for r in requests_mock.request_history].count("POST") == 1
+
+
+def test_adaptive_split_bisects_failed_timeframes(client, requests_mock):
+    client.set_retry_policy(nt.RetryPolicy(max_attempts=1))
+    client.set_max_query_distance(dt.timedelta(days=4))
+    client.set_min_query_distance(dt.timedelta(days=1))
+    client.set_adaptive_split(True)
+    url = "https://ds.netztransparenz.de/api/v1/data/AusgewieseneABSM"
+    body = "Datum;Zeitzone;von;bis;Datenkategorie;Einheit;H1\n{}.01.2025;UTC;13:00;13:15;ABSM;MW;{}\n"
+    requests_mock.get(f"{url}/2025-01-01T00:00:00/2025-01-05T00:00:00", status_code=500)
+    requests_mock.get(f"{url}/2025-01-01T00:00:00/2025-01-03T00:00:00", status_code=504)
+    requests_mock.get(
+        f"{url}/2025-01-01T00:00:00/2025-01-02T00:00:00", text=body.format("01", 1)
+    )
+    requests_mock.get(
+        f"{url}/2025-01-02T00:00:00/2025-01-03T00:00:00", text=body.format("02", 2)
+    )
+    requests_mock.get(
+        f"{url}/2025-01-03T00:00:00/2025-01-05T00:00:00", text=body.format("03", 3)
+    )
+    result = client.ausgewiesene_absm(dt.datetime(2025, 1, 1), dt.datetime(2025, 1, 5))
+    assert list(result["H1"]) == [1, 2, 3]
+    # the endpoint is queried in smaller timeframes from now on
+    assert client._query_distance("AusgewieseneABSM") == dt.timedelta(days=1)
+    assert (
+        len(
+            client._timeframes(
+                "AusgewieseneABSM",
+                dt.datetime(2025, 1, 1),
+                dt.datetime(2025, 1, 5),
+                True,
+            )
+        )
+        == 4
+    )
+
+
+def test_adaptive_split_resplits_planned_timeframes(client, requests_mock):
+    client.set_retry_policy(nt.RetryPolicy(max_attempts=1))
+    client.set_max_query_distance(dt.timedelta(days=4))
+    client.set_min_query_distance(dt.timedelta(days=1))
+    client.set_adaptive_split(True)
+    url = "https://ds.netztransparenz.de/api/v1/data/AusgewieseneABSM"
+    body = "Datum;Zeitzone;von;bis;Datenkategorie;Einheit;H1\n01.01.2025;UTC;13:00;13:15;ABSM;MW;1\n"
+    requests_mock.get(f"{url}/2025-01-01T00:00:00/2025-01-05T00:00:00", status_code=500)
+    requests_mock.get(f"{url}/2025-01-05T00:00:00/2025-01-09T00:00:00", status_code=500)
+    for day in (1, 3, 5, 7):
+        requests_mock.get(
+            f"{url}/2025-01-{day:02}T00:00:00/2025-01-{day + 2:02}T00:00:00", text=body
+        )
+    result = client.ausgewiesene_absm(dt.datetime(2025, 1, 1), dt.datetime(2025, 1, 9))
+    assert len(result) == 4
+    # the second timeframe was planned with 4 days, but is requested with the 2 days that worked
+    assert [
+        request.path.split("/")[-2][8:10]
+        for request in requests_mock.request_history[1:]
+    ] == ["01", "01", "03", "05", "07"]
+
+
+def test_adaptive_split_bisects_without_retrying(client, requests_mock, monkeypatch):
+    monkeypatch.setattr(time, "sleep", lambda seconds: None)
+    client.set_max_query_distance(dt.timedelta(days=4))
+    client.set_min_query_distance(dt.timedelta(days=1))
+    client.set_adaptive_split(True)
+    url = "https://ds.netztransparenz.de/api/v1/data/AusgewieseneABSM"
+    body = "Datum;Zeitzone;von;bis;Datenkategorie;Einheit;H1\n01.01.2025;UTC;13:00;13:15;ABSM;MW;1\n"
+    requests_mock.get(
+        f"{url}/2025-01-01T00:00:00/2025-01-05T00:00:00", exc=requests.ReadTimeout
+    )
+    requests_mock.get(f"{url}/2025-01-01T00:00:00/2025-01-03T00:00:00", status_code=503)
+    requests_mock.get(f"{url}/2025-01-03T00:00:00/2025-01-05T00:00:00", text=body)
+    requests_mock.get(f"{url}/2025-01-01T00:00:00/2025-01-02T00:00:00", text=body)
+    # timeframes that can not be split any further are retried
+    requests_mock.get(
+        f"{url}/2025-01-02T00:00:00/2025-01-03T00:00:00",
+        [{"status_code": 503}, {"text": body}],
+    )
+    result = client.ausgewiesene_absm(dt.datetime(2025, 1, 1), dt.datetime(2025, 1, 5))
+    assert len(result) == 3
+    requested = [
+        request.path.split("/")[-2][8:10] + "-" + request.path.split("/")[-1][8:10]
+        for request in requests_mock.request_history[1:]
+    ]
+    assert requested == ["01-05", "01-03", "01-02", "02-03", "02-03", "03-05"]
+
+
+def test_adaptive_split_bisects_broken_bodies(client, requests_mock):
+    client.set_max_query_distance(dt.timedelta(days=2))
+    client.set_min_query_distance(dt.timedelta(days=1))
+    client.set_adaptive_split(True)
+    url = "https://ds.netztransparenz.de/api/v1/data/AusgewieseneABSM"
+    body = "Datum;Zeitzone;von;bis;Datenkategorie;Einheit;H1\n01.01.2025;UTC;13:00;13:15;ABSM;MW;1\n"
+    requests_mock.get(
+        f"{url}/2025-01-01T00:00:00/2025-01-03T00:00:00", body=_BrokenBody()
+    )
+    requests_mock.get(f"{url}/2025-01-01T00:00:00/2025-01-02T00:00:00", text=body)
+    requests_mock.get(f"{url}/2025-01-02T00:00:00/2025-01-03T00:00:00", text=body)
+    result = client.ausgewiesene_absm(dt.datetime(2025, 1, 1), dt.datetime(2025, 1, 3))
+    assert len(result) == 2
+    assert requests_mock.call_count == 4  # login, the broken timeframe and its halves
+    assert client.retry_statistics.retries == 0
+
+
+def test_adaptive_split_grows_after_successes(client):
+    client.set_max_query_distance(dt.timedelta(days=4))
+    client.set_adaptive_split(True)
+    client._query_distances["redispatch"] = dt.timedelta(days=1)
+    for day in range(1, 5):
+        client._timeframe_succeeded(
+            "redispatch", dt.datetime(2025, 1, day), dt.datetime(2025, 1, day + 1)
+        )
+    assert client._query_distance("redispatch") == dt.timedelta(days=2)
+
+
+def test_adaptive_split_gives_up_at_min_query_distance(client, requests_mock):
+    client.set_max_query_distance(dt.timedelta(days=1))
+    client.set_min_query_distance(dt.timedelta(days=1))
+    client.set_adaptive_split(True)
+    requests_mock.get(
+        "https://ds.netztransparenz.de/api/v1/data/redispatch/2025-01-01T00:00:00/2025-01-02T00:00:00",
+        status_code=500,
+    )
+    with pytest.raises(requests.HTTPError):
+        client.redispatch(dt.datetime(2025, 1, 1), dt.datetime(2025, 1, 2))
+
+
+def test_retry_transient_errors(client, requests_mock, monkeypatch):
+    sleeps = []
+    monkeypatch.setattr(time, "sleep", sleeps.append)
+    client.set_retry_policy(
+        nt.RetryPolicy(max_attempts=4, backoff_base=1, backoff_cap=1.5)
+    )
+    requests_mock.get(
+        "https://ds.netztransparenz.de/api/v1/data/redispatch",
+        [
+            {"status_code": 503},
+            {"status_code": 429, "headers": {"Retry-After": "7"}},
+            {"exc": requests.ConnectionError},
+            {"text": "BEGINN_DATUM;GRUND_DER_MASSNAHME\n01.01.2024;Test"},
+        ],
+    )
+    result = client.redispatch()
+    assert result["GRUND_DER_MASSNAHME"].iloc[0] == "Test"
+    assert len(sleeps) == 3
+    assert sleeps[1] == 7
+    assert all(0 <= sleep <= 1.5 for sleep in (sleeps[0], sleeps[2]))
+    assert client.retry_statistics.requests == 1
+    assert client.retry_statistics.retries == 3
+    assert client.retry_statistics.reasons == {"503": 1, "429": 1, "ConnectionError": 1}
+
+
+def test_retry_broken_bodies(client, requests_mock, monkeypatch):
+    monkeypatch.setattr(time, "sleep", lambda seconds: None)
+    requests_mock.get(
+        "https://ds.netztransparenz.de/api/v1/data/redispatch",
+        [
+            {"body": _BrokenBody()},
+            {"text": "BEGINN_DATUM;GRUND_DER_MASSNAHME\n01.01.2024;Test"},
+        ],
+    )
+    result = client.redispatch()
+    assert result["GRUND_DER_MASSNAHME"].iloc[0] == "Test"
+    assert client.retry_statistics.requests == 1
+    assert client.retry_statistics.retries == 1
+    assert client.retry_statistics.reasons == {"ChunkedEncodingError": 1}
+
+
+def test_retry_gives_up_after_max_attempts(client, requests_mock, monkeypatch):
+    monkeypatch.setattr(time, "sleep", lambda seconds: None)
+    client.set_retry_policy(nt.RetryPolicy(max_attempts=3))
+    requests_mock.get(
+        "https://ds.netztransparenz.de/api/v1/data/redispatch", status_code=502
+    )
+    with pytest.raises(requests.HTTPError):
+        client.redispatch()
+    assert requests_mock.call_count == 4  # login and three attempts
+    assert client.retry_statistics.failures == 1
+
+
+def test_no_retry_for_other_errors(client, requests_mock):
+    requests_mock.get(
+        "https://ds.netztransparenz.de/api/v1/data/redispatch", status_code=404
+    )
+    with pytest.raises(requests.HTTPError):
+        client.redispatch()
+    assert client.retry_statistics.retries == 0
+
+
+def test_retry_after_http_date():
+    policy = nt.RetryPolicy()
+    in_ten_seconds = (dt.datetime.now(dt.UTC) + dt.timedelta(seconds=10)).strftime(
+        "%a, %d %b %Y %H:%M:%S GMT"
+    )
+    assert 8 < policy.delay(0, in_ten_seconds) <= 10
+    assert policy.delay(4, "1") is None
+
+
+def test_retry_after_is_capped():
+    assert nt.RetryPolicy().delay(0, "86400") == 300
+    assert nt.RetryPolicy(max_retry_after=60).delay(0, "86400") == 60
+    assert nt.RetryPolicy(max_retry_after=60).delay(0, "7") == 7
+
+
+def test_compressed_response_is_streamed_into_the_parser(
+    client, requests_mock, monkeypatch
+):
+    import gzip
+
+    from netztransparenz import base_client
+
+    rows = [f"2024-01-01;{hour:02d}:00;UTC;Grund {hour}" for hour in range(24)]
+    body = "\n".join(
+        ["BEGINN_DATUM;BEGINN_UHRZEIT;ZEITZONE_VON;GRUND_DER_MASSNAHME", *rows]
+    )
+    requests_mock.get(
+        "https://ds.netztransparenz.de/api/v1/data/redispatch/2024-01-01T00:00:00/2024-01-02T00:00:00",
+        content=gzip.compress(body.encode()),
+        headers={"Content-Encoding": "gzip"},
+    )
+    # chunks end within rows, the parser has to join them
+    monkeypatch.setattr(base_client, "_STREAM_CHUNK_SIZE", 7)
+    result = client.redispatch(dt.datetime(2024, 1, 1), dt.datetime(2024, 1, 2))
+    assert requests_mock.last_request.headers["Accept-Encoding"] == "gzip, deflate"
+    assert list(result["GRUND_DER_MASSNAHME"]) == [
+        f"Grund {hour}" for hour in range(24)
+    ]
+
+    pytest.importorskip("pyarrow")
+    client.set_csv_engine("pyarrow")
+    result = client.redispatch(dt.datetime(2024, 1, 1), dt.datetime(2024, 1, 2))
+    assert list(result["BEGINN_UHRZEIT"]) == [f"{hour:02d}:00" for hour in range(24)]
@@ -23,7 +23,8 @@ def client(token):
     secret = "PLACEHOLDER_SECRET"
     return nt.DienstleistungenClient(id, secret)
 
-def test_basic_read_systemleistungen(client, requests_mock):
+
+def test_read_endpoint_systemleistungen(client, requests_mock):
     body1 = """BEGINN_DATUM;BEGINN_UHRZEIT;ZEITZONE_VON;ENDE_DATUM;ENDE_UHRZEIT;ZEITZONE_BIS;DATA
 31.12.2020;23:00;UTC;01.01.2025;05:00;UTC;Test
 """
@@ -38,11 +39,17 @@ def test_basic_read_systemleistungen(client, requests_mock):
         f"{_API_BASE_URL}/data/redispatch/2024-01-01T00:00:00/2024-12-31T00:00:00",
         text=body2,
     )
-    result = client._basic_read_systemdienstleistungen("redispatch", dt.datetime(2023, 1, 1, tzinfo=dt.UTC), dt.datetime(2024, 12, 31), True)
+    result = client._read_endpoint(
+        "redispatch",
+        dt.datetime(2023, 1, 1, tzinfo=dt.UTC),
+        dt.datetime(2024, 12, 31),
+        True,
+    )
     assert result["DATA"].iloc[0] == "Test"
     assert result["DATA"].iloc[1] == "Test2"
 
-def test_basic_read_abregelung(client, requests_mock):
+
+def test_read_endpoint_abregelung(client, requests_mock):
     client.set_max_query_distance(dt.timedelta(days=1))
     body1 = """Datum;Zeitzone;von;bis;Datenkategorie;Einheit;Data
 30.09.2024;UTC;22:00;22:15;Test;Test;Test
@@ -58,7 +65,12 @@ def test_basic_read_abregelung(client, requests_mock):
         f"{_API_BASE_URL}/data/AusgewieseneABSM/2025-01-02T00:00:00/2025-01-03T00:00:00",
         text=body2,
     )
-    result = client._basic_read_abregelung("AusgewieseneABSM", dt.datetime(2025, 1, 1, tzinfo=dt.UTC), dt.datetime(2025, 1, 3), True)
+    result = client._read_endpoint(
+        "AusgewieseneABSM",
+        dt.datetime(2025, 1, 1, tzinfo=dt.UTC),
+        dt.datetime(2025, 1, 3),
+        True,
+    )
     assert result["Data"].iloc[0] == "Test"
     assert result["Data"].iloc[1] == "Test2"
 
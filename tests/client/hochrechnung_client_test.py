@@ -107,3 +107,112 @@ def test_prognose_wind(client, requests_mock):
     )
     result = client.prognose_wind(START, END, True)
     assert result["50Hertz (MW)"].iloc[0] == 5.442
+
+
+def test_pyarrow_csv_engine(client, requests_mock):
+    pytest.importorskip("pyarrow")
+    body = """Datum;von;Zeitzone von;bis;Zeitzone bis;50Hertz (MW);Amprion (MW);TenneT TSO (MW);TransnetBW (MW)
+2020-01-01;00:00;UTC;01:00;UTC;3.573,990;N.E.;1165,210;130
+2020-01-01;01:00;UTC;02:00;UTC;641,670;N.A.;526,230;131"""
+
+    requests_mock.get(
+        f"{_API_BASE_URL}/data/OnlineHochrechnung/Windonshore/2020-01-01T00:00:00/2020-02-01T00:00:00",
+        text=body,
+    )
+    expected = client.online_hochrechnung_windonshore(START, END, True)
+    client.set_csv_engine("pyarrow")
+    result = client.online_hochrechnung_windonshore(START, END, True)
+    pd.testing.assert_frame_equal(result, expected)
+    assert result["50Hertz (MW)"].iloc[0] == 3573.99
+    assert result["TransnetBW (MW)"].dtype == "float64"
+
+    client.set_arrow_dtypes(True)
+    result = client.online_hochrechnung_windonshore(START, END, True)
+    assert isinstance(result["50Hertz (MW)"].dtype, pd.ArrowDtype)
+    assert result["Amprion (MW)"].isna().all()
+    assert str(result.index[1]) == "2020-01-01 01:00:00+00:00"
+
+    with pytest.raises(ValueError):
+        client.set_csv_engine("python")
+
+
+def test_columns(client, requests_mock):
+    body = """Datum;von;Zeitzone von;bis;Zeitzone bis;50Hertz (MW);Amprion (MW);TenneT TSO (MW);TransnetBW (MW)
+2020-01-01;07:45;UTC;08:00;UTC;18,990;13,292;87,903;24,228"""
+
+    requests_mock.get(
+        f"{_API_BASE_URL}/data/hochrechnung/Solar/2020-01-01T00:00:00/2020-02-01T00:00:00",
+        text=body,
+    )
+    result = client.hochrechnung_solar(
+        START, END, True, columns=["Amprion (MW)", "bis"]
+    )
+    assert list(result.columns) == ["Amprion (MW)", "bis"]
+    assert str(result.index[0]) == "2020-01-01 07:45:00+00:00"
+    assert result["Amprion (MW)"].iloc[0] == 13.292
+
+    result = client.hochrechnung_solar(START, END, columns=["Datum", "50Hertz (MW)"])
+    assert list(result.columns) == ["Datum", "50Hertz (MW)"]
+
+    with pytest.raises(ValueError, match="Datum"):
+        client.hochrechnung_solar(START, END, True, columns=["Datum"])
+
+    pytest.importorskip("pyarrow")
+    client.set_csv_engine("pyarrow")
+    result = client.hochrechnung_solar(
+        START, END, True, columns=["Amprion (MW)", "bis"]
+    )
+    assert list(result.columns) == ["Amprion (MW)", "bis"]
+    assert result["Amprion (MW)"].iloc[0] == 13.292
+
+
+def test_backend(client, requests_mock):
+    pa = pytest.importorskip("pyarrow")
+    body = """Datum;von;Zeitzone von;bis;Zeitzone bis;50Hertz (MW);Amprion (MW);TenneT TSO (MW);TransnetBW (MW)
+2020-01-01;07:45;UTC;08:00;UTC;18,990;13,292;N.A.;24,228"""
+
+    requests_mock.get(
+        f"{_API_BASE_URL}/data/hochrechnung/Solar/2020-01-01T00:00:00/2020-02-01T00:00:00",
+        text=body,
+    )
+    result = client.hochrechnung_solar(START, END, True, backend="arrow")
+    assert isinstance(result, pa.Table)
+    assert result.column_names[:2] == ["von", "bis"]
+    assert str(result.schema.field("von").type) == "timestamp[us, tz=UTC]"
+    assert result["Amprion (MW)"][0].as_py() == 13.292
+    assert result["TenneT TSO (MW)"][0].as_py() is None
+
+    result = client.hochrechnung_solar(
+        START, END, True, columns=["bis", "Amprion (MW)"], backend="arrow"
+    )
+    assert result.column_names == ["bis", "Amprion (MW)"]
+
+    with pytest.raises(ValueError, match="backend"):
+        client.hochrechnung_solar(START, END, backend="numpy")
+
+    pytest.importorskip("polars")
+    client.set_backend("polars")
+    result = client.hochrechnung_solar(START, END, True)
+    assert type(result).__name__ == "DataFrame"
+    assert result["Amprion (MW)"][0] == 13.292
+    assert isinstance(
+        client.hochrechnung_solar(START, END, backend="pandas"), pd.DataFrame
+    )
+
+
+def test_long_timeframes_are_split(requests_mock):
+    client = nt.HochrechnungClient(
+        "PLACEHOLDER_ID", "PLACEHOLDER_SECRET", alignment="month"
+    )
+    header = "Datum;von;Zeitzone von;bis;Zeitzone bis;50Hertz (MW);Amprion (MW);TenneT TSO (MW);TransnetBW (MW)"
+    requests_mock.get(
+        f"{_API_BASE_URL}/data/hochrechnung/Solar/2020-01-01T00:00:00/2020-02-01T00:00:00",
+        text=f"{header}\n2020-01-01;07:45;UTC;08:00;UTC;1,0;2,0;3,0;4,0",
+    )
+    requests_mock.get(
+        f"{_API_BASE_URL}/data/hochrechnung/Solar/2020-02-01T00:00:00/2020-03-01T00:00:00",
+        text=f"{header}\n2020-02-01;07:45;UTC;08:00;UTC;5,0;6,0;7,0;8,0",
+    )
+    result = client.hochrechnung_solar(START, dt.datetime(2020, 3, 1), True)
+    assert requests_mock.call_count == 3
+    assert list(result["Amprion (MW)"]) == [2.0, 6.0]
@@ -22,7 +22,8 @@ def client(token):
     secret = "PLACEHOLDER_SECRET"
     return nt.NrvSaldoClient(id, secret)
 
-def test_basic_read_nrvsaldo(client, requests_mock):
+
+def test_read_endpoint_nrvsaldo(client, requests_mock):
     client.set_max_query_distance(dt.timedelta(days=1))
     body1 = """Datum;Zeitzone;von;bis;Data
 10.10.2020;UTC;13:00;13:15;Test
@@ -39,7 +40,12 @@ def test_basic_read_nrvsaldo(client, requests_mock):
         f"{_API_BASE_URL}/data/NrvSaldo/NRVSaldo/Betrieblich/2025-01-02T00:00:00/2025-01-03T00:00:00",
         text=body2,
     )
-    result = client._basic_read_nrvsaldo("NrvSaldo/NRVSaldo/Betrieblich", dt.datetime(2025, 1, 1, tzinfo=dt.UTC), dt.datetime(2025, 1, 3), True)
+    result = client._read_endpoint(
+        "NrvSaldo/NRVSaldo/Betrieblich",
+        dt.datetime(2025, 1, 1, tzinfo=dt.UTC),
+        dt.datetime(2025, 1, 3),
+        True,
+    )
     assert result["Data"].iloc[0] == "Test"
     assert result["Data"].iloc[1] == "Test2"
 
@@ -404,3 +410,47 @@ def test_nrvsaldo_voaa_qualitaetsgesichert(client, requests_mock):
     )
     result = client.nrvsaldo_voaa_qualitaetsgesichert(START, END, True)
     assert result["VoAA (Positiv)"].iloc[0] == 21.69
+
+
+def test_read_endpoint_nrvsaldo_parallel(client, requests_mock):
+    client.set_max_query_distance(dt.timedelta(days=1))
+    client.set_max_workers(3)
+    for day in range(1, 4):
+        requests_mock.get(
+            f"{_API_BASE_URL}/data/NrvSaldo/NRVSaldo/Betrieblich/2025-01-0{day}T00:00:00/2025-01-0{day + 1}T00:00:00",
+            text=f"Datum;Zeitzone;von;bis;Data\n0{day}.01.2025;UTC;13:00;13:15;{day}\n",
+        )
+    result = client._read_endpoint(
+        "NrvSaldo/NRVSaldo/Betrieblich",
+        dt.datetime(2025, 1, 1),
+        dt.datetime(2025, 1, 4),
+        True,
+    )
+    assert list(result["Data"]) == [1, 2, 3]
+
+
+def test_transform_dates_of_several_days(client, requests_mock):
+    body = """Datum;Zeitzone;von;bis;Data
+31.12.2023;UTC;23:45;00:00;1
+01.01.2024;UTC;00:00;00:15;2
+01.01.2024;UTC;00:15;00:30;3
+;UTC;00:15;00:30;4
+"""
+    requests_mock.get(
+        f"{_API_BASE_URL}/data/NrvSaldo/NRVSaldo/Betrieblich/2024-01-01T00:00:00/2024-01-02T00:00:00",
+        text=body,
+    )
+    result = client._read_endpoint(
+        "NrvSaldo/NRVSaldo/Betrieblich", START, dt.datetime(2024, 1, 2), True
+    )
+    assert [str(timestamp) for timestamp in result.index[:3]] == [
+        "2023-12-31 23:45:00+00:00",
+        "2024-01-01 00:00:00+00:00",
+        "2024-01-01 00:15:00+00:00",
+    ]
+    assert [str(timestamp) for timestamp in result["bis"].iloc[:3]] == [
+        "2024-01-01 00:00:00+00:00",
+        "2024-01-01 00:15:00+00:00",
+        "2024-01-01 00:30:00+00:00",
+    ]
+    assert str(result.index[3]) == "NaT"
@@ -0,0 +1,101 @@
+import datetime as dt
+
+import netztransparenz as nt
+from netztransparenz import coverage
+
+
+def day(number):
+    return dt.datetime(2024, 1, number, tzinfo=dt.UTC)
+
+
+def test_adjacent_and_overlapping_intervals_are_merged(tmp_path):
+    index = nt.CoverageIndex(tmp_path / "coverage.sqlite")
+    index.add("hochrechnung/Solar", day(1), day(3))
+    index.add("hochrechnung/Solar", day(5), day(7))
+    index.add("hochrechnung/Solar", day(3), day(4))
+    index.add("hochrechnung/Wind", day(4), day(5))
+    assert index.intervals("hochrechnung/Solar") == [(day(1), day(4)), (day(5), day(7))]
+    index.add("hochrechnung/Solar", day(2), day(6), digest="abc")
+    assert index.intervals("hochrechnung/Solar") == [(day(1), day(7))]
+    assert index.chunk("hochrechnung/Solar", day(2), day(6))[1] == "abc"
+    assert index.chunk("hochrechnung/Solar", day(2), day(5)) is None
+
+
+def test_missing(tmp_path):
+    index = nt.CoverageIndex(tmp_path / "coverage.sqlite")
+    index.add("hochrechnung/Solar", day(2), day(4))
+    index.add("hochrechnung/Solar", day(6), day(8))
+    assert index.missing("hochrechnung/Solar", day(1), day(10)) == [
+        (day(1), day(2)),
+        (day(4), day(6)),
+        (day(8), day(10)),
+    ]
+    assert index.missing("hochrechnung/Solar", day(3), day(7)) == [(day(4), day(6))]
+    assert index.missing("hochrechnung/Solar", day(6), day(7)) == []
+    assert index.missing("hochrechnung/Wind", day(3), day(7)) == [(day(3), day(7))]
+
+
+def test_remove_splits_intervals(tmp_path):
+    index = nt.CoverageIndex(tmp_path / "coverage.sqlite")
+    for number in range(1, 5):
+        index.add("hochrechnung/Solar", day(number), day(number + 1))
+    index.remove("hochrechnung/Solar", day(2), day(3))
+    assert index.intervals("hochrechnung/Solar") == [(day(1), day(2)), (day(3), day(5))]
+    assert index.chunk("hochrechnung/Solar", day(2), day(3)) is None
+    assert index.missing("hochrechnung/Solar", day(1), day(5)) == [(day(2), day(3))]
+
+
+def test_remove_keeps_what_other_chunks_cover(tmp_path):
+    index = nt.CoverageIndex(tmp_path / "coverage.sqlite")
+    index.add("hochrechnung/Solar", day(15), day(31))
+    index.add("hochrechnung/Solar", day(1), day(31))
+    index.add("hochrechnung/Solar", day(20), day(25))
+    index.remove("hochrechnung/Solar", day(15), day(31))
+    assert index.intervals("hochrechnung/Solar") == [(day(1), day(31))]
+    assert index.missing("hochrechnung/Solar", day(1), day(31)) == []
+    index.remove("hochrechnung/Solar", day(1), day(31))
+    assert index.intervals("hochrechnung/Solar") == [(day(20), day(25))]
+
+
+def test_stale_chunks_are_missing(tmp_path):
+    index = nt.CoverageIndex(tmp_path / "coverage.sqlite")
+    index.add("hochrechnung/Solar", day(1), day(3), fetched=100)
+    index.add("hochrechnung/Solar", day(2), day(5), fetched=200)
+    assert index.chunks("hochrechnung/Solar", day(3), day(4)) == [(day(2), day(5))]
+    assert index.chunks("hochrechnung/Solar", day(1), day(4)) == [
+        (day(1), day(3)),
+        (day(2), day(5)),
+    ]
+    assert index.missing("hochrechnung/Solar", day(1), day(6), fetched_after=150) == [
+        (day(1), day(2)),
+        (day(5), day(6)),
+    ]
+
+
+def test_chunks_are_searched_within_the_longest_timeframe(tmp_path):
+    index = nt.CoverageIndex(tmp_path / "coverage.sqlite")
+    with index._connect() as connection:
+        plan = connection.execute(
+            f"EXPLAIN QUERY PLAN {coverage._CHUNKS_QUERY}", ("", "", "", "", 0)
+        ).fetchall()
+    details = " ".join(row[-1] for row in plan)
+    # a range scan of the primary key, not every earlier chunk of the endpoint
+    assert "SEARCH chunks" in details
+    assert "start>? AND start<?" in details
+    assert "SCAN chunks" not in details
+
+    index.add("hochrechnung/Solar", day(1), day(20))
+    for number in range(1, 30):
+        index.add("hochrechnung/Solar", day(number), day(number + 1))
+    assert index.chunks("hochrechnung/Solar", day(19), day(20))[0] == (day(1), day(20))
+    assert index.chunks("hochrechnung/Solar", day(25), day(26)) == [(day(25), day(26))]
+    assert index.chunks("hochrechnung/Wind", day(1), day(2)) == []
+
+
+def test_longest_timeframes_of_older_indexes_are_recorded(tmp_path):
+    index = nt.CoverageIndex(tmp_path / "coverage.sqlite")
+    index.add("hochrechnung/Solar", day(1), day(10))
+    with index._connect() as connection:
+        connection.execute("DROP TABLE spans")
+    index = nt.CoverageIndex(tmp_path / "coverage.sqlite")
+    assert index.chunks("hochrechnung/Solar", day(8), day(9)) == [(day(1), day(10))]
@@ -0,0 +1,36 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+import netztransparenz as nt
+
+_SRC = os.path.abspath(os.path.join(os.path.dirname(__file__), "../src"))
+
+
+def test_import_does_not_load_dependencies():
+    script = """
+import sys
+import netztransparenz as nt
+client = nt.NetztransparenzClient("CLIENT_ID", "CLIENT_SECRET")
+nt.endpoints, nt.ChunkCache, nt.ParquetStore
+print(",".join(name for name in ("pandas", "numpy", "requests", "pyarrow", "polars", "aiohttp") if name in sys.modules))
+"""
+    result = subprocess.run(
+        [sys.executable, "-c", script],
+        capture_output=True,
+        text=True,
+        check=True,
+        env={**os.environ, "PYTHONPATH": _SRC},
+    )
+    assert result.stdout.strip() == ""
+
+
+def test_public_names():
+    assert set(nt.__all__) <= set(dir(nt))
+    for name in nt.__all__:
+        assert getattr(nt, name) is not None
+    assert nt.NetztransparenzClient.__module__ == "netztransparenz.client"
+    with pytest.raises(AttributeError, match="NotAClient"):
+        _ = nt.NotAClient
@@ -0,0 +1,174 @@
+import datetime as dt
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import netztransparenz as nt
+from netztransparenz import memory_cache
+
+_TOKEN_URL = "https://identity.netztransparenz.de/users/connect/token"
+_SPOT_URL = "https://ds.netztransparenz.de/api/v1/data/Spotmarktpreise/2024-01-01T00:00:00/2024-01-02T00:00:00"
+BODY = """Datum;von;Zeitzone von;bis;Zeitzone bis;Spotmarktpreis in ct/kWh
+01.01.2024;00:00;UTC;01:00;UTC;0,010
+01.01.2024;01:00;UTC;02:00;UTC;-0,010"""
+
+
+@pytest.fixture
+def client(requests_mock):
+    requests_mock.post(_TOKEN_URL, json={"access_token": "placeholder_token"})
+    requests_mock.get(_SPOT_URL, text=BODY)
+    return nt.NetztransparenzClient(
+        "PLACEHOLDER_ID", "PLACEHOLDER_SECRET", memory_cache=nt.MemoryCache()
+    )
+
+
+def frame(rows):
+    return pd.DataFrame({"value": range(rows)})
+
+
+def test_repeated_query_is_served_from_memory(client, requests_mock):
+    first = client.spotmarktpreise(
+        dt.datetime(2024, 1, 1), dt.datetime(2024, 1, 2), True
+    )
+    second = client.spotmarktpreise(
+        dt.datetime(2024, 1, 1, tzinfo=dt.UTC), dt.datetime(2024, 1, 2), True
+    )
+    assert requests_mock.call_count == 2  # login and one request
+    assert second.equals(first)
+    assert client.memory_cache.hits == 1
+
+    client.spotmarktpreise(dt.datetime(2024, 1, 1), dt.datetime(2024, 1, 2), False)
+    assert requests_mock.call_count == 3
+
+
+def test_modifying_a_result_does_not_change_the_cache(client):
+    client.spotmarktpreise(dt.datetime(2024, 1, 1), dt.datetime(2024, 1, 2), True)
+    result = client.spotmarktpreise(
+        dt.datetime(2024, 1, 1), dt.datetime(2024, 1, 2), True
+    )
+    if memory_cache._copy_on_write():
+        result.iloc[0, 1] = 100
+    else:
+        with pytest.raises(ValueError, match="read-only"):
+            result.iloc[0, 1] = 100
+    result["new"] = 1
+    result["Spotmarktpreis in ct/kWh"] = 0.0
+    result.index.name = "changed"
+    cached = client.spotmarktpreise(
+        dt.datetime(2024, 1, 1), dt.datetime(2024, 1, 2), True
+    )
+    assert cached["Spotmarktpreis in ct/kWh"].iloc[0] == 0.01
+    assert "new" not in cached.columns
+    assert cached.index.name != "changed"
+
+
+def test_results_share_the_cached_data(monkeypatch):
+    # pandas 3 always copies on write, so the pandas 2 path is also checked with copy-on-write disabled
+    for copy_on_write in (True, False):
+        monkeypatch.setattr(
+            memory_cache, "_copy_on_write", lambda enabled=copy_on_write: enabled
+        )
+        cache = nt.MemoryCache()
+        cache.put("a", frame(10))
+        assert np.shares_memory(
+            cache.get("a")["value"].to_numpy(), cache.get("a")["value"].to_numpy()
+        )
+
+
+def test_extension_columns_of_results_are_not_shared_in_place():
+    df = pd.DataFrame(
+        {
+            "float": [1.0, 2.0],
+            "integer": pd.array([1, 2], dtype="Int64"),
+            "category": pd.Categorical(["a", "b"]),
+            "date": pd.date_range("2024-01-01", periods=2, tz="UTC"),
+        }
+    )
+    try:
+        df["arrow"] = pd.array([1.0, 2.0], dtype="float64[pyarrow]")
+    except ImportError:
+        pass
+    cache = nt.MemoryCache()
+    cache.put("a", df)
+    result = cache.get("a")
+    for position, value in enumerate(
+        [5.0, 5, "a", pd.Timestamp("2025-01-01", tz="UTC"), 5.0][: len(df.columns)]
+    ):
+        # only numpy columns are read-only, the other columns are copied
+        if memory_cache._copy_on_write() or position >= 1:
+            result.iloc[1, position] = value
+        else:
+            with pytest.raises(ValueError, match="read-only"):
+                result.iloc[1, position] = value
+    assert cache.get("a").equals(df)
+
+
+def test_copy_on_write_is_detected_by_the_pandas_version(monkeypatch):
+    # the read-only fallback is only used on pandas 2 with copy-on-write disabled
+    monkeypatch.setattr(pd, "get_option", lambda key: False)
+    monkeypatch.setattr(pd, "__version__", "3.0.0")
+    assert memory_cache._copy_on_write()
+    monkeypatch.setattr(pd, "__version__", "2.3.3")
+    assert not memory_cache._copy_on_write()
+
+
+def test_cached_columns_are_read_only_without_copy_on_write(monkeypatch):
+    monkeypatch.setattr(memory_cache, "_copy_on_write", lambda: False)
+    df = pd.DataFrame(
+        [[1.0, 2, True], [3.0, 4, False]], columns=["value", "value", "valid"]
+    )
+    cache = nt.MemoryCache()
+    cache.put("a", df)
+    df.iloc[0, 0] = 100.0
+    result = cache.get("a")
+    assert list(result.columns) == ["value", "value", "valid"]
+    assert result.iloc[0, 0] == 1.0
+    for position in range(3):
+        values = result.iloc[:, position].to_numpy()
+        assert not values.flags.writeable
+        assert np.shares_memory(values, cache.get("a").iloc[:, position].to_numpy())
+
+
+def test_queries_reaching_into_today_are_not_cached(client):
+    today = dt.datetime.now(dt.UTC).replace(
+        tzinfo=None, hour=0, minute=0, second=0, microsecond=0
+    )
+    assert (
+        client._memory_key(
+            "Spotmarktpreise", today - dt.timedelta(days=1), today, False, None
+        )
+        is not None
+    )
+    assert (
+        client._memory_key(
+            "Spotmarktpreise", today, today + dt.timedelta(days=1), False, None
+        )
+        is None
+    )
+    assert client._memory_key("Spotmarktpreise", None, None, False, None) is None
+    client.set_memory_cache(nt.MemoryCache(ttl=dt.timedelta(minutes=5)))
+    assert client._memory_key("Spotmarktpreise", None, None, False, None) is not None
+
+
+def test_eviction_by_memory_usage():
+    size = int(frame(1000).memory_usage(deep=True, index=True).sum())
+    cache = nt.MemoryCache(max_bytes=int(size * 2.5))
+    for key in "abc":
+        cache.put(key, frame(1000))
+    assert len(cache) == 2
+    assert cache.size == 2 * size
+    assert cache.get("a") is None
+    cache.get("b")
+    cache.put("d", frame(1000))
+    assert cache.get("b") is not None
+    assert cache.get("c") is None
+    cache.put("huge", frame(10000))
+    assert cache.get("huge") is None
+
+
+def test_expired_entries_are_removed():
+    cache = nt.MemoryCache(ttl=dt.timedelta(0))
+    cache.put("a", frame(10))
+    assert cache.get("a") is None
+    assert cache.size == 0
@@ -0,0 +1,103 @@
+import datetime as dt
+import re
+
+import pytest
+
+import netztransparenz as nt
+
+pytest.importorskip("pyarrow")
+
+_TOKEN_URL = "https://identity.netztransparenz.de/users/connect/token"
+_ABSM_URL = re.compile(r"https://ds.netztransparenz.de/api/v1/data/AusgewieseneABSM/.*")
+HEADER = "Datum;Zeitzone;von;bis;Datenkategorie;Einheit;H1;H2;T1;T2;T3;T4;T5;T6"
+
+
+def absm_response(request, context):
+    # one row on the 1st and one on the 15th of every requested month
+    start, end = (
+        dt.datetime.fromisoformat(part) for part in request.path.split("/")[-2:]
+    )
+    rows = [
+        f"{day:%d.%m.%Y};UTC;12:00;12:15;ausgewiesene Abregelungsstrommenge;MW;{day.day},0;0;0;0;0;0;0;0"
+        for day in (start.replace(day=1, hour=12), start.replace(day=15, hour=12))
+        if start <= day < end
+    ]
+    return "\n".join([HEADER, *rows])
+
+
+@pytest.fixture
+def mirror(tmp_path):
+    return nt.Mirror(tmp_path / "mirror")
+
+
+@pytest.fixture
+def client(mirror, requests_mock):
+    requests_mock.post(_TOKEN_URL, json={"access_token": "placeholder_token"})
+    requests_mock.get(_ABSM_URL, text=absm_response)
+    return nt.NetztransparenzClient(
+        "PLACEHOLDER_ID", "PLACEHOLDER_SECRET", mirror=mirror
+    )
+
+
+def data_requests(requests_mock):
+    return [
+        request for request in requests_mock.request_history if request.method == "GET"
+    ]
+
+
+def test_update_mirror_resumes(client, mirror, requests_mock):
+    assert (
+        client.update_mirror(
+            endpoints=["AusgewieseneABSM"], until=dt.datetime(2024, 11, 15)
+        )
+        == 3
+    )
+    assert mirror.path("AusgewieseneABSM", dt.datetime(2024, 10, 1)).exists()
+    assert mirror.complete("AusgewieseneABSM", dt.datetime(2024, 9, 1))
+    assert len(mirror.read("AusgewieseneABSM", dt.datetime(2024, 10, 1))) == 2
+
+    requests_mock.reset_mock()
+    assert (
+        client.update_mirror(
+            endpoints=["AusgewieseneABSM"], until=dt.datetime(2025, 1, 15)
+        )
+        == 2
+    )
+    assert [
+        request.path.split("/")[-2] for request in data_requests(requests_mock)
+    ] == [
+        "2024-12-01t00:00:00",
+        "2025-01-01t00:00:00",
+    ]
+
+
+def test_recent_months_are_not_complete(client, mirror):
+    now = dt.datetime.now(dt.UTC).replace(tzinfo=None)
+    client.update_mirror(endpoints=["AusgewieseneABSM"])
+    this_month = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+    assert mirror.path("AusgewieseneABSM", this_month).exists()
+    assert not mirror.complete("AusgewieseneABSM", this_month)
+
+
+def test_readers_serve_complete_months_from_mirror(client, mirror, requests_mock):
+    client.update_mirror(
+        endpoints=["AusgewieseneABSM"], until=dt.datetime(2024, 11, 15)
+    )
+    requests_mock.reset_mock()
+    result = client.ausgewiesene_absm(
+        dt.datetime(2024, 10, 10), dt.datetime(2024, 12, 10), True
+    )
+    assert list(result["H1"]) == [15.0, 1.0, 15.0, 1.0]
+    # only December is requested, October and November come from the mirror
+    assert [
+        request.path.split("/")[-2] for request in data_requests(requests_mock)
+    ] == ["2024-12-01t00:00:00"]
+
+    requests_mock.reset_mock()
+    client.ausgewiesene_absm(dt.datetime(2024, 10, 1), dt.datetime(2024, 11, 1), False)
+    assert len(data_requests(requests_mock)) == 1
+
+
+def test_update_mirror_unknown_endpoint(client):
+    with pytest.raises(ValueError):
+        client.update_mirror(endpoints=["marktpraemie"])
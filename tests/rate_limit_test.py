@@ -0,0 +1,75 @@
+import threading
+import time
+
+import pytest
+
+import netztransparenz as nt
+
+
+def test_burst_then_rate():
+    limiter = nt.RateLimiter(rate=10, burst=2)
+    waits = [limiter.reserve("PLACEHOLDER_ID") for _ in range(4)]
+    assert waits[:2] == [0, 0]
+    assert waits[2] == pytest.approx(0.1, abs=0.02)
+    assert waits[3] == pytest.approx(0.2, abs=0.02)
+
+
+def test_bucket_refills():
+    limiter = nt.RateLimiter(rate=50, burst=1)
+    assert limiter.reserve("PLACEHOLDER_ID") == 0
+    time.sleep(0.05)
+    assert limiter.reserve("PLACEHOLDER_ID") == 0
+
+
+def test_invalid_parameters():
+    with pytest.raises(ValueError):
+        nt.RateLimiter(rate=0)
+    with pytest.raises(ValueError):
+        nt.RateLimiter(rate=1, burst=0)
+
+
+def test_threads_share_budget():
+    limiter = nt.RateLimiter(rate=100, burst=5)
+    waits = []
+    lock = threading.Lock()
+
+    def reserve():
+        wait = limiter.reserve("PLACEHOLDER_ID")
+        with lock:
+            waits.append(wait)
+
+    threads = [threading.Thread(target=reserve) for _ in range(20)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert sum(wait == 0 for wait in waits) == 5
+    assert max(waits) == pytest.approx(0.15, abs=0.03)
+
+
+def test_file_limiters_share_budget_per_client_id(tmp_path):
+    first = nt.FileRateLimiter(rate=10, burst=2, directory=tmp_path)
+    second = nt.FileRateLimiter(rate=10, burst=2, directory=tmp_path)
+    assert first.reserve("PLACEHOLDER_ID") == 0
+    assert second.reserve("PLACEHOLDER_ID") == 0
+    assert first.reserve("PLACEHOLDER_ID") == pytest.approx(0.1, abs=0.02)
+    assert second.reserve("OTHER_ID") == 0
+
+
+def test_client_waits_for_rate_limiter(requests_mock, monkeypatch):
+    sleeps = []
+    monkeypatch.setattr(time, "sleep", sleeps.append)
+    requests_mock.post(
+        "https://identity.netztransparenz.de/users/connect/token",
+        json={"access_token": "placeholder_token"},
+    )
+    requests_mock.get("https://ds.netztransparenz.de/api/v1/health", text="OK")
+    client = nt.NetztransparenzClient(
+        "PLACEHOLDER_ID",
+        "PLACEHOLDER_SECRET",
+        rate_limiter=nt.RateLimiter(rate=1, burst=1),
+    )
+    client.check_health()
+    client.check_health()
+    assert len(sleeps) == 1
+    assert sleeps[0] == pytest.approx(1, abs=0.05)
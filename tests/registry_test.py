@@ -0,0 +1,47 @@
+import ast
+import datetime as dt
+import inspect
+import textwrap
+
+import netztransparenz as nt
+from netztransparenz import parsing
+from netztransparenz.constants import endpoints
+from netztransparenz.registry import endpoint, layouts
+
+
+def test_endpoint():
+    solar = endpoint("hochrechnung/Solar")
+    assert solar.first_data == dt.datetime(2011, 3, 31, 22)
+    assert solar.layout is layouts["nt"]
+    assert solar.layout.thousands == "."
+    assert solar.schema.columns[:2] == ("Datum", "von")
+    assert solar.url("https://base") is None
+
+    marktpraemie = endpoint("marktpraemie")
+    assert (
+        marktpraemie.url(
+            "https://base", begin=dt.date(2020, 1, 1), end=dt.date(2020, 3, 1)
+        )
+        == "https://base/data/marktpraemie/1/2020/3/2020"
+    )
+    assert (
+        endpoint("NrvSaldo/SrlMolAbweichungen/Betrieblich").layout.transform
+        is parsing.transform_srl_mol_abweichungen
+    )
+
+
+def test_every_reader_reads_its_endpoint():
+    for url, metadata in endpoints.items():
+        assert endpoint(url[1:]).layout in layouts.values()
+        if "reader" not in metadata:
+            continue
+        source = inspect.getsource(
+            getattr(nt.NetztransparenzClient, metadata["reader"])
+        )
+        call = next(
+            node
+            for node in ast.walk(ast.parse(textwrap.dedent(source)))
+            if isinstance(node, ast.Call)
+            and getattr(node.func, "attr", None) == "_read_endpoint"
+        )
+        assert call.args[0].value == url[1:]
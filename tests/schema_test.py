@@ -0,0 +1,92 @@
+import datetime as dt
+import re
+
+import pandas as pd
+import pytest
+
+import netztransparenz as nt
+from netztransparenz.schema import apply, schema
+
+_TOKEN_URL = "https://identity.netztransparenz.de/users/connect/token"
+_NRVSALDO_URL = re.compile(
+    r"https://ds.netztransparenz.de/api/v1/data/NrvSaldo/NRVSaldo/Betrieblich/.*"
+)
+NRVSALDO_HEADER = "Datum;Zeitzone;von;bis;Datenkategorie;Datentyp;Einheit;Deutschland"
+
+
+def nrvsaldo_response(request, context):
+    start = dt.datetime.fromisoformat(request.path.split("/")[-2])
+    return f"{NRVSALDO_HEADER}\n{start:%d.%m.%Y};UTC;00:00;00:15;NRV-Saldo;{start.day};MW;{start.day},5"
+
+
+@pytest.fixture
+def client(requests_mock):
+    requests_mock.post(_TOKEN_URL, json={"access_token": "placeholder_token"})
+    requests_mock.get(_NRVSALDO_URL, text=nrvsaldo_response)
+    return nt.NetztransparenzClient(
+        "PLACEHOLDER_ID", "PLACEHOLDER_SECRET", max_query_distance=dt.timedelta(days=1)
+    )
+
+
+def test_schema():
+    nrvsaldo = schema("NrvSaldo/NRVSaldo/Betrieblich")
+    assert nrvsaldo.columns[:4] == ("Datum", "Zeitzone", "von", "bis")
+    assert {
+        column: nrvsaldo.kinds[column] for column in NRVSALDO_HEADER.split(";")
+    } == {
+        "Datum": "string",
+        "Zeitzone": "category",
+        "von": "string",
+        "bis": "string",
+        "Datenkategorie": "category",
+        "Datentyp": "category",
+        "Einheit": "category",
+        "Deutschland": "float",
+    }
+    assert nrvsaldo.dtypes(float32=True)["Deutschland"] == "float32"
+    assert schema("hochrechnung/Solar").kinds["TenneT TSO (MW)"] == "float"
+    assert "JW" not in schema("Jahresmarktpraemie").kinds
+
+
+def test_readers_use_schema(client):
+    result = client.nrvsaldo_nrvsaldo_betrieblich(
+        dt.datetime(2024, 1, 1), dt.datetime(2024, 1, 4), True
+    )
+    # every day is parsed on its own, the categories are kept when the days are concatenated
+    assert isinstance(result["Datentyp"].dtype, pd.CategoricalDtype)
+    assert list(result["Datentyp"]) == ["1", "2", "3"]
+    assert result["Deutschland"].dtype == "float64"
+
+    client.set_float32(True)
+    raw = client.nrvsaldo_nrvsaldo_betrieblich(
+        dt.datetime(2024, 1, 1), dt.datetime(2024, 1, 2)
+    )
+    assert raw["Deutschland"].dtype == "float32"
+    assert isinstance(raw["Zeitzone"].dtype, pd.CategoricalDtype)
+
+
+def test_apply():
+    df = pd.DataFrame(
+        {"Einheit": ["MW", "MW"], "Deutschland": [1.5, 2.5], "Sonstiges": ["a", "b"]}
+    )
+    result = apply(df, "NrvSaldo/NRVSaldo/Betrieblich", float32=True)
+    assert isinstance(result["Einheit"].dtype, pd.CategoricalDtype)
+    assert result["Deutschland"].dtype == "float32"
+    assert result["Sonstiges"].dtype == df["Sonstiges"].dtype
+
+
+def test_unexpected_tokens_in_float_columns():
+    from netztransparenz import parsing
+
+    body = "Datum;Zeitzone;Deutschland;Einheit\n01.01.2024;UTC;1.234,5;MW\n01.01.2024;UTC;N.E.;MW\n01.01.2024;UTC;2,5;MW\n"
+    dtypes = {"Deutschland": "float32", "Einheit": "category"}
+    for engine in parsing.CSV_ENGINES:
+        df = parsing.read_csv(body.encode(), ["N.A."], engine=engine, dtypes=dtypes)
+        assert df["Deutschland"].dtype == "float32"
+        assert list(df["Deutschland"].fillna(-1)) == [1234.5, -1, 2.5]
+    table = parsing.read_arrow(body.encode(), ["N.A."], dtypes=dtypes)
+    assert table["Deutschland"].to_pylist() == [1234.5, None, 2.5]
+    cached = pd.DataFrame({"Deutschland": ["1,5", "N.E."]})
+    assert list(
+        apply(cached, "NrvSaldo/NRVSaldo/Betrieblich")["Deutschland"].fillna(-1)
+    ) == [1.5, -1]
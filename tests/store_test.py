@@ -0,0 +1,150 @@
+import datetime as dt
+import re
+
+import pandas as pd
+import pytest
+
+import netztransparenz as nt
+
+_TOKEN_URL = "https://identity.netztransparenz.de/users/connect/token"
+_NRVSALDO_URL = re.compile(
+    r"https://ds.netztransparenz.de/api/v1/data/NrvSaldo/NRVSaldo/Betrieblich/.*"
+)
+HEADER = "Datum;Zeitzone;von;bis;Datenkategorie;Datentyp;Einheit;Deutschland"
+
+
+class FakeApi:
+    """Answers NrvSaldo requests with one row per quarter hour, the value can be revised."""
+
+    def __init__(self):
+        self.value = "1,0"
+        self.timeframes = []
+
+    def __call__(self, request, context):
+        start, end = (
+            dt.datetime.fromisoformat(part) for part in request.path.split("/")[-2:]
+        )
+        self.timeframes.append((start, end))
+        rows = []
+        while start < end:
+            rows.append(
+                f"{start:%d.%m.%Y};UTC;{start:%H:%M};{start + dt.timedelta(minutes=15):%H:%M};NRV-Saldo;Betrieblich;MW;{self.value}"
+            )
+            start += dt.timedelta(minutes=15)
+        return "\n".join([HEADER, *rows])
+
+
+@pytest.fixture
+def api(requests_mock):
+    api = FakeApi()
+    requests_mock.post(_TOKEN_URL, json={"access_token": "placeholder_token"})
+    requests_mock.get(_NRVSALDO_URL, text=api)
+    return api
+
+
+@pytest.fixture
+def client(api):
+    return nt.NetztransparenzClient("PLACEHOLDER_ID", "PLACEHOLDER_SECRET")
+
+
+def test_sync_requests_only_the_tail(client, api):
+    store = {}
+    now = dt.datetime.now(dt.UTC).replace(tzinfo=None, second=0, microsecond=0)
+    start = now.replace(minute=0) - dt.timedelta(days=1)
+    first = client.sync("NrvSaldo/NRVSaldo/Betrieblich", store, start=start)
+    assert len(first) == len(store["NrvSaldo/NRVSaldo/Betrieblich"]) > 90
+    assert api.timeframes[0][0] == start
+
+    api.value = "2,0"
+    second = client.sync(
+        "NrvSaldo/NRVSaldo/Betrieblich", store, overlap=dt.timedelta(hours=1)
+    )
+    last = (
+        store["NrvSaldo/NRVSaldo/Betrieblich"]
+        .index.max()
+        .to_pydatetime()
+        .replace(tzinfo=None)
+    )
+    assert api.timeframes[1][0] == (last - dt.timedelta(hours=1)).replace(minute=0)
+    assert len(second) <= 12
+
+    result = store["NrvSaldo/NRVSaldo/Betrieblich"]
+    # the overlap replaced the old rows instead of duplicating them
+    assert result.index.is_unique
+    assert len(result) == len(first)
+    assert list(result["Deutschland"].iloc[-len(second) :]) == [2.0] * len(second)
+    assert result["Deutschland"].iloc[0] == 1.0
+
+
+def test_sync_normalises_the_endpoint(client, api):
+    store = {}
+    start = dt.datetime.now(dt.UTC).replace(
+        tzinfo=None, minute=0, second=0, microsecond=0
+    )
+    client.sync(
+        "/NrvSaldo/NRVSaldo/Betrieblich/", store, start=start - dt.timedelta(hours=2)
+    )
+    client.sync("/NrvSaldo/NRVSaldo/Betrieblich/", store)
+    assert list(store) == ["NrvSaldo/NRVSaldo/Betrieblich"]
+    assert len(api.timeframes) == 2
+
+
+def test_sync_unknown_endpoint(client):
+    with pytest.raises(ValueError):
+        client.sync("marktpraemie", {})
+
+
+def test_stream(client, api):
+    stream = client.stream(
+        "NrvSaldo/NRVSaldo/Betrieblich",
+        dt.datetime(2025, 1, 1),
+        dt.datetime(2025, 1, 1, 3),
+        chunk=dt.timedelta(hours=1),
+    )
+    first = next(stream)
+    assert list(first.index.hour) == [0, 0, 0, 0]
+    # the next chunk is requested in the background while the first one is processed
+    assert len(api.timeframes) <= 2
+    rest = list(stream)
+    assert [list(df.index.hour) for df in rest] == [[1] * 4, [2] * 4]
+    assert api.timeframes == [
+        (dt.datetime(2025, 1, 1, hour), dt.datetime(2025, 1, 1, hour + 1))
+        for hour in range(3)
+    ]
+
+    chunks = list(
+        client.stream(
+            "NrvSaldo/NRVSaldo/Betrieblich",
+            dt.datetime(2024, 12, 31, 23),
+            dt.datetime(2025, 1, 1, 1),
+            "day",
+            False,
+            read_ahead=0,
+        )
+    )
+    assert [list(df["von"]) for df in chunks] == [
+        ["23:00", "23:15", "23:30", "23:45"],
+        ["00:00", "00:15", "00:30", "00:45"],
+    ]
+
+    with pytest.raises(ValueError):
+        next(client.stream("marktpraemie"))
+    with pytest.raises(ValueError):
+        next(client.stream("NrvSaldo/NRVSaldo/Betrieblich", chunk="week"))
+
+
+def test_parquet_store(tmp_path):
+    pytest.importorskip("pyarrow")
+    store = nt.ParquetStore(tmp_path)
+    df = pd.DataFrame(
+        {"Deutschland": [1.5]},
+        index=pd.DatetimeIndex(["2024-01-01 00:00"], tz="UTC", name="von"),
+    )
+    assert "NrvSaldo/NRVSaldo/Betrieblich" not in store
+    store["NrvSaldo/NRVSaldo/Betrieblich"] = df
+    assert store["NrvSaldo/NRVSaldo/Betrieblich"].equals(df)
+    assert list(store) == ["NrvSaldo/NRVSaldo/Betrieblich"]
+    store["NrvSaldo/NRVSaldo/Betrieblich"] = df.assign(Einheit="MW")
+    assert store.read("NrvSaldo/NRVSaldo/Betrieblich", ["Deutschland"]).equals(df)
+    del store["NrvSaldo/NRVSaldo/Betrieblich"]
+    assert len(store) == 0
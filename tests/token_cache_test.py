@@ -0,0 +1,71 @@
+import os
+import stat
+import time
+
+import pytest
+
+import netztransparenz as nt
+
+_TOKEN_URL = "https://identity.netztransparenz.de/users/connect/token"
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return nt.FileTokenCache(tmp_path / "tokens")
+
+
+def test_store_and_load(cache):
+    assert cache.load("PLACEHOLDER_ID") is None
+    cache.store("PLACEHOLDER_ID", "token", 1234.5)
+    assert cache.load("PLACEHOLDER_ID") == ("token", 1234.5)
+    assert cache.load("OTHER_ID") is None
+    cache.clear("PLACEHOLDER_ID")
+    assert cache.load("PLACEHOLDER_ID") is None
+
+
+def test_files_only_readable_by_owner(cache):
+    if os.name == "nt":
+        pytest.skip("POSIX permissions")
+    cache.store("PLACEHOLDER_ID", "token", None)
+    files = [path for path in cache.directory.iterdir() if path.suffix == ".json"]
+    assert len(files) == 1
+    assert "PLACEHOLDER_ID" not in files[0].name
+    assert stat.S_IMODE(files[0].stat().st_mode) == 0o600
+    assert stat.S_IMODE(cache.directory.stat().st_mode) == 0o700
+
+
+def test_clients_share_cached_token(cache, requests_mock):
+    requests_mock.post(_TOKEN_URL, json={"access_token": "shared", "expires_in": 3600})
+    first = nt.NetztransparenzClient(
+        "PLACEHOLDER_ID", "PLACEHOLDER_SECRET", token_cache=cache
+    )
+    second = nt.NetztransparenzClient(
+        "PLACEHOLDER_ID", "PLACEHOLDER_SECRET", token_cache=cache
+    )
+    assert first.token == "shared"
+    assert second.token == "shared"
+    assert requests_mock.call_count == 1
+
+
+def test_expired_cached_token_is_replaced(cache, requests_mock):
+    cache.store("PLACEHOLDER_ID", "expired", time.time() - 10)
+    requests_mock.post(_TOKEN_URL, json={"access_token": "fresh", "expires_in": 3600})
+    client = nt.NetztransparenzClient(
+        "PLACEHOLDER_ID", "PLACEHOLDER_SECRET", token_cache=cache
+    )
+    assert client.token == "fresh"
+    assert cache.load("PLACEHOLDER_ID")[0] == "fresh"
+
+
+def test_rejected_cached_token_is_replaced(cache, requests_mock):
+    cache.store("PLACEHOLDER_ID", "revoked", time.time() + 3600)
+    requests_mock.post(_TOKEN_URL, json={"access_token": "fresh", "expires_in": 3600})
+    requests_mock.get(
+        "https://ds.netztransparenz.de/api/v1/health",
+        [{"status_code": 401}, {"text": '"OK"'}],
+    )
+    client = nt.NetztransparenzClient(
+        "PLACEHOLDER_ID", "PLACEHOLDER_SECRET", token_cache=cache
+    )
+    assert client.check_health() == '"OK"'
+    assert cache.load("PLACEHOLDER_ID")[0] == "fresh"